@@ -11,7 +11,10 @@ import os
 import sys
 import os.path as osp
 
-from subprocess import call
+from subprocess import (
+    call,
+    check_output,
+)
 
 from datalad.runner import (
     Runner,
@@ -51,6 +54,24 @@ class startup(SuprocBenchmarks):
     def time_import_api(self):
         call([sys.executable, "-c", "import datalad.api"])
 
+    def track_import_subprocesses(self):
+        # a bare import should not pay for running any subprocess
+        if not hasattr(sys, 'addaudithook'):
+            # no audit hooks before Python 3.8, no measurement
+            return float('nan')
+        out = check_output([
+            sys.executable, "-c",
+            "import sys\n"
+            "spawned = []\n"
+            "sys.addaudithook(lambda e, a: spawned.append(e) "
+            "if e in ('subprocess.Popen', 'os.posix_spawn', 'os.fork') "
+            "else None)\n"
+            "import datalad\n"
+            "print(len(spawned))"])
+        return int(out)
+
+    track_import_subprocesses.unit = "subprocesses"
+
 
 class witlessrunner(SuprocBenchmarks):
     """Some rudimentary tests to see if there is no major slowdowns of Runner
@@ -68,3 +89,15 @@ class witlessrunner(SuprocBenchmarks):
 
     def time_echo_gitrunner_fullcapture(self):
         self.git_runner.run(["echo"], protocol=StdOutErrCapture)
+
+
+class witlessrunner_asyncio(witlessrunner):
+    """Same as witlessrunner, but with the event loop based runner backend
+    """
+
+    def setup(self):
+        os.environ['DATALAD_RUNNER_BACKEND'] = 'asyncio'
+        super().setup()
+
+    def teardown(self):
+        os.environ.pop('DATALAD_RUNNER_BACKEND', None)
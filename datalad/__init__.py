@@ -21,6 +21,7 @@ if not __debug__:
 
 import atexit
 import os
+import threading
 
 # this is not to be modified. for querying use get_apimode()
 __api = 'python'
@@ -55,6 +56,13 @@ def in_librarymode():
     -------
     bool
     """
+    global __runtime_mode
+    if __runtime_mode is None:
+        # by default, we are in application-mode, simply because most of
+        # datalad was originally implemented with this scenario assumption
+        __runtime_mode = 'library' \
+            if cfg.getbool('datalad.runtime', 'librarymode', False) \
+            else 'application'
     return __runtime_mode == 'library'
 
 
@@ -102,22 +110,100 @@ try:
 except ImportError as e:
     pass
 
-# Other imports are interspersed with lgr.debug to ease troubleshooting startup
-# delays etc.
+# this is not to be modified. see enable/in_librarymode()
+# determined from the configuration on first query
+__runtime_mode = None
 
-from .config import ConfigManager
 
-cfg = ConfigManager()
+class _LazyGlobal(object):
+    """Proxy of a global object that is only created when it is first used
+
+    Creating the global config manager requires running `git config`, and
+    importing `datalad` should not pay for that, nor for anything else that
+    is not needed yet. Any attribute access, and any item or membership
+    query is passed on to the object, which is created on first use.
+    """
+    def __init__(self, factory):
+        object.__setattr__(self, '_lazy_factory', factory)
+        object.__setattr__(self, '_lazy_obj', None)
+        object.__setattr__(self, '_lazy_creating', False)
+        object.__setattr__(self, '_lazy_lock', threading.RLock())
 
+    def _lazy_get(self):
+        obj = self._lazy_obj
+        if obj is not None:
+            return obj
+        with self._lazy_lock:
+            if self._lazy_obj is None:
+                if self._lazy_creating:
+                    raise RuntimeError(
+                        f'{self._lazy_factory.__name__}() must not use the '
+                        'object it is creating')
+                object.__setattr__(self, '_lazy_creating', True)
+                try:
+                    object.__setattr__(self, '_lazy_obj', self._lazy_factory())
+                finally:
+                    object.__setattr__(self, '_lazy_creating', False)
+            return self._lazy_obj
 
-# must come after config manager
-# this is not to be modified. see enable/in_librarymode()
-# by default, we are in application-mode, simply because most of
-# datalad was originally implemented with this scenario assumption
-__runtime_mode = 'library' \
-    if cfg.getbool('datalad.runtime', 'librarymode', False) \
-    else 'application'
+    def __getattr__(self, name):
+        return getattr(self._lazy_get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._lazy_get(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._lazy_get(), name)
+
+    def __getitem__(self, key):
+        return self._lazy_get()[key]
+
+    def __contains__(self, key):
+        return key in self._lazy_get()
+
+    def __len__(self):
+        return len(self._lazy_get())
+
+    def __bool__(self):
+        return bool(self._lazy_get())
+
+    def __str__(self):
+        return str(self._lazy_get())
 
+    def __repr__(self):
+        if self._lazy_obj is None:
+            return f'<lazy {self._lazy_factory.__name__}()>'
+        return repr(self._lazy_obj)
+
+
+def _is_being_created(obj):
+    """Whether `obj` is a lazy global, whose object is being created"""
+    return isinstance(obj, _LazyGlobal) and obj._lazy_creating
+
+
+def _create_cfg():
+    from .log import configure_from_config
+    manager = ConfigManager()
+    # logging was set up from environment variables only
+    configure_from_config(manager)
+    return manager
+
+
+def _create_ssh_manager():
+    from .support.sshconnector import SSHManager
+    manager = SSHManager()
+    atexit.register(manager.close, allow_fail=False)
+    return manager
+
+
+cfg = _LazyGlobal(_create_cfg)
+ssh_manager = _LazyGlobal(_create_ssh_manager)
+
+# Other imports are interspersed with lgr.debug to ease troubleshooting startup
+# delays etc.
+
+# must come before datalad.utils, which it (indirectly) imports itself
+from .config import ConfigManager
 from datalad.utils import (
     get_encoding_info,
     get_envvars_info,
@@ -152,27 +238,29 @@ def teardown_package():
 # To analyze/initiate our decision making on what current directory to return
 getpwd()
 
-lgr.log(5, "Instantiating ssh manager")
-from .support.sshconnector import SSHManager
-
-ssh_manager = SSHManager()
-atexit.register(ssh_manager.close, allow_fail=False)
 atexit.register(lgr.log, 5, "Exiting")
 
-from ._version import get_versions
 
-__version__ = get_versions()['version']
-del get_versions
+def __getattr__(name):
+    # the version is determined on first access, as outside of an installed
+    # package it has to be queried from git
+    if name != '__version__':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    global __version__
+    from ._version import get_versions
+    __version__ = get_versions()['version']
+
+    if str(__version__) == '0' or __version__.startswith('0+'):
+        lgr.warning(
+            "DataLad was not installed 'properly' so its version is an uninformative %r.\n"
+            "It can happen e.g. if datalad was installed via\n"
+            "  pip install https://github.com/.../archive/{commitish}.zip\n"
+            "instead of\n"
+            "  pip install git+https://github.com/...@{commitish} .\n"
+            "We advise to re-install datalad or downstream projects might not operate correctly.",
+            __version__
+        )
+    return __version__
 
-if str(__version__) == '0' or __version__.startswith('0+'):
-    lgr.warning(
-        "DataLad was not installed 'properly' so its version is an uninformative %r.\n"
-        "It can happen e.g. if datalad was installed via\n"
-        "  pip install https://github.com/.../archive/{commitish}.zip\n"
-        "instead of\n"
-        "  pip install git+https://github.com/...@{commitish} .\n"
-        "We advise to re-install datalad or downstream projects might not operate correctly.",
-        __version__
-    )
 
 lgr.log(5, "Done importing main __init__")
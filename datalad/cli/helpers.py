@@ -12,11 +12,13 @@
 __docformat__ = 'restructuredtext'
 
 import argparse
+import json
 import os
 import re
 import sys
 import gzip
 import textwrap
+from pathlib import Path
 from textwrap import wrap
 
 from datalad import __version__
@@ -33,6 +35,10 @@ dirs = AppDirs("datalad", "datalad.org")
 from logging import getLogger
 lgr = getLogger('datalad.cli.helpers')
 
+# file in the cache directory that records which extension provides which
+# command, such that only this extension needs to be loaded to run it
+EXTENSION_COMMANDS_CACHE = 'cli-extension-commands.json'
+
 
 class HelpAction(argparse.Action):
     def __call__(self, parser, namespace, values, option_string=None):
@@ -188,12 +194,97 @@ class LogLevelAction(argparse.Action):
 
 def add_entrypoints_to_interface_groups(interface_groups):
     from datalad.support.entrypoints import iter_entrypoints
+    from .interface import get_cmdline_command_name
+    commands = {}
     for name, _, spec in iter_entrypoints('datalad.extensions', load=True):
         if len(spec) < 2 or not spec[1]:
             # entrypoint identity was logged by the iterator already
             lgr.debug('Extension does not provide a command suite')
             continue
         interface_groups.append((name, spec[0], spec[1]))
+        commands.update(
+            (get_cmdline_command_name(i), name) for i in spec[1])
+    _store_extension_commands(commands)
+
+
+def add_entrypoint_for_command_to_interface_groups(interface_groups,
+                                                   cmd_name):
+    """Add the command suite of the extension that provides a command
+
+    Which extension provides which command is recorded whenever all
+    extensions are loaded by `add_entrypoints_to_interface_groups()`.
+    If the installed extensions did not change since, only the one
+    extension that provides the command is loaded.
+
+    Parameters
+    ----------
+    interface_groups: list
+    cmd_name: str
+      Name of the command on the command line.
+
+    Returns
+    -------
+    bool
+      Whether the command suite of an extension that provides the command
+      was added. If not, all extensions must be loaded to find it.
+    """
+    from datalad.support.entrypoints import (
+        get_entrypoints_signature,
+        iter_entrypoints,
+    )
+    from .interface import get_cmdline_command_name
+    try:
+        cache = json.loads(_get_extension_commands_cache().read_text())
+    except (OSError, ValueError) as e:
+        lgr.debug('Cannot read commands of extensions from cache: %s',
+                  CapturedException(e))
+        return False
+    extension = cache.get('commands', {}).get(cmd_name)
+    if extension is None:
+        return False
+    if cache.get('signature') != \
+            get_entrypoints_signature('datalad.extensions'):
+        lgr.debug('Installed extensions changed since their commands '
+                  'were cached')
+        return False
+    for name, _, load in iter_entrypoints('datalad.extensions'):
+        if name != extension:
+            continue
+        try:
+            spec = load()
+        except Exception as e:
+            lgr.debug('Failed to load entrypoint %s: %s',
+                      name, CapturedException(e))
+            return False
+        if len(spec) < 2 or cmd_name not in (
+                get_cmdline_command_name(i) for i in spec[1]):
+            return False
+        interface_groups.append((name, spec[0], spec[1]))
+        return True
+    return False
+
+
+def _get_extension_commands_cache():
+    from datalad import cfg
+    return Path(cfg.obtain('datalad.locations.cache')) \
+        / EXTENSION_COMMANDS_CACHE
+
+
+def _store_extension_commands(commands):
+    from datalad.support.entrypoints import get_entrypoints_signature
+    path = _get_extension_commands_cache()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # concurrent invocations must never see a partially written file
+        tmp = path.with_name('{}.{}'.format(path.name, os.getpid()))
+        tmp.write_text(json.dumps(dict(
+            signature=get_entrypoints_signature('datalad.extensions'),
+            commands=commands,
+        )))
+        os.replace(tmp, path)
+    except OSError as e:
+        lgr.debug('Cannot cache commands of extensions: %s',
+                  CapturedException(e))
 
 
 def get_commands_from_groups(groups):
@@ -135,12 +135,19 @@ def setup_parser(
         # we know the command is not in the core package
         # still a chance it could be in an extension
         command_provider = 'extension'
-        # we need the full help, or we have a potential command that
-        # lives in an extension, must load all extension, expensive
-        from .helpers import add_entrypoints_to_interface_groups
-        # need to load all the extensions and try again
-        # TODO load extensions one-by-one and stop when a command was found
-        add_entrypoints_to_interface_groups(interface_groups)
+        from .helpers import (
+            add_entrypoint_for_command_to_interface_groups,
+            add_entrypoints_to_interface_groups,
+        )
+        # if the extension that provides the command is known, it is the
+        # only one that needs to be loaded
+        if status != 'subcommand' or \
+                not add_entrypoint_for_command_to_interface_groups(
+                    interface_groups, parseinfo):
+            # we need the full help, or we have a potential command that
+            # lives in an unknown extension, must load all extensions,
+            # expensive
+            add_entrypoints_to_interface_groups(interface_groups)
 
         if status == 'subcommand':
             known_commands = get_commands_from_groups(interface_groups)
@@ -9,8 +9,13 @@ from datalad.tests.utils_pytest import (
     assert_equal,
     assert_in,
     assert_raises,
+    ok_,
+    patch_config,
+    with_tempfile,
 )
+from datalad.utils import Path
 
+from ..helpers import EXTENSION_COMMANDS_CACHE
 from ..parser import (
     fail_with_short_help,
     setup_parser,
@@ -80,3 +85,54 @@ def test_setup():
         list(parser._positionals._group_actions[0].choices.keys()),
         ['wtf']
     )
+
+
+class _FakeDist:
+    name = 'datalad-fake'
+    version = '1.0'
+
+
+class _FakeEntryPoint:
+    """An entrypoint of an extension that provides a single command"""
+    def __init__(self, name, cmd):
+        self.name = name
+        self.value = f'{name}:command_suite'
+        self.module = name
+        self.dist = _FakeDist()
+        self.cmd = cmd
+        self.loaded = 0
+
+    def load(self):
+        self.loaded += 1
+        return (f'{self.name} commands',
+                [('datalad.local.wtf', 'WTF', self.cmd)])
+
+
+@with_tempfile(mkdir=True)
+def test_setup_extension_command_cached(cachedir=None):
+    eps = [_FakeEntryPoint('ext1', 'ext1-wtf'),
+           _FakeEntryPoint('ext2', 'ext2-wtf')]
+
+    def setup_ext1():
+        parser = check_setup_parser(['datalad', 'ext1-wtf'])['parser']
+        assert_equal(
+            list(parser._positionals._group_actions[0].choices.keys()),
+            ['ext1-wtf'])
+        return [ep.loaded for ep in eps]
+
+    with patch('datalad.support.entrypoints._get_entry_points',
+               lambda group: eps), \
+            patch_config({'datalad.locations.cache': cachedir}):
+        # all extensions are loaded to find the command
+        assert_equal(setup_ext1(), [1, 1])
+        ok_((Path(cachedir) / EXTENSION_COMMANDS_CACHE).exists())
+        # afterwards, only the one that provides it
+        assert_equal(setup_ext1(), [2, 1])
+        # any change of the installed extensions invalidates the cache
+        eps[1].dist.version = '2.0'
+        assert_equal(setup_ext1(), [3, 2])
+        assert_equal(setup_ext1(), [4, 2])
+        # a command that is not provided anymore requires to load all
+        eps[0].cmd = 'ext1-other'
+        check_setup_parser(['datalad', 'ext1-wtf'], 1)
+        assert_equal([ep.loaded for ep in eps], [6, 3])
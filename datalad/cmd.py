@@ -20,6 +20,7 @@ import logging
 import os
 import queue
 import sys
+import threading
 import warnings
 from queue import Queue
 from subprocess import TimeoutExpired
@@ -149,24 +150,30 @@ class BatchedCommandProtocol(GeneratorMixIn, StdOutErrCapture):
                  done_future: Any = None,
                  encoding: Optional[str] = None,
                  output_proc: Optional[Callable] = None,
+                 binary_output: bool = False,
                  ):
         GeneratorMixIn.__init__(self)
         StdOutErrCapture.__init__(self, done_future, encoding)
         self.batched_command = batched_command
         self.output_proc = output_proc
+        self.binary_output = binary_output
         self.line_splitter = LineSplitter()
 
     def pipe_data_received(self, fd: int, data: bytes):
         if fd == STDERR_FILENO:
             self.send_result((fd, data))
         elif fd == STDOUT_FILENO:
+            if self.binary_output:
+                # undecoded chunks, BatchedCommand splits them on request
+                self.send_result((fd, data))
+                return
             for line in self.line_splitter.process(data.decode(self.encoding)):
                 self.send_result((fd, line))
         else:
             raise ValueError(f"unknown file descriptor: {fd}")
 
     def pipe_connection_lost(self, fd: int, exc: Optional[Exception]):
-        if fd == STDOUT_FILENO:
+        if fd == STDOUT_FILENO and not self.binary_output:
             remaining_line = self.line_splitter.finish_processing()
             if remaining_line is not None:
                 lgr.debug("unterminated line: %s", remaining_line)
@@ -199,6 +206,13 @@ class ReadlineEmulator:
         """
         return self.batched_command.get_one_line()
 
+    def read(self, size: int) -> bytes:
+        """
+        Read exactly `size` bytes from the stdout provider. Only supported
+        if the BatchedCommand was created with `binary_output=True`.
+        """
+        return self.batched_command.get_bytes(size)
+
 
 class SafeDelCloseMixin(object):
     """A helper class to use where __del__ would call .close() which might
@@ -233,16 +247,21 @@ class BatchedCommand(SafeDelCloseMixin):
                  output_proc: Optional[Callable] = None,
                  timeout: Optional[float] = None,
                  exception_on_timeout: bool = False,
+                 binary_output: bool = False,
                  ):
 
+        # serializes requests from concurrent callers
+        self._lock = threading.RLock()
         command = cmd
         self.command: list = [command] if not isinstance(command, List) else command
         self.path: Optional[str] = path
         self.output_proc: Optional[Callable] = output_proc
         self.timeout: Optional[float] = timeout
         self.exception_on_timeout: bool = exception_on_timeout
+        self.binary_output: bool = binary_output
 
         self.stderr_output = b""
+        self.stdout_buffer = b""
         self.runner: Optional[WitlessRunner] = None
         self.encoding = None
         self.wait_timed_out = None
@@ -306,6 +325,7 @@ class BatchedCommand(SafeDelCloseMixin):
 
         self.stdin_queue = queue.Queue()
         self.stderr_output = b""
+        self.stdout_buffer = b""
         self.wait_timed_out = None
         self.return_code = None
         self.last_request = None
@@ -325,6 +345,7 @@ class BatchedCommand(SafeDelCloseMixin):
             # Keyword arguments for the protocol
             batched_command=self,
             output_proc=self.output_proc,
+            binary_output=self.binary_output,
         )
         self.encoding = self.generator.runner.protocol.encoding
 
@@ -379,6 +400,10 @@ class BatchedCommand(SafeDelCloseMixin):
             If `self.output_proc` is not `None`, the result type of
             `self.output_proc` determines the type of the elements.
         """
+        with self._lock:
+            return self._locked_call(cmds)
+
+    def _locked_call(self, cmds):
         self._active += 1
         requests = cmds
 
@@ -391,18 +416,26 @@ class BatchedCommand(SafeDelCloseMixin):
             # This code assumes that each processing request is
             # a single line and leads to a response that triggers a
             # `send_result` in the protocol.
-            for request in requests:
-                while True:
-                    try:
-                        responses.append(self.process_request(request))
+            # All requests are sent before the first response is read,
+            # i.e. they are pipelined. The subprocess can work through
+            # them without waiting for a round trip per request. Sending
+            # does not block, it is done by the runner's stdin writer.
+            while len(responses) < len(requests):
+                if not self.process_running():
+                    self._initialize()
+                for request in requests[len(responses):]:
+                    self._send_request(request)
+                try:
+                    for request in requests[len(responses):]:
+                        responses.append(self._receive_response())
                         self.last_request = request
-                        break
-                    except StopIteration:
-                        # The process finished executing, store the last return
-                        # code and restart the process.
-                        lgr.debug("%s: command exited", self)
-                        self.return_code = self.generator.return_code
-                        self.runner = None
+                except StopIteration:
+                    # The process finished executing, store the last return
+                    # code and restart the process. All requests that did
+                    # not get a response will be sent again.
+                    lgr.debug("%s: command exited", self)
+                    self.return_code = self.generator.return_code
+                    self.runner = None
 
         except CommandError as command_error:
             # Convert CommandError into BatchedCommandError
@@ -421,6 +454,7 @@ class BatchedCommand(SafeDelCloseMixin):
 
         finally:
             self._active -= 1
+            self._active_last = _now()
         return responses if input_multiple else responses[0] if responses else None
 
     def process_request(self,
@@ -432,28 +466,33 @@ class BatchedCommand(SafeDelCloseMixin):
             if not self.process_running():
                 self._initialize()
 
-            # Remember request and send it to subprocess
-            if not isinstance(request, str):
-                request = ' '.join(request)
-            self.stdin_queue.put((request + "\n").encode())
-
-            # Get the response from the generator. We only consider
-            # data received on stdout as a response.
-            if self.output_proc:
-                # If we have an output procedure, let the output procedure
-                # read stdout and decide about the nature of the response
-                response = self.output_proc(ReadlineEmulator(self))
-            else:
-                # If there is no output procedure we assume that a response
-                # is one line.
-                response = self.get_one_line()
-                if response is not None:
-                    response = response.rstrip()
-            return response
+            self._send_request(request)
+            return self._receive_response()
 
         finally:
             self._active -= 1
 
+    def _send_request(self, request: Union[Tuple, str]):
+        # Send request to subprocess
+        if not isinstance(request, str):
+            request = ' '.join(request)
+        self.stdin_queue.put((request + "\n").encode())
+
+    def _receive_response(self) -> Any | None:
+        # Get the response from the generator. We only consider
+        # data received on stdout as a response.
+        if self.output_proc:
+            # If we have an output procedure, let the output procedure
+            # read stdout and decide about the nature of the response
+            response = self.output_proc(ReadlineEmulator(self))
+        else:
+            # If there is no output procedure we assume that a response
+            # is one line.
+            response = self.get_one_line()
+            if response is not None:
+                response = response.rstrip()
+        return response
+
     def proc1(self,
               single_command: str):
         """
@@ -467,18 +506,41 @@ class BatchedCommand(SafeDelCloseMixin):
         finally:
             self._active -= 1
 
-    def get_one_line(self) -> Optional[str]:
+    def get_one_line(self) -> Optional[str | bytes]:
         """
         Get a single stdout line from the generator.
 
         If timeout was specified, and exception_on_timeout is False,
         and if a timeout occurs, return None. Otherwise, return the
         string that was read from the generator.
-        """
 
+        With `binary_output`, the line is returned as bytes, including its
+        line ending.
+        """
+        if not self.binary_output:
+            return self._get_stdout_data()
+        while b"\n" not in self.stdout_buffer:
+            self.stdout_buffer += self._get_stdout_data()
+        line, self.stdout_buffer = self.stdout_buffer.split(b"\n", 1)
+        return line + b"\n"
+
+    def get_bytes(self, size: int) -> bytes:
+        """
+        Get exactly `size` bytes of stdout from the generator. Requires
+        `binary_output`.
+        """
+        assert self.binary_output, "get_bytes() requires binary_output"
+        while len(self.stdout_buffer) < size:
+            self.stdout_buffer += self._get_stdout_data()
+        data = self.stdout_buffer[:size]
+        self.stdout_buffer = self.stdout_buffer[size:]
+        return data
+
+    def _get_stdout_data(self) -> Optional[str | bytes]:
         # Implementation remarks:
         # 1. We know that BatchedCommandProtocol only returns complete lines on
-        #    stdout, that makes this code simple.
+        #    stdout, or undecoded chunks with `binary_output`, that makes this
+        #    code simple.
         # 2. stderr is handled transparently within this method,
         #    by adding all stderr-content to an internal buffer.
         while True:
@@ -519,7 +581,10 @@ class BatchedCommand(SafeDelCloseMixin):
         str, optional
           stderr output if return_stderr is True, None otherwise
         """
+        with self._lock:
+            return self._locked_close(return_stderr)
 
+    def _locked_close(self, return_stderr):
         if self.runner:
 
             abandon = self._get_abandon()
@@ -29,9 +29,16 @@ from datalad.consts import DATASET_CONFIG_FILE
 from datalad.runner import (
     CommandError,
     GitRunner,
-    KillOutput,
     StdOutErrCapture,
 )
+from datalad.support.gitconfig import (
+    GitConfigReader,
+    UnsupportedGitConfig,
+    check_environment,
+    get_global_gitconfigs,
+    get_repo_gitconfigs,
+    get_system_gitconfig,
+)
 from datalad.utils import on_windows
 
 lgr = logging.getLogger('datalad.config')
@@ -348,22 +355,27 @@ class ConfigManager(object):
 
         self._repo_dot_git = None
         self._repo_pathobj = None
+        # long-running `git cat-file` processes of the repository, to query
+        # committed config. We cannot hold on to the repository itself, it
+        # holds on to its ConfigManager
+        self._repo_cat_file = None
         if dataset:
-            if hasattr(dataset, 'dot_git'):
-                # `dataset` is actually a Repo instance
-                self._repo_dot_git = dataset.dot_git
-                self._repo_pathobj = dataset.pathobj
-            elif dataset.repo:
-                self._repo_dot_git = dataset.repo.dot_git
-                self._repo_pathobj = dataset.repo.pathobj
+            repo = dataset if hasattr(dataset, 'dot_git') else dataset.repo
+            if repo:
+                # `dataset` might actually be a Repo instance
+                self._repo_dot_git = repo.dot_git
+                self._repo_pathobj = repo.pathobj
+                self._repo_cat_file = getattr(repo, '_cat_file', None)
 
         self._config_cmd = ['git', 'config']
+        # the global config manager, unless this is the one being created
+        # on first use of `datalad.cfg`, which has none to inherit from
+        global_cfg = None if datalad._is_being_created(datalad.cfg) \
+            else datalad.cfg
         # public dict to store variables that always override any setting
         # read from a file
-        # `hasattr()` is needed because `datalad.cfg` is generated upon first module
-        # import, hence when this code runs first, there cannot be any config manager
-        # to inherit from
-        self.overrides = datalad.cfg.overrides.copy() if hasattr(datalad, 'cfg') else {}
+        self.overrides = global_cfg.overrides.copy() \
+            if global_cfg is not None else {}
         if overrides is not None:
             self.overrides.update(overrides)
         if dataset is None:
@@ -383,6 +395,10 @@ class ConfigManager(object):
             self._config_cmd = ['git', f'--git-dir={nul}', 'config']
 
         self._src_mode = source
+        # optionally read config files without calling `git config`.
+        # The switch can only come from the global config manager
+        self._native_reader = global_cfg is not None and \
+            global_cfg.obtain('datalad.runtime.native-gitconfig')
         run_kwargs = dict()
         self._runner = None
         if dataset is not None:
@@ -442,16 +458,10 @@ class ConfigManager(object):
             if self._repo_dot_git == self._repo_pathobj:
                 # this is a bare repo, we go with the default HEAD,
                 # if it has a config
-                try:
-                    # will blow if absent
-                    self._runner.run([
-                        'git', 'cat-file', '-e', 'HEAD:.datalad/config'],
-                        protocol=KillOutput)
+                if self._get_objectname('HEAD:.datalad/config'):
                     to_run['branch'] = run_args + [
                         '--blob', 'HEAD:.datalad/config']
-                except CommandError:
-                    # all good, just no branch config
-                    pass
+                # otherwise all good, just no branch config
             else:
                 # non-bare repo
                 # we could use the same strategy as for bare repos, and rely
@@ -500,6 +510,11 @@ class ConfigManager(object):
         return any(curstats[f] != storestats[f] for f in store['files'])
 
     def _reload(self, run_args):
+        if self._native_reader:
+            try:
+                return self._reload_native(run_args)
+            except UnsupportedGitConfig as e:
+                lgr.debug('Falling back on git-config: %s', e)
         # query git-config
         stdout, stderr = self._run(
             run_args,
@@ -516,6 +531,60 @@ class ConfigManager(object):
         store['stats'] = self._get_stats(store)
         return store
 
+    def _reload_native(self, run_args):
+        """Like _reload(), but reads config files without `git config`
+
+        Raises
+        ------
+        UnsupportedGitConfig
+          If the configuration cannot be read without Git.
+        """
+        check_environment()
+        git_dir = self._repo_dot_git
+        if git_dir is None and not any(
+                a.startswith('--git-dir=') for a in self._config_cmd):
+            # Git would discover a repository from the working directory
+            raise UnsupportedGitConfig('no repository known')
+        # like git-config, only follow includes when reading the full
+        # configuration, not for a particular source
+        reader = GitConfigReader(
+            git_dir=git_dir,
+            includes=not any(a in run_args
+                             for a in ('--file', '--blob', '--local')))
+        if '--file' in run_args:
+            reader.read_file(run_args[run_args.index('--file') + 1])
+        elif '--blob' in run_args:
+            name = run_args[run_args.index('--blob') + 1]
+            if self._repo_cat_file is None:
+                raise UnsupportedGitConfig('no repository to read blobs from')
+            rec = next(self._repo_cat_file.cat_objects_([name]))
+            if isinstance(rec['content'], bytes):
+                raise UnsupportedGitConfig(
+                    'cannot decode config blob {}'.format(name))
+            if rec['content'] is not None:
+                reader.read_blob(name, rec['objectname'], rec['content'])
+        else:
+            if '--local' not in run_args:
+                for f in [get_system_gitconfig()] + get_global_gitconfigs():
+                    if f is not None:
+                        reader.read_file(f)
+            if git_dir is not None:
+                local_cfg, worktree_cfg = get_repo_gitconfigs(git_dir)
+                reader.read_file(local_cfg)
+                worktree_enabled = reader.cfg.get(
+                    'extensions.worktreeconfig', False)
+                if isinstance(worktree_enabled, tuple):
+                    worktree_enabled = worktree_enabled[-1]
+                if '--local' not in run_args and (
+                        worktree_enabled is None
+                        or anything2bool(worktree_enabled)):
+                    reader.read_file(worktree_cfg)
+            if '--local' not in run_args:
+                reader.read_command_line()
+        store = dict(cfg=reader.cfg, files=reader.files)
+        store['stats'] = self._get_stats(store)
+        return store
+
     def _get_stats(self, store):
         stats = {}
         for f in store['files']:
@@ -531,13 +600,24 @@ class ConfigManager(object):
                     stats[f] = None
             elif f.startswith('blob:'):
                 # we record the specific shasum of the blob
-                stats[f] = self._runner.run(
-                    ['git', 'rev-parse', f[5:]],
-                    protocol=StdOutErrCapture)['stdout'].strip()
+                stats[f] = self._get_objectname(f[5:])
             else:
                 stats[f] = None
         return stats
 
+    def _get_objectname(self, obj):
+        """Return the SHA of a Git object, or None if it does not exist"""
+        if self._repo_cat_file is not None:
+            # no process spawned per query
+            return next(
+                self._repo_cat_file.check_objects_([obj]))['objectname']
+        try:
+            return self._runner.run(
+                ['git', 'rev-parse', '--verify', '--quiet', obj],
+                protocol=StdOutErrCapture)['stdout'].strip()
+        except CommandError:
+            return None
+
     @_scope_reload
     @_where_to_scope
     def obtain(self, var, default=None, dialog_type=None, valtype=None,
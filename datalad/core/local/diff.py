@@ -37,6 +37,10 @@ from datalad.support.constraints import (
     EnsureStr,
 )
 from datalad.support.param import Parameter
+from datalad.support.parallel import (
+    ProducerConsumer,
+    QueryPool,
+)
 
 from datalad.core.local.status import (
     Status,
@@ -126,7 +130,8 @@ class Diff(Interface):
             annex=None,
             untracked='normal',
             recursive=False,
-            recursion_limit=None):
+            recursion_limit=None,
+            jobs=None):
         yield from diff_dataset(
             dataset=dataset,
             fr=ensure_unicode(fr),
@@ -136,7 +141,8 @@ class Diff(Interface):
             annex=annex,
             untracked=untracked,
             recursive=recursive,
-            recursion_limit=recursion_limit)
+            recursion_limit=recursion_limit,
+            jobs=jobs)
 
     @staticmethod
     def custom_result_renderer(res, **kwargs):  # pragma: more cover
@@ -155,6 +161,7 @@ def diff_dataset(
         recursion_limit=None,
         reporting_order='depth-first',
         datasets_only=False,
+        jobs=None,
 ):
     """Internal helper to diff a dataset
 
@@ -195,6 +202,9 @@ def diff_dataset(
       Consider only changes to (sub)datasets but limiting operation only to
       paths of subdatasets.
       Note: ATM incompatible with explicit specification of `path`.
+    jobs : int or 'auto' or None, optional
+      Number of datasets to query in parallel (see ProducerConsumer). The
+      order of reports does not depend on it.
 
     Yields
     ------
@@ -273,22 +283,36 @@ def diff_dataset(
 
     # cache to help avoid duplicate status queries
     content_info_cache = {}
-    for res in _diff_ds(
-            ds,
-            fr,
-            to,
-            constant_refs,
-            recursion_limit
-            if recursion_limit is not None and recursive
-            else -1 if recursive else 0,
-            # TODO recode paths to repo path reference
-            origpaths=None if not path else dict(path),
-            untracked=untracked,
-            annexinfo=annex,
-            cache=content_info_cache,
-            order=reporting_order,
-            datasets_only=datasets_only,
-    ):
+    diff_args = (
+        ds,
+        fr,
+        to,
+        constant_refs,
+        recursion_limit
+        if recursion_limit is not None and recursive
+        else -1 if recursive else 0,
+    )
+    diff_kwargs = dict(
+        # TODO recode paths to repo path reference
+        origpaths=None if not path else dict(path),
+        untracked=untracked,
+        annexinfo=annex,
+        cache=content_info_cache,
+        order=reporting_order,
+        datasets_only=datasets_only,
+    )
+    queries = None
+    if ProducerConsumer.get_effective_jobs(jobs) > 1:
+        # query all datasets in parallel, reporting happens in the
+        # order of a serial traversal
+        queries = QueryPool(
+            _query_ds_diff,
+            [(_get_diff_query_key(ds, fr, to),
+              diff_args + tuple(diff_kwargs[k] for k in (
+                  'origpaths', 'untracked', 'annexinfo', 'cache', 'order',
+                  'datasets_only')))],
+            jobs=jobs)
+    for res in _diff_ds(*diff_args, **diff_kwargs, queries=queries):
         res.update(
             refds=ds.path,
             logger=lgr,
@@ -298,7 +322,79 @@ def diff_dataset(
 
 
 def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
-             annexinfo, cache, order='depth-first', datasets_only=False):
+             annexinfo, cache, order='depth-first', datasets_only=False,
+             queries=None):
+    query_args = (ds, fr, to, constant_refs, recursion_level, origpaths,
+                  untracked, annexinfo, cache, order, datasets_only)
+    if queries is None:
+        res = _query_ds_diff(None, *query_args)
+    else:
+        res = queries.get(_get_diff_query_key(ds, fr, to), *query_args)
+    if res is None:
+        return
+    if isinstance(res, dict):
+        # an error record
+        yield res
+        return
+    diff_state, subds_calls = res
+
+    repo_path = ds.repo.pathobj
+    # potentially collect subdataset diff call specs for the end
+    # (if order == 'breadth-first')
+    ds_diffs = []
+    subds_diffcalls = []
+    for path, props in diff_state.items():
+        pathinds = str(ds.pathobj / path.relative_to(repo_path))
+        path_rec = dict(
+            props,
+            path=pathinds,
+            # report the dataset path rather than the repo path to avoid
+            # realpath/symlink issues
+            parentds=ds.path,
+            status='ok',
+        )
+        if order in ('breadth-first', 'depth-first'):
+            yield path_rec
+        elif order == 'bottom-up':
+            ds_diffs.append(path_rec)
+        else:
+            raise ValueError(order)
+        if path not in subds_calls:
+            continue
+        call_args, call_kwargs = subds_calls[path]
+        call_kwargs = dict(call_kwargs, queries=queries)
+        if order in ('depth-first', 'bottom-up'):
+            yield from _diff_ds(*call_args, **call_kwargs)
+        elif order == 'breadth-first':
+            subds_diffcalls.append((call_args, call_kwargs))
+        else:
+            raise ValueError(order)
+    # deal with staged ds diffs (for bottom-up)
+    for rec in ds_diffs:
+        yield rec
+    # deal with staged subdataset diffs (for breadth-first)
+    for call_args, call_kwargs in subds_diffcalls:
+        yield from _diff_ds(*call_args, **call_kwargs)
+
+
+def _get_diff_query_key(ds, fr, to):
+    return ds.path, fr, to
+
+
+def _query_ds_diff(queries, ds, fr, to, constant_refs, recursion_level,
+                   origpaths, untracked, annexinfo, cache, order='depth-first',
+                   datasets_only=False):
+    """Internal helper of _diff_ds() to query a single dataset
+
+    Returns
+    -------
+    None or dict or tuple
+      None if there is nothing to report, an error result record, or the
+      diff state of the dataset (see Repo.diffstatus()) and a mapping of
+      paths of subdatasets to recurse into to their _diff_ds() call
+      arguments. If `queries` is a QueryPool, diff queries for these
+      subdatasets are scheduled right away.
+    """
     if not ds.is_installed():
         # asked to query a subdataset that is not available
         lgr.debug("Skip diff of unavailable subdataset: %s", ds)
@@ -340,12 +436,11 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
             eval_submodule_state='full' if to is None else 'commit',
             _cache=cache)
     except InvalidGitReferenceError as e:
-        yield dict(
+        return dict(
             path=ds.path,
             status='impossible',
             message=str(e),
         )
-        return
 
     if annexinfo and hasattr(repo, 'get_content_annexinfo'):
         # this will amend `diff_state`
@@ -364,26 +459,8 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
                 ref=fr,
                 key_prefix="prev_")
 
-    # potentially collect subdataset diff call specs for the end
-    # (if order == 'breadth-first')
-    ds_diffs = []
-    subds_diffcalls = []
+    subds_calls = {}
     for path, props in diff_state.items():
-        pathinds = str(ds.pathobj / path.relative_to(repo_path))
-        path_rec = dict(
-            props,
-            path=pathinds,
-            # report the dataset path rather than the repo path to avoid
-            # realpath/symlink issues
-            parentds=ds.path,
-            status='ok',
-        )
-        if order in ('breadth-first', 'depth-first'):
-            yield path_rec
-        elif order == 'bottom-up':
-            ds_diffs.append(path_rec)
-        else:
-            raise ValueError(order)
         # for a dataset we need to decide whether to dive in, or not
         if props.get('type', None) == 'dataset' and (
                 # subdataset path was given in rsync-style 'ds/'
@@ -401,7 +478,7 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
                 continue
             elif subds_state in ('added', 'modified'):
                 # dive
-                subds = Dataset(pathinds)
+                subds = Dataset(str(ds.pathobj / path.relative_to(repo_path)))
                 call_args = (
                     subds,
                     # from before time or from the reported state
@@ -430,19 +507,14 @@ def _diff_ds(ds, fr, to, constant_refs, recursion_level, origpaths, untracked,
                     order=order,
                     datasets_only=datasets_only,
                 )
-                if order in ('depth-first', 'bottom-up'):
-                    yield from _diff_ds(*call_args, **call_kwargs)
-                elif order == 'breadth-first':
-                    subds_diffcalls.append((call_args, call_kwargs))
-                else:
-                    raise ValueError(order)
+                subds_calls[path] = (call_args, call_kwargs)
+                if queries is not None:
+                    queries.schedule(
+                        _get_diff_query_key(*call_args[:3]),
+                        *call_args,
+                        **call_kwargs)
             else:
                 raise RuntimeError(
                     "Unexpected subdataset state '{}'. That sucks!".format(
                         subds_state))
-    # deal with staged ds diffs (for bottom-up)
-    for rec in ds_diffs:
-        yield rec
-    # deal with staged subdataset diffs (for breadth-first)
-    for call_args, call_kwargs in subds_diffcalls:
-        yield from _diff_ds(*call_args, **call_kwargs)
+    return diff_state, subds_calls
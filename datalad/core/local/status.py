@@ -35,8 +35,13 @@ from datalad.interface.common_opts import (
 from datalad.interface.utils import generic_result_renderer
 import datalad.support.ansi_colors as ac
 from datalad.support.param import Parameter
+from datalad.support.parallel import (
+    ProducerConsumer,
+    QueryPool,
+)
 from datalad.support.constraints import (
     EnsureChoice,
+    EnsureInt,
     EnsureNone,
     EnsureStr,
 )
@@ -92,7 +97,15 @@ _common_diffstatus_params = dict(
         untracked directories are reported as such; 'all': report
         individual files even in fully untracked directories."""),
     recursive=recursion_flag,
-    recursion_limit=recursion_limit)
+    recursion_limit=recursion_limit,
+    jobs=Parameter(
+        args=("-J", "--jobs"),
+        metavar="NJOBS",
+        constraints=EnsureInt() | EnsureNone() | EnsureChoice('auto'),
+        doc="""how many datasets to query in parallel. If not given, or
+        "auto", the number defined by the 'datalad.runtime.max-jobs'
+        configuration item is used. The order of reports does not depend
+        on the number of jobs."""))
 
 
 STATE_COLOR_MAP = {
@@ -106,7 +119,7 @@ STATE_COLOR_MAP = {
 
 def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
                          queried, eval_submodule_state, eval_filetype, cache,
-                         reporting_order):
+                         reporting_order, queries=None):
     """Internal helper to obtain status information on a dataset
 
     Parameters
@@ -134,6 +147,9 @@ def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
       on the subdataset's submodule in a superdataset (depth-first).
       Alternatively, report all superdataset records first, before reporting
       any subdataset content records (breadth-first).
+    queries : QueryPool, optional
+      If given, status queries on a dataset and its subdatasets are
+      performed via this pool, ahead of (and in parallel to) reporting.
 
     Yields
     ------
@@ -152,7 +168,68 @@ def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
     if ds.pathobj in queried:
         # do not report on a single dataset twice
         return
-    # take the dataset that went in first
+    query_args = (ds, paths, annexinfo, untracked, recursion_limit,
+                  eval_submodule_state, cache)
+    if queries is None:
+        status, subdatasets = _query_dataset_status(None, *query_args)
+    else:
+        status, subdatasets = queries.get(
+            _get_status_query_key(ds, paths), *query_args)
+    # potentially collect subdataset status call specs for the end
+    # (if order == 'breadth-first')
+    subds_statuscalls = []
+    for path, props in status.items():
+        cpath = ds.pathobj / path.relative_to(ds.repo.pathobj)
+        yield dict(
+            props,
+            path=str(cpath),
+            # report the dataset path rather than the repo path to avoid
+            # realpath/symlink issues
+            parentds=ds.path,
+        )
+        queried.add(ds.pathobj)
+        if cpath in subdatasets:
+            call_args = (
+                subdatasets[cpath],
+                None,
+                annexinfo,
+                untracked,
+                recursion_limit - 1,
+                queried,
+                eval_submodule_state,
+                None,
+                cache,
+            )
+            call_kwargs = dict(
+                reporting_order='depth-first',
+                queries=queries,
+            )
+            if reporting_order == 'depth-first':
+                yield from yield_dataset_status(*call_args, **call_kwargs)
+            else:
+                subds_statuscalls.append((call_args, call_kwargs))
+
+    # deal with staged subdataset status calls
+    for call_args, call_kwargs in subds_statuscalls:
+        yield from yield_dataset_status(*call_args, **call_kwargs)
+
+
+def _get_status_query_key(ds, paths):
+    return ds.path, tuple(paths) if paths else None
+
+
+def _query_dataset_status(queries, ds, paths, annexinfo, untracked,
+                          recursion_limit, eval_submodule_state, cache):
+    """Internal helper of yield_dataset_status() to query a single dataset
+
+    Returns
+    -------
+    dict, dict
+      The status report for the dataset (see Repo.diffstatus()) and a
+      mapping of subdataset paths to installed subdatasets to recurse into.
+      If `queries` is a QueryPool, status queries for these subdatasets are
+      scheduled right away.
+    """
     repo = ds.repo
     repo_path = repo.pathobj
     lgr.debug('Querying %s.diffstatus() for paths: %s', repo, paths)
@@ -182,50 +259,28 @@ def yield_dataset_status(ds, paths, annexinfo, untracked, recursion_limit,
             init=status,
             eval_availability=annexinfo in ('availability', 'all'),
             ref=None)
-    # potentially collect subdataset status call specs for the end
-    # (if order == 'breadth-first')
-    subds_statuscalls = []
+    subdatasets = {}
+    if not recursion_limit:
+        return status, subdatasets
     for path, props in status.items():
+        if props.get('type', None) != 'dataset':
+            continue
         cpath = ds.pathobj / path.relative_to(repo_path)
-        yield dict(
-            props,
-            path=str(cpath),
-            # report the dataset path rather than the repo path to avoid
-            # realpath/symlink issues
-            parentds=ds.path,
-        )
-        queried.add(ds.pathobj)
-        if recursion_limit and props.get('type', None) == 'dataset':
-            if cpath == ds.pathobj:
-                # ATM can happen if there is something wrong with this repository
-                # We will just skip it here and rely on some other exception to bubble up
-                # See https://github.com/datalad/datalad/pull/4526 for the usecase
-                lgr.debug("Got status for itself, which should not happen, skipping %s", path)
-                continue
-            subds = Dataset(str(cpath))
-            if subds.is_installed():
-                call_args = (
-                    subds,
-                    None,
-                    annexinfo,
-                    untracked,
-                    recursion_limit - 1,
-                    queried,
-                    eval_submodule_state,
-                    None,
-                    cache,
-                )
-                call_kwargs = dict(
-                    reporting_order='depth-first',
-                )
-                if reporting_order == 'depth-first':
-                    yield from yield_dataset_status(*call_args, **call_kwargs)
-                else:
-                    subds_statuscalls.append((call_args, call_kwargs))
-
-    # deal with staged subdataset status calls
-    for call_args, call_kwargs in subds_statuscalls:
-        yield from yield_dataset_status(*call_args, **call_kwargs)
+        if cpath == ds.pathobj:
+            # ATM can happen if there is something wrong with this repository
+            # We will just skip it here and rely on some other exception to bubble up
+            # See https://github.com/datalad/datalad/pull/4526 for the usecase
+            lgr.debug("Got status for itself, which should not happen, skipping %s", path)
+            continue
+        subds = Dataset(str(cpath))
+        if subds.is_installed():
+            subdatasets[cpath] = subds
+            if queries is not None:
+                queries.schedule(
+                    _get_status_query_key(subds, None),
+                    subds, None, annexinfo, untracked, recursion_limit - 1,
+                    eval_submodule_state, cache)
+    return status, subdatasets
 
 
 @build_doc
@@ -375,7 +430,8 @@ class Status(Interface):
             recursive=False,
             recursion_limit=None,
             eval_subdataset_state='full',
-            report_filetype=None):
+            report_filetype=None,
+            jobs=None):
         if report_filetype is not None:
             warnings.warn(
                 "status(report_filetype=) no longer supported, and will be removed "
@@ -399,7 +455,24 @@ class Status(Interface):
         ds_path = ds.path
         queried = set()
         content_info_cache = {}
-        for res in _yield_paths_by_ds(ds, dataset, ensure_list(path)):
+        recursion_limit = recursion_limit \
+            if recursion_limit is not None else -1 \
+            if recursive else 0
+        queries = None
+        ds_queries = _yield_paths_by_ds(ds, dataset, ensure_list(path))
+        if ProducerConsumer.get_effective_jobs(jobs) > 1:
+            # query all datasets in parallel, reporting happens in the
+            # order of a serial traversal
+            ds_queries = list(ds_queries)
+            queries = QueryPool(
+                _query_dataset_status,
+                [(_get_status_query_key(res['ds'], res['paths']),
+                  (res['ds'], res['paths'], annex, untracked,
+                   recursion_limit, eval_subdataset_state,
+                   content_info_cache))
+                 for res in ds_queries if 'status' not in res],
+                jobs=jobs)
+        for res in ds_queries:
             if 'status' in res:
                 # this is an error
                 yield res
@@ -409,14 +482,13 @@ class Status(Interface):
                     res['paths'],
                     annex,
                     untracked,
-                    recursion_limit
-                    if recursion_limit is not None else -1
-                    if recursive else 0,
+                    recursion_limit,
                     queried,
                     eval_subdataset_state,
                     None,
                     content_info_cache,
-                    reporting_order='depth-first'):
+                    reporting_order='depth-first',
+                    queries=queries):
                 if 'status' not in r:
                     r['status'] = 'ok'
                 yield dict(
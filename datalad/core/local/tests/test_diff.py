@@ -27,6 +27,7 @@ from datalad.cmd import (
     StdOutCapture,
 )
 from datalad.consts import PRE_INIT_COMMIT_SHA
+from datalad.core.local.diff import diff_dataset
 from datalad.distribution.dataset import Dataset
 from datalad.support.exceptions import NoDatasetFound
 from datalad.tests.utils_pytest import (
@@ -545,3 +546,27 @@ def test_diff_fr_none_one_get_content_annexinfo_call(path=None):
     with patch.object(AnnexRepo, "get_content_annexinfo") as gca:
         res = ds.diff(fr=None, to="HEAD", annex="all", result_renderer='disabled')
         eq_(gca.call_count, 1)
+
+
+@with_tempfile
+def test_diff_jobs(path=None):
+    ds = get_deeply_nested_structure(path)
+    for i in range(3):
+        sub = ds.create(op.join('subds_modified', 'sub{}'.format(i)))
+        (sub.pathobj / 'untracked').write_text(u'new')
+    for kw in (dict(recursive=True),
+               dict(recursive=True, annex='basic', untracked='all'),
+               dict(recursive=True, fr=PRE_INIT_COMMIT_SHA, to='HEAD'),
+               dict(recursive=True, reporting_order='bottom-up'),
+               dict(recursive=True, reporting_order='breadth-first')):
+        order = kw.pop('reporting_order', None)
+        if order:
+            # only exposed by the internal helper
+            run = lambda jobs: list(diff_dataset(
+                ds, fr='HEAD', to=None, constant_refs=False,
+                reporting_order=order, jobs=jobs, **kw))
+        else:
+            run = lambda jobs: ds.diff(
+                result_renderer='disabled', jobs=jobs, **kw)
+        # identical reports, in identical order
+        eq_(run(0), run(4))
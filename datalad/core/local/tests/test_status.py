@@ -443,3 +443,21 @@ def test_get_paths_by_ds(path=None, otherdspath=None):
         list(paths_by_ds.keys()),
         [ds.pathobj, subds_modified.pathobj]
     )
+
+
+@with_tempfile
+def test_status_jobs(path=None):
+    ds = get_deeply_nested_structure(path)
+    # more subdatasets to have something to parallelize
+    for i in range(3):
+        sub = ds.create(op.join('subds_modified', 'sub{}'.format(i)))
+        (sub.pathobj / 'untracked').write_text(u'new')
+    for kw in (dict(recursive=True),
+               dict(recursive=True, annex='basic'),
+               dict(recursive=True, recursion_limit=1),
+               dict(path=['subdir', op.join('subds_modified', 'sub1')],
+                    recursive=True)):
+        serial = ds.status(result_renderer='disabled', jobs=0, **kw)
+        parallel = ds.status(result_renderer='disabled', jobs=4, **kw)
+        # identical reports, in identical order
+        eq_(serial, parallel)
@@ -53,6 +53,11 @@ class RemoteError(_RemoteError):
 class SpecialRemote(_SpecialRemote):
     """Common base class for all of DataLad's special remote implementations"""
 
+    # Whether the TRANSFER, CHECKPRESENT, REMOVE, and WHEREIS requests can
+    # be executed concurrently by multiple threads, such that a single
+    # process can serve all jobs of git-annex (see `asyncmaster`)
+    supports_async = False
+
     def __init__(self, annex):
         super(SpecialRemote, self).__init__(annex=annex)
         # instruct annex backend UI to use this remote
@@ -31,6 +31,7 @@ from datalad.support.exceptions import CapturedException
 from datalad.support.locking import lock_if_check_fails
 from datalad.support.network import URL
 from datalad.utils import (
+    copy_file_content,
     ensure_bytes,
     get_dataset_root,
     getpwd,
@@ -71,7 +72,7 @@ def link_file_load(src, dst, dry_run=False):
         # filesystem simply does not implement it on an otherwise
         # sane platform (e.g. exfat on Linux)
         lgr.warning("Linking of %s failed (%s), copying file" % (src, e))
-        shutil.copyfile(src_realpath, dst)
+        copy_file_content(src_realpath, dst)
         shutil.copystat(src_realpath, dst)
     else:
         lgr.log(2, "Hardlinking finished")
@@ -397,15 +398,22 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
                        "Key file %s is not present" % akey_path
 
                 # Extract that bloody file from the bloody archive
-                # TODO: implement/use caching, for now a simple one
-                #  actually patool doesn't support extraction of a single file
-                #  https://github.com/wummel/patool/issues/20
-                # so
                 pwd = getpwd()
                 lgr.debug(
                     "Getting file %s from %s while PWD=%s",
                     afile, akey_path, pwd)
                 was_extracted = self.cache[akey_path].is_extracted
+                if not was_extracted:
+                    # read just this member, if the archive format allows
+                    # for that, instead of extracting the entire archive
+                    file_dir = op.dirname(file)
+                    if file_dir and not op.exists(file_dir):
+                        os.makedirs(file_dir)
+                    if self.cache[akey_path].extract_member(afile, file):
+                        return
+                # patool doesn't support extraction of a single file
+                #  https://github.com/wummel/patool/issues/20
+                # so extract everything into the cache
                 apath = self.cache[akey_path].get_extracted_file(afile)
                 link_file_load(apath, file)
                 if not was_extracted and self.cache[akey_path].is_extracted:
@@ -0,0 +1,238 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Support of the ASYNC extension of git-annex' special remote protocol
+
+With this extension a single special remote process serves all jobs of a
+git-annex process (e.g., `git annex get -J8`) concurrently, instead of
+git-annex starting one special remote process per job. After the extension
+was negotiated, every message of git-annex is prefixed with `J <n>`, where
+`<n>` identifies a job, and all replies and queries of the special remote
+that belong to a request of this job must carry the same prefix.
+"""
+
+__docformat__ = 'restructuredtext'
+
+import logging
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+
+from annexremote import (
+    Master,
+    NotLinkedError,
+    Protocol,
+    UnexpectedMessage,
+    UnsupportedRequest,
+)
+
+lgr = logging.getLogger('datalad.customremotes.asyncmaster')
+
+
+class AsyncProtocol(Protocol):
+    """Protocol that offers the ASYNC extension to git-annex
+
+    The extension is only offered if the remote declares `supports_async`,
+    and git-annex supports it, too.
+
+    Only the requests in `concurrent_requests` are executed concurrently.
+    All other requests are serialized. As git-annex sends PREPARE for every
+    job, a successful preparation is only done once.
+    """
+    concurrent_requests = frozenset(
+        ('TRANSFER', 'CHECKPRESENT', 'REMOVE', 'WHEREIS'))
+
+    def __init__(self, remote, master):
+        super().__init__(remote)
+        self.master = master
+        self._serial_lock = threading.RLock()
+        self._prepared = False
+
+    def command(self, line):
+        if line.split(' ', 1)[0].upper() in self.concurrent_requests:
+            return super().command(line)
+        with self._serial_lock:
+            return super().command(line)
+
+    def do_EXTENSIONS(self, param):
+        reply = super().do_EXTENSIONS(param)
+        if self.master.max_jobs > 1 \
+                and 'ASYNC' in self.extensions \
+                and getattr(self.remote, 'supports_async', False):
+            # all following messages of git-annex will be prefixed
+            self.master.async_enabled = True
+            reply += ' ASYNC'
+        return reply
+
+    def do_PREPARE(self):
+        if self._prepared:
+            return 'PREPARE-SUCCESS'
+        reply = super().do_PREPARE()
+        self._prepared = reply == 'PREPARE-SUCCESS'
+        return reply
+
+
+class AsyncMaster(Master):
+    """Master that serves the jobs of git-annex from a pool of threads
+
+    Messages of git-annex are read by the thread that called `Listen()`.
+    A message for a job that does not execute a request yet starts the
+    request in a worker thread. Any other message of a job is a reply to a
+    query of its request (e.g. GETCONFIG), and is passed to the worker.
+    All messages that a worker sends are prefixed with its job.
+
+    Without the ASYNC extension, the master behaves like `Master`.
+    """
+    def __init__(self, output=sys.stdout, max_jobs=1):
+        """
+        Parameters
+        ----------
+        output : io.TextIOBase
+          Where to send replies and special remote messages.
+        max_jobs : int
+          Maximum number of requests to execute concurrently. The ASYNC
+          extension is not offered for less than two jobs.
+        """
+        super().__init__(output=output)
+        self.max_jobs = max_jobs
+        self.async_enabled = False
+        self._local = threading.local()
+        self._output_lock = threading.Lock()
+        # queues for the replies to queries, of all jobs that are executing
+        # a request
+        self._active_jobs = {}
+        self._jobs_lock = threading.Lock()
+        self._failed = False
+
+    def LinkRemote(self, remote):
+        self.remote = remote
+        self.protocol = AsyncProtocol(remote, self)
+
+    def Listen(self, input=sys.stdin):
+        if not (hasattr(self, "remote") and hasattr(self, "protocol")):
+            raise NotLinkedError("Please execute LinkRemote(remote) first.")
+
+        self.input = input
+        self._send(self.protocol.version)
+        executor = None
+        try:
+            while not self._failed:
+                line = self.input.readline()
+                if not line:
+                    break
+                line = line.rstrip()
+                if self.async_enabled and line.startswith('J '):
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            self.max_jobs,
+                            thread_name_prefix='datalad-annex-job')
+                    self._dispatch(executor, line)
+                else:
+                    reply = self._execute(line)
+                    if reply:
+                        self._send(reply)
+        finally:
+            if executor is not None:
+                if self._failed:
+                    # do not let workers wait for replies that will not come
+                    with self._jobs_lock:
+                        for replies in self._active_jobs.values():
+                            replies.put(None)
+                executor.shutdown(wait=True)
+        if self._failed:
+            raise SystemExit
+
+    def _dispatch(self, executor, line):
+        try:
+            _, job, message = line.split(' ', 2)
+        except ValueError:
+            self.error(f"Invalid message: {line}")
+            self._failed = True
+            return
+        with self._jobs_lock:
+            replies = self._active_jobs.get(job)
+            if replies is None:
+                self._active_jobs[job] = Queue()
+        if replies is None:
+            executor.submit(self._execute_job, job, message)
+        else:
+            replies.put(message)
+
+    def _execute_job(self, job, request):
+        self._local.job = job
+        try:
+            try:
+                reply = self._execute(request)
+            finally:
+                # the job must be idle before the reply is sent, git-annex
+                # might reuse it right away
+                with self._jobs_lock:
+                    del self._active_jobs[job]
+            if reply:
+                self._send(reply)
+        finally:
+            self._local.job = None
+
+    def _execute(self, request):
+        try:
+            return self.protocol.command(request)
+        except UnsupportedRequest:
+            return "UNSUPPORTED-REQUEST"
+        except Exception as e:
+            self._fail(e)
+
+    def _fail(self, exc):
+        for line in traceback.format_exc().splitlines():
+            self.debug(line)
+        self.error(exc)
+        self._failed = True
+
+    def _readline(self):
+        job = getattr(self._local, 'job', None)
+        if job is None:
+            return self.input.readline()
+        with self._jobs_lock:
+            replies = self._active_jobs[job]
+        line = replies.get()
+        if line is None:
+            raise UnexpectedMessage("Special remote is shutting down")
+        return line
+
+    def _ask(self, request, reply_keyword, reply_count):
+        self._send(request)
+        line = self._readline().rstrip().split(" ", reply_count)
+        if line and line[0] == reply_keyword:
+            line.extend([""] * (reply_count + 1 - len(line)))
+            return line[1:]
+        raise UnexpectedMessage(
+            f"Expected {reply_keyword} and {reply_count} values. Got {line}")
+
+    def _askvalues(self, request):
+        self._send(request)
+        reply = []
+        while True:
+            line = self._readline().rstrip().split(" ", 1)
+            if len(line) == 2 and line[0] == "VALUE":
+                reply.append(line[1])
+            elif len(line) == 1 and line[0] == "VALUE":
+                return reply
+            else:
+                raise UnexpectedMessage("Expected VALUE {value}")
+
+    def _send(self, *args, **kwargs):
+        job = getattr(self._local, 'job', None)
+        with self._output_lock:
+            if job is None:
+                super()._send(*args, **kwargs)
+                return
+            # a reply can consist of multiple lines, e.g. for GETINFO
+            for line in " ".join(str(a) for a in args).split("\n"):
+                print("J", job, line, file=self.output)
+            self.output.flush()
@@ -49,7 +49,15 @@ def _main(args, cls):
     """Unprotected portion"""
     assert(cls is not None)
     from annexremote import Master
-    master = Master()
+    max_jobs = 0
+    if getattr(cls, 'supports_async', False):
+        from datalad import cfg
+        max_jobs = cfg.obtain('datalad.customremotes.async-jobs')
+    if max_jobs > 1:
+        from datalad.customremotes.asyncmaster import AsyncMaster
+        master = AsyncMaster(max_jobs=max_jobs)
+    else:
+        master = Master()
     remote = cls(master)
     master.LinkRemote(remote)
     master.Listen()
@@ -0,0 +1,115 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Tests for the ASYNC protocol extension of special remotes"""
+
+import threading
+from io import StringIO
+
+from annexremote import (
+    RemoteError,
+    SpecialRemote,
+)
+
+from datalad.tests.utils_pytest import (
+    assert_in,
+    eq_,
+)
+
+from ..asyncmaster import AsyncMaster
+
+
+class _Remote(SpecialRemote):
+    supports_async = True
+
+    def __init__(self, annex):
+        super().__init__(annex)
+        self.prepare_count = 0
+        self.threads = set()
+        # all jobs must wait for each other, which only works if they
+        # execute concurrently
+        self.barrier = threading.Barrier(2, timeout=10)
+
+    def initremote(self):
+        pass
+
+    def prepare(self):
+        self.prepare_count += 1
+
+    def transfer_store(self, key, local_file):
+        raise RemoteError('read-only')
+
+    def transfer_retrieve(self, key, local_file):
+        self.threads.add(threading.get_ident())
+        self.annex.progress(10)
+        self.barrier.wait()
+
+    def checkpresent(self, key):
+        self.threads.add(threading.get_ident())
+        # a query, that is answered in the input stream
+        return self.annex.getconfig(key) == 'yes'
+
+    def remove(self, key):
+        pass
+
+
+def _listen(input, max_jobs=2):
+    output = StringIO()
+    master = AsyncMaster(output=output, max_jobs=max_jobs)
+    remote = _Remote(master)
+    master.LinkRemote(remote)
+    master.Listen(input=StringIO(input))
+    return master, remote, output.getvalue().splitlines()
+
+
+def test_async_master():
+    master, remote, output = _listen(
+        'EXTENSIONS INFO ASYNC\n'
+        'J 1 PREPARE\n'
+        'J 2 PREPARE\n'
+        'J 1 TRANSFER RETRIEVE key1 file1\n'
+        'J 2 TRANSFER RETRIEVE key2 file2\n'
+        'J 3 CHECKPRESENT key3\n'
+        'J 3 VALUE yes\n'
+        'J 4 TRANSFER STORE key4 file4\n'
+        'J 5 BOGUS\n'
+    )
+    assert master.async_enabled
+    eq_(output[:2], ['VERSION 1', 'EXTENSIONS ASYNC'])
+    for line in (
+            'J 1 PREPARE-SUCCESS',
+            'J 2 PREPARE-SUCCESS',
+            'J 1 PROGRESS 10',
+            'J 2 PROGRESS 10',
+            'J 1 TRANSFER-SUCCESS RETRIEVE key1',
+            'J 2 TRANSFER-SUCCESS RETRIEVE key2',
+            'J 3 GETCONFIG key3',
+            'J 3 CHECKPRESENT-SUCCESS key3',
+            'J 4 TRANSFER-FAILURE STORE key4 read-only',
+            'J 5 UNSUPPORTED-REQUEST'):
+        assert_in(line, output)
+    # prepared only once
+    eq_(remote.prepare_count, 1)
+    # the two retrievals waited for each other
+    assert len(remote.threads) > 1
+
+
+def test_async_master_no_async():
+    # git-annex does not support ASYNC, or it is disabled
+    for extensions, max_jobs in (('INFO', 2), ('INFO ASYNC', 1)):
+        master, remote, output = _listen(
+            f'EXTENSIONS {extensions}\n'
+            'PREPARE\n'
+            'CHECKPRESENT key1\n'
+            'VALUE no\n',
+            max_jobs=max_jobs,
+        )
+        assert not master.async_enabled
+        eq_(output,
+            ['VERSION 1', 'EXTENSIONS', 'PREPARE-SUCCESS',
+             'GETCONFIG key1', 'CHECKPRESENT-FAILURE key1'])
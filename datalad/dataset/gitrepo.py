@@ -34,6 +34,7 @@ from weakref import (
 )
 
 from datalad.cmd import (
+    BatchedCommand,
     GitWitlessRunner,
     StdOutErrCapture,
 )
@@ -120,12 +121,15 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
         pass
 
     @classmethod
-    def _cleanup(cls, path):
+    def _cleanup(cls, path, cat_file=None):
         # Ben: I think in case of GitRepo there's nothing to do ATM. Statements
         #      like the one in the out commented __del__ above, don't make sense
         #      with python's GC, IMO, except for manually resolving cyclic
         #      references (not the case w/ ConfigManager ATM).
         lgr.log(1, "Finalizer called on: GitRepo(%s)", path)
+        # the only resources held are long-running `git cat-file` processes
+        if cat_file is not None:
+            cat_file.close()
 
     def __hash__(self):
         # the flyweight key is already determining unique instances
@@ -153,13 +157,20 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
 
         self._line_splitter = None
 
+        # long-running `git cat-file --batch[-check]` processes, created
+        # on demand. Kept in a separate object, such that others (like a
+        # ConfigManager) can use them without referencing the repository
+        self._cat_file = CatFileProcesses(
+            str(self.pathobj), self._git_cmd_prefix)
+
         # Finally, register a finalizer (instead of having a __del__ method).
         # This will be called by garbage collection as well as "atexit". By
         # keeping the reference here, we can also call it explicitly.
         # Note, that we can pass required attributes to the finalizer, but not
         # `self` itself. This would create an additional reference to the object
         # and thereby preventing it from being collected at all.
-        self._finalizer = finalize(self, GitRepo._cleanup, self.pathobj)
+        self._finalizer = finalize(self, GitRepo._cleanup, self.pathobj,
+                                   self._cat_file)
 
     def __eq__(self, obj):
         """Decides whether or not two instances of this class are equal.
@@ -705,10 +716,138 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
                         fields, props))
             yield dict(zip(fields, props))
 
+    def check_objects_(self, objects):
+        """Query type and size of objects via `git cat-file --batch-check`
+
+        All queries are served by a single, long-running process that is
+        reused across calls. This makes it cheap to query large numbers of
+        objects, compared to one `git cat-file` call per object.
+
+        Parameters
+        ----------
+        objects : iterable
+          Object names in any form understood by `git cat-file`, such as
+          SHAs, refs, or `<tree-ish>:<path>` specifications. Object names
+          must not contain newlines.
+
+        Yields
+        ------
+        dict
+          With keys 'object' (the name as given), and 'objectname',
+          'objecttype', and 'objectsize'. The latter three have a value of
+          None, if the object is not known.
+        """
+        return self._cat_file.check_objects_(objects)
+
+    def cat_objects_(self, objects):
+        """Read objects via `git cat-file --batch`
+
+        Like `check_objects_()`, but additionally reports the content of
+        an object. All queries are served by a single, long-running
+        process that is reused across calls.
+
+        Object content is read as bytes, and decoded if it is text (e.g.
+        blobs of text files, commits, tags). Any other content (e.g. trees
+        or binary blobs) is reported undecoded.
+
+        Parameters
+        ----------
+        objects : iterable
+          Object names in any form understood by `git cat-file`. Object
+          names must not contain newlines.
+
+        Yields
+        ------
+        dict
+          Like `check_objects_()`, but with an additional 'content' key
+          that holds the decoded object content (str), the raw content
+          (bytes) if it cannot be decoded, or None if the object is not
+          known.
+        """
+        return self._cat_file.cat_objects_(objects)
+
+
+class CatFileProcesses(dict):
+    """Long-running `git cat-file --batch[-check]` processes of a repository
+
+    Processes are started on first use, and are keyed by their mode
+    ('batch', or 'batch-check'). See `GitRepo.check_objects_()` and
+    `GitRepo.cat_objects_()` for the query methods.
+    """
+    def __init__(self, path, git_cmd_prefix):
+        super().__init__()
+        self.path = path
+        self.git_cmd_prefix = git_cmd_prefix
+        self._lock = threading.Lock()
+
+    def check_objects_(self, objects):
+        for obj in objects:
+            yield dict(self._query('batch-check', obj), object=obj)
+
+    def cat_objects_(self, objects):
+        for obj in objects:
+            yield dict(self._query('batch', obj), object=obj)
+
+    def close(self):
+        for bcmd in self.values():
+            try:
+                bcmd.close()
+            except (TypeError, ImportError) as e:
+                # we might be too late in the game at interpreter shutdown
+                lgr.debug("Failed to close %s: %s", bcmd, e)
+
+    def _query(self, mode, obj):
+        with self._lock:
+            bcmd = self.get(mode)
+            if bcmd is None:
+                bcmd = BatchedCommand(
+                    self.git_cmd_prefix + ['cat-file', '--{}'.format(mode)],
+                    path=self.path,
+                    output_proc=_read_cat_file_batch_check
+                    if mode == 'batch-check' else _read_cat_file_batch,
+                    # content is read by size, and is not necessarily text
+                    binary_output=mode == 'batch',
+                )
+                self[mode] = bcmd
+            return bcmd(obj)
+
 
 #
 # Internal helpers
 #
+def _parse_cat_file_header(line):
+    """Parse an object header line reported by `git cat-file --batch*`"""
+    line = line.rstrip('\n')
+    if line.endswith((' missing', ' ambiguous')):
+        lgr.debug('git cat-file reported: %s', line)
+        return dict(objectname=None, objecttype=None, objectsize=None)
+    objectname, objecttype, objectsize = line.split(' ')
+    return dict(
+        objectname=objectname,
+        objecttype=objecttype,
+        objectsize=int(objectsize),
+    )
+
+
+def _read_cat_file_batch_check(stdout):
+    return _parse_cat_file_header(stdout.readline())
+
+
+def _read_cat_file_batch(stdout):
+    encoding = stdout.batched_command.encoding
+    rec = _parse_cat_file_header(stdout.readline().decode(encoding))
+    if rec['objectsize'] is None:
+        rec['content'] = None
+        return rec
+    # the content is terminated by an additional LF
+    content = stdout.read(rec['objectsize'] + 1)[:-1]
+    try:
+        rec['content'] = content.decode(encoding)
+    except UnicodeDecodeError:
+        rec['content'] = content
+    return rec
+
+
 def _get_dot_git(pathobj, *, ok_missing=False, resolved=False):
     """Given a pathobj to a repository return path to the .git directory
 
@@ -376,3 +376,58 @@ def test_call_git_call_git_items_identity(temp_dir=None):
         r_no_item = repo.call_git(args, [hash_key])
         assert_equal(r_item, r_no_item)
         assert_equal(r_item, content)
+
+
+@with_tree(tree=dict(example_tree, multi="ümlaut\r\nno final newline"))
+def test_cat_objects(temp_dir=None):
+    repo, (hash1, hash2) = _create_test_gitrepo(temp_dir)
+
+    checked = list(repo.check_objects_(
+        ["HEAD:file1", hash2, "HEAD:notthere", "HEAD"]))
+    eq_([c['object'] for c in checked],
+        ["HEAD:file1", hash2, "HEAD:notthere", "HEAD"])
+    eq_(checked[0], dict(object="HEAD:file1", objectname=hash1,
+                         objecttype="blob", objectsize=len(file1_content)))
+    eq_(checked[1]['objectname'], hash2)
+    eq_(checked[2], dict(object="HEAD:notthere", objectname=None,
+                         objecttype=None, objectsize=None))
+    eq_(checked[3]['objecttype'], "commit")
+
+    objs = list(repo.cat_objects_(
+        ["HEAD:file1", "HEAD:notthere", hash2, "HEAD:multi", "HEAD"]))
+    eq_([o['content'] for o in objs[:4]],
+        [file1_content, None, file2_content,
+         "ümlaut\r\nno final newline"])
+    assert_in("\n\ntest commit", objs[4]['content'])
+
+    # a single process per query type serves all requests
+    eq_(sorted(repo._cat_file), ["batch", "batch-check"])
+    procs = {k: v.generator.runner.process.pid
+             for k, v in repo._cat_file.items()}
+    list(repo.check_objects_(["HEAD"]))
+    list(repo.cat_objects_(["HEAD"]))
+    eq_(procs, {k: v.generator.runner.process.pid
+                for k, v in repo._cat_file.items()})
+
+    # processes are closed with the repository
+    repo._finalizer()
+    ok_(all(v.runner is None for v in repo._cat_file.values()))
+
+
+@with_tree(tree=example_tree)
+def test_cat_objects_binary(temp_dir=None):
+    repo, (hash1, _) = _create_test_gitrepo(temp_dir)
+    # invalid UTF-8, and a size that is not aligned to any line
+    binary_content = b"\xff\xfe\x00\x80binary\n\xc3"
+    with open(op.join(temp_dir, "binary"), "wb") as f:
+        f.write(binary_content)
+    repo.call_git(["add", "binary"])
+    repo.call_git(["commit", "-m", "add binary"])
+
+    objs = list(repo.cat_objects_(["HEAD:binary", "HEAD:file1", "HEAD^{tree}"]))
+    eq_(objs[0]['content'], binary_content)
+    eq_(objs[0]['objectsize'], len(binary_content))
+    # the process is still in sync after binary content
+    eq_(objs[1]['content'], file1_content)
+    assert_is_instance(objs[2]['content'], bytes)
+    repo._finalizer()
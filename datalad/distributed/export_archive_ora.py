@@ -14,11 +14,11 @@ __docformat__ = 'restructuredtext'
 import logging
 import os
 import os.path as op
-import shutil
 import subprocess
 from argparse import REMAINDER
 
 from datalad.utils import (
+    copy_file_content,
     ensure_list,
     rmtree,
 )
@@ -241,7 +241,7 @@ class ExportArchiveORA(Interface):
                     str(keypath))
                 # no hard links supported
                 # switch function after first error
-                link_fx = shutil.copyfile
+                link_fx = copy_file_content
                 link_fx(str(keypath), str(keydir / key))
 
         log_progress(
@@ -12,6 +12,7 @@ import shutil
 from shlex import quote as sh_quote
 import subprocess
 import logging
+import threading
 from functools import wraps
 
 from datalad import ssh_manager
@@ -37,6 +38,7 @@ from datalad.customremotes.ria_utils import (
     verify_ria_url,
 )
 from datalad.utils import (
+    copy_file_content,
     ensure_write_permission,
     on_osx
 )
@@ -106,9 +108,37 @@ class RIARemoteError(RemoteError):
     pass
 
 
+def _parse_7z_members(lines):
+    """Yield the member paths from the output of `7z l -slt`
+
+    The archive itself is reported with a 'Path = ' line too, but before
+    the separator line that precedes the member listing.
+    """
+    members = False
+    for line in lines:
+        if line == '----------':
+            members = True
+        elif members and line.startswith('Path = '):
+            yield line[7:]
+
+
 class IOBase(object):
     """Abstract class with the desired API for local/remote operations"""
 
+    def __init__(self, persist_archive_toc=False):
+        """
+        Parameters
+        ----------
+        persist_archive_toc : bool, optional
+          Whether to store the table of contents of an archive next to it
+          (as '<archive>.toc'), in order to reuse it across sessions, see
+          `get_archive_toc()`.
+        """
+        self.persist_archive_toc = persist_archive_toc
+        # table of contents per archive path, for the lifetime of this
+        # instance
+        self._archive_tocs = {}
+
     def get_7z(self):
         raise NotImplementedError
 
@@ -124,6 +154,11 @@ class IOBase(object):
     def get(self, src, dst, progress_cb):
         raise NotImplementedError
 
+    def mkdir_many(self, paths):
+        """Create multiple directories, including their parents"""
+        for path in paths:
+            self.mkdir(path)
+
     def rename(self, src, dst):
         raise NotImplementedError
 
@@ -149,6 +184,9 @@ class IOBase(object):
     def in_archive(self, archive_path, file_path):
         """Test whether a file is in an archive
 
+        The archive is only listed once, subsequent tests are served from
+        its table of contents (see `get_archive_toc()`).
+
         Parameters
         ----------
         archive_path : Path or str
@@ -157,6 +195,91 @@ class IOBase(object):
           Must be a relative Path (relative to the root
           of the archive)
         """
+        toc = self.get_archive_toc(archive_path)
+        return toc is not None and str(file_path) in toc
+
+    def get_archive_toc(self, archive_path):
+        """Get the paths of all members of an archive
+
+        The table of contents is cached for the lifetime of this instance.
+        If `persist_archive_toc` is set, it is also read from, or written
+        to, '<archive>.toc'. A stored table of contents is only used, if it
+        was created for an archive with the same modification time and size.
+
+        Parameters
+        ----------
+        archive_path : Path
+          Must be an absolute path
+
+        Returns
+        -------
+        frozenset or None
+          Relative paths of all archive members, or None if the archive
+          does not exist.
+        """
+        cache_key = str(archive_path)
+        if cache_key not in self._archive_tocs:
+            self._archive_tocs[cache_key] = \
+                self._load_archive_toc(archive_path)
+        return self._archive_tocs[cache_key]
+
+    def _load_archive_toc(self, archive_path):
+        signature = self.get_archive_signature(archive_path)
+        if signature is None:
+            # no archive
+            return None
+        toc_path = archive_path.with_name(archive_path.name + '.toc')
+        if self.persist_archive_toc:
+            try:
+                lines = self.read_file(toc_path).splitlines()
+            except Exception as e:
+                lgr.debug("No table of contents for %s: %s",
+                          archive_path, CapturedException(e))
+                lines = []
+            if lines and lines[0] == signature:
+                return frozenset(lines[1:])
+        toc = frozenset(self.list_archive(archive_path))
+        if self.persist_archive_toc and toc:
+            # write to a temporary file first, concurrent sessions might
+            # try to read it
+            tmp_path = toc_path.with_name(
+                '{}.{}'.format(toc_path.name, os.getpid()))
+            try:
+                self.write_file(tmp_path, '\n'.join([signature, *sorted(toc)]))
+                self.rename(tmp_path, toc_path)
+            except Exception as e:
+                lgr.debug("Could not store table of contents of %s: %s",
+                          archive_path, CapturedException(e))
+        return toc
+
+    def get_archive_signature(self, archive_path):
+        """Get a string that identifies the state of an archive
+
+        Parameters
+        ----------
+        archive_path : Path or str
+          Must be an absolute path
+
+        Returns
+        -------
+        str or None
+          Modification time and size of the archive, or None if the archive
+          does not exist.
+        """
+        raise NotImplementedError
+
+    def list_archive(self, archive_path):
+        """Get the paths of all members of an existing archive
+
+        Parameters
+        ----------
+        archive_path : Path or str
+          Must be an absolute path and point to an existing supported archive
+
+        Returns
+        -------
+        list of str
+        """
         raise NotImplementedError
 
     def read_file(self, file_path):
@@ -202,23 +325,23 @@ class LocalIO(IOBase):
         os.symlink(target, link_name)
 
     def put(self, src, dst, progress_cb):
-        shutil.copy(
-            str(src),
-            str(dst),
-        )
+        self._copy(src, dst)
 
     def get(self, src, dst, progress_cb):
-        shutil.copy(
-            str(src),
-            str(dst),
-        )
+        self._copy(src, dst)
+
+    @staticmethod
+    def _copy(src, dst):
+        # like shutil.copy(), but with copy-on-write where possible
+        copy_file_content(src, dst)
+        shutil.copymode(str(src), str(dst))
 
     def get_from_archive(self, archive, src, dst, progress_cb):
         # Upfront check to avoid cryptic error output
         # https://github.com/datalad/datalad/issues/4336
-        if not self.exists(archive):
-            raise RIARemoteError("archive {arc} does not exist."
-                                 "".format(arc=archive))
+        if not self.in_archive(archive, src):
+            raise RIARemoteError("{src} not in archive {arc}."
+                                 "".format(src=src, arc=archive))
 
         # this requires python 3.5
         with open(dst, 'wb') as target_file:
@@ -253,24 +376,24 @@ class LocalIO(IOBase):
     def exists(self, path):
         return path.exists()
 
-    def in_archive(self, archive_path, file_path):
-        if not archive_path.exists():
-            # no archive, not file
-            return False
-        loc = str(file_path)
+    def get_archive_signature(self, archive_path):
+        try:
+            st = os.stat(archive_path)
+        except FileNotFoundError:
+            return None
+        return '{} {}'.format(int(st.st_mtime), st.st_size)
+
+    def list_archive(self, archive_path):
         from datalad.cmd import (
             StdOutErrCapture,
             WitlessRunner,
         )
         runner = WitlessRunner()
-        # query 7z for the specific object location, keeps the output
-        # lean, even for big archives
         out = runner.run(
-            ['7z', 'l', str(archive_path),
-             loc],
+            ['7z', 'l', '-slt', str(archive_path)],
             protocol=StdOutErrCapture,
         )
-        return loc in out['stdout']
+        return list(_parse_7z_members(out['stdout'].splitlines()))
 
     def read_file(self, file_path):
 
@@ -315,14 +438,20 @@ class SSHRemoteIO(IOBase):
     """IO operation if the object tree is SSH-accessible
 
     It doesn't even think about a windows server.
+
+    Commands are executed in a remote shell. Every thread uses its own
+    shell, all of them share a single (multiplexed) SSH connection.
     """
 
     # output markers to detect possible command failure as well as end of output
     # from a particular command:
     REMOTE_CMD_FAIL = "ora-remote: end - fail"
     REMOTE_CMD_OK = "ora-remote: end - ok"
+    # maximum number of commands that are sent, before their output is read
+    pipeline_size = 100
 
-    def __init__(self, host, buffer_size=DEFAULT_BUFFER_SIZE):
+    def __init__(self, host, buffer_size=DEFAULT_BUFFER_SIZE,
+                 persist_archive_toc=False):
         """
         Parameters
         ----------
@@ -330,6 +459,7 @@ class SSHRemoteIO(IOBase):
           SSH-accessible host(name) to perform remote IO operations
           on.
         """
+        super().__init__(persist_archive_toc=persist_archive_toc)
 
         # the connection to the remote
         # we don't open it yet, not yet clear if needed
@@ -338,34 +468,55 @@ class SSHRemoteIO(IOBase):
             use_remote_annex_bundle=False,
         )
         self.ssh.open()
+        # all open remote shells, and the one of the current thread
+        self._shells = []
+        self._shells_lock = threading.Lock()
+        self._local = threading.local()
         # open a remote shell
+        self.shell
+
+        # make sure default is used when None was passed, too.
+        self.buffer_size = buffer_size if buffer_size else DEFAULT_BUFFER_SIZE
+
+    @property
+    def shell(self):
+        """Remote shell of the current thread, opened on first access"""
+        shell = getattr(self._local, 'shell', None)
+        if shell is None or shell not in self._shells:
+            shell = self._local.shell = self._open_shell()
+        return shell
+
+    def _open_shell(self):
         cmd = ['ssh'] + self.ssh._ssh_args + [self.ssh.sshri.as_str()]
-        self.shell = subprocess.Popen(cmd,
-                                      stderr=subprocess.DEVNULL,
-                                      stdout=subprocess.PIPE,
-                                      stdin=subprocess.PIPE)
+        shell = subprocess.Popen(cmd,
+                                 stderr=subprocess.DEVNULL,
+                                 stdout=subprocess.PIPE,
+                                 stdin=subprocess.PIPE)
         # swallow login message(s):
-        self.shell.stdin.write(b"echo RIA-REMOTE-LOGIN-END\n")
-        self.shell.stdin.flush()
+        shell.stdin.write(b"echo RIA-REMOTE-LOGIN-END\n")
+        shell.stdin.flush()
         while True:
-            line = self.shell.stdout.readline()
+            line = shell.stdout.readline()
             if line == b"RIA-REMOTE-LOGIN-END\n":
                 break
         # TODO: Same for stderr?
-
-        # make sure default is used when None was passed, too.
-        self.buffer_size = buffer_size if buffer_size else DEFAULT_BUFFER_SIZE
+        with self._shells_lock:
+            self._shells.append(shell)
+        return shell
 
     def close(self):
-        # try exiting shell clean first
-        self.shell.stdin.write(b"exit\n")
-        self.shell.stdin.flush()
-        exitcode = self.shell.wait(timeout=0.5)
-        # be more brutal if it doesn't work
-        if exitcode is None:  # timed out
-            # TODO: Theoretically terminate() can raise if not successful.
-            #       How to deal with that?
-            self.shell.terminate()
+        with self._shells_lock:
+            shells, self._shells = self._shells, []
+        for shell in shells:
+            # try exiting shell clean first
+            shell.stdin.write(b"exit\n")
+            shell.stdin.flush()
+            exitcode = shell.wait(timeout=0.5)
+            # be more brutal if it doesn't work
+            if exitcode is None:  # timed out
+                # TODO: Theoretically terminate() can raise if not successful.
+                #       How to deal with that?
+                shell.terminate()
 
     def _append_end_markers(self, cmd):
         """Append end markers to remote command"""
@@ -428,7 +579,29 @@ class SSHRemoteIO(IOBase):
             raise RIARemoteError("invalid key: {}".format(key))
 
     def _run(self, cmd, no_output=True, check=False):
+        return self._run_many([cmd], no_output=no_output, check=check)[0]
+
+    def _run_many(self, cmds, no_output=True, check=False):
+        """Run multiple commands in the remote shell
+
+        The commands are pipelined, i.e. up to `pipeline_size` commands are
+        sent before their responses are read in order, which costs a single
+        round trip.
+
+        Parameters
+        ----------
+        cmds : list of str
+        no_output : bool
+          If set, any output of a command is an error.
+        check : bool
+          If set, a failed command is an error. It is raised after the
+          responses of all commands were read.
 
+        Returns
+        -------
+        list of str
+          Output of each command.
+        """
         # TODO: we might want to redirect stderr to stdout here (or have
         #       additional end marker in stderr) otherwise we can't empty stderr
         #       to be ready for next command. We also can't read stderr for
@@ -436,28 +609,43 @@ class SSHRemoteIO(IOBase):
         #       something to read in any case (it's blocking!).
         #       However, if we are sure stderr can only ever happen if we would
         #       raise RemoteError anyway, it might be okay.
-        call = self._append_end_markers(cmd)
-        self.shell.stdin.write(call.encode())
-        self.shell.stdin.flush()
+        responses = []
+        for i in range(0, len(cmds), self.pipeline_size):
+            calls = [self._append_end_markers(cmd)
+                     for cmd in cmds[i:i + self.pipeline_size]]
+            self.shell.stdin.write(''.join(calls).encode())
+            self.shell.stdin.flush()
+            responses.extend(
+                (call, self._read_response()) for call in calls)
+
+        outputs = []
+        for cmd, (call, (success, lines)) in zip(cmds, responses):
+            if check and not success:
+                raise RemoteCommandFailedError(
+                    "{cmd} failed: {msg}".format(cmd=cmd,
+                                                 msg="".join(lines[:-1]))
+                )
+            if no_output and len(lines) > 1:
+                raise RIARemoteError("{}: {}".format(call, "".join(lines)))
+            outputs.append("".join(lines[:-1]))
+        return outputs
 
+    def _read_response(self):
+        """Read the output of a command up to, and including, its end marker
+
+        Returns
+        -------
+        (bool, list of str)
+          Whether the command succeeded, and its output lines.
+        """
         lines = []
         while True:
             line = self.shell.stdout.readline().decode()
             lines.append(line)
             if line == self.REMOTE_CMD_OK + '\n':
-                # end reading
-                break
+                return True, lines
             elif line == self.REMOTE_CMD_FAIL + '\n':
-                if check:
-                    raise RemoteCommandFailedError(
-                        "{cmd} failed: {msg}".format(cmd=cmd,
-                                                     msg="".join(lines[:-1]))
-                    )
-                else:
-                    break
-        if no_output and len(lines) > 1:
-            raise RIARemoteError("{}: {}".format(call, "".join(lines)))
-        return "".join(lines[:-1])
+                return False, lines
 
     @contextmanager
     def ensure_writeable(self, path):
@@ -510,6 +698,11 @@ class SSHRemoteIO(IOBase):
     def mkdir(self, path):
         self._run('mkdir -p {}'.format(sh_quote(str(path))))
 
+    def mkdir_many(self, paths):
+        if paths:
+            self._run('mkdir -p {}'.format(
+                ' '.join(sh_quote(str(p)) for p in paths)))
+
     def symlink(self, target, link_name):
         self._run('ln -s {} {}'.format(sh_quote(str(target)), sh_quote(str(link_name))))
 
@@ -517,14 +710,7 @@ class SSHRemoteIO(IOBase):
         self.ssh.put(str(src), str(dst))
 
     def get(self, src, dst, progress_cb):
-
-        # Note, that as we are in blocking mode, we can't easily fail on the
-        # actual get (that is 'cat').
-        # Therefore check beforehand.
-        if not self.exists(src):
-            raise RIARemoteError("annex object {src} does not exist."
-                                 "".format(src=src))
-
+        # The file is streamed through the remote shell
         from os.path import basename
         key = basename(str(src))
         try:
@@ -534,11 +720,31 @@ class SSHRemoteIO(IOBase):
 
         if size is None:
             # rely on SCP for now
+            if not self.exists(src):
+                raise RIARemoteError("annex object {src} does not exist."
+                                     "".format(src=src))
             self.ssh.get(str(src), str(dst))
             return
 
-        # TODO: see get_from_archive()
+        # Note, that as we are in blocking mode, we can't easily fail on
+        # the actual get (that is 'cat'). Therefore a marker reports
+        # whether the file can be read, before the content follows. This
+        # costs a single round trip, instead of a preceding `exists` call.
+        self.shell.stdin.write(
+            "if test -r {src}; then printf '%s\\n' {ok}; cat {src}; "
+            "else printf '%s\\n' {fail}; fi\n".format(
+                src=sh_quote(str(src)),
+                ok=sh_quote(self.REMOTE_CMD_OK),
+                fail=sh_quote(self.REMOTE_CMD_FAIL)).encode())
+        self.shell.stdin.flush()
+        marker = self.shell.stdout.readline().decode()
+        if marker != self.REMOTE_CMD_OK + '\n':
+            raise RIARemoteError(
+                "annex object {src} does not exist or is not readable."
+                "".format(src=src))
+        self._receive(dst, size, progress_cb)
 
+    def _receive(self, dst, size, progress_cb):
         # TODO: Currently we will hang forever if the file isn't readable and
         #       it's supposed size is bigger than whatever cat spits out on
         #       stdout. This is because we don't notice that cat has exited
@@ -547,17 +753,15 @@ class SSHRemoteIO(IOBase):
         #       earlier calls. This is a problem with blocking reading, since we
         #       need to make sure there's actually something to read in any
         #       case.
-        cmd = 'cat {}'.format(sh_quote(str(src)))
-        self.shell.stdin.write(cmd.encode())
-        self.shell.stdin.write(b"\n")
-        self.shell.stdin.flush()
-
         with open(dst, 'wb') as target_file:
             bytes_received = 0
             while bytes_received < size:
                 # TODO: some additional abortion criteria? check stderr in
                 #       addition?
-                c = self.shell.stdout.read1(self.buffer_size)
+                # never read beyond the file, the output of the next command
+                # might follow
+                c = self.shell.stdout.read1(
+                    min(self.buffer_size, size - bytes_received))
                 # no idea yet, whether or not there's sth to gain by a
                 # sophisticated determination of how many bytes to read at once
                 # (like size - bytes_received)
@@ -589,35 +793,40 @@ class SSHRemoteIO(IOBase):
         except RemoteCommandFailedError:
             return False
 
-    def in_archive(self, archive_path, file_path):
-
-        if not self.exists(archive_path):
-            return False
-
-        loc = str(file_path)
-        # query 7z for the specific object location, keeps the output
-        # lean, even for big archives
-        cmd = '7z l {} {}'.format(
-            sh_quote(str(archive_path)),
-            sh_quote(loc))
+    def get_archive_signature(self, archive_path):
+        if on_osx:
+            format_option = "-f '%m %z'"
+        else:
+            format_option = "--format='%Y %s'"
+        try:
+            return self._run(
+                'stat {} {}'.format(format_option,
+                                    sh_quote(str(archive_path))),
+                no_output=False, check=True).strip()
+        except RemoteCommandFailedError:
+            return None
 
-        # Note: Currently relies on file_path not showing up in case of failure
-        # including non-existent archive. If need be could be more sophisticated
-        # and called with check=True + catch RemoteCommandFailedError
+    def list_archive(self, archive_path):
+        # only transfer the member paths, the full listing is an order of
+        # magnitude larger
+        # Note: Relies on no path showing up in case of failure. The
+        # table of contents is then empty, and not persisted.
+        cmd = "7z l -slt {} | sed -n '/^----------$/,$ s/^Path = //p'".format(
+            sh_quote(str(archive_path)))
         out = self._run(cmd, no_output=False, check=False)
-
-        return loc in out
+        return out.splitlines()
 
     def get_from_archive(self, archive, src, dst, progress_cb):
 
         # Note, that as we are in blocking mode, we can't easily fail on the
-        # actual get (that is 'cat'). Therefore check beforehand.
-        if not self.exists(archive):
-            raise RIARemoteError("archive {arc} does not exist."
-                                 "".format(arc=archive))
+        # actual get (that is 'cat'). Therefore check beforehand, this
+        # also covers a missing archive.
+        if not self.in_archive(archive, src):
+            raise RIARemoteError("{src} not in archive {arc}."
+                                 "".format(src=src, arc=archive))
 
         # TODO: We probably need to check exitcode on stderr (via marker). If
-        #       archive or content is missing we will otherwise hang forever
+        #       content cannot be extracted we will otherwise hang forever
         #       waiting for stdout to fill `size`.
 
         cmd = '7z x -so {} {}\n'.format(
@@ -628,21 +837,10 @@ class SSHRemoteIO(IOBase):
 
         # TODO: - size needs double-check and some robustness
         #       - can we assume src to be a posixpath?
-        #       - RF: Apart from the executed command this should be pretty much
-        #         identical to self.get(), so move that code into a common
-        #         function
 
         from os.path import basename
         size = self._get_download_size_from_key(basename(str(src)))
-
-        with open(dst, 'wb') as target_file:
-            bytes_received = 0
-            while bytes_received < size:
-                c = self.shell.stdout.read1(self.buffer_size)
-                if c:
-                    bytes_received += len(c)
-                    target_file.write(c)
-                    progress_cb(bytes_received)
+        self._receive(dst, size, progress_cb)
 
     def read_file(self, file_path):
 
@@ -815,14 +1013,17 @@ def handle_errors(func):
                     entry = "{time}: Error:\n{exc_str}\n" \
                             "".format(time=datetime.now(),
                                       exc_str=exc_str)
+                    with self._io_lock:
+                        io = self.io
+                        store_base_path = self.store_base_path
                     # ensure base path is platform path
                     log_target = (
-                        url_path2local_path(self.store_base_path)
+                        url_path2local_path(store_base_path)
                         / "error_logs"
                         / "{dsid}.{uuid}.log".format(
                             dsid=self.archive_id,
                             uuid=self._repo.uuid))
-                    self.io.write_file(log_target, entry, mode='a')
+                    io.write_file(log_target, entry, mode='a')
                 except Exception:
                     # If logging of the exception does fail itself, there's
                     # nothing we can do about it. Hence, don't log and report
@@ -838,13 +1039,16 @@ def handle_errors(func):
                 # the moment, this is only relevant for SSHRemoteIO, in which
                 # case it cleans up the SSH socket and prevents a hang with
                 # git-annex 8.20201103 and later.
+                # Other jobs might still be using io, when serving git-annex
+                # asynchronously. It is closed at exit then.
                 from atexit import unregister
-                if self._io:
-                    self._io.close()
-                    unregister(self._io.close)
-                if self._push_io:
-                    self._push_io.close()
-                    unregister(self._push_io.close)
+                if not getattr(self.annex, 'async_enabled', False):
+                    if self._io:
+                        self._io.close()
+                        unregister(self._io.close)
+                    if self._push_io:
+                        self._push_io.close()
+                        unregister(self._push_io.close)
             except AttributeError:
                 # seems like things are already being cleaned up -> a good
                 pass
@@ -873,6 +1077,8 @@ class ORARemote(SpecialRemote):
     # TODO: Move known versions. Needed by creation routines as well.
     known_versions_objt = ['1', '2']
     known_versions_dst = ['1']
+    # transfers of concurrent jobs use their own SSH shell (see SSHRemoteIO)
+    supports_async = True
 
     @handle_errors
     def __init__(self, annex):
@@ -906,6 +1112,8 @@ class ORARemote(SpecialRemote):
         self.force_write = None
         self.ignore_remote_config = None
         self.remote_log_enabled = None
+        # whether to store the table of contents of archives in the store
+        self.persist_archive_toc = None
         self.remote_dataset_tree_version = None
         self.remote_object_tree_version = None
 
@@ -916,6 +1124,8 @@ class ORARemote(SpecialRemote):
         # lazy IO:
         self._io = None
         self._push_io = None
+        # IO is set up by the first of possibly concurrent jobs
+        self._io_lock = threading.RLock()
 
         # cache obj_locations:
         self._last_archive_path = None
@@ -980,6 +1190,7 @@ class ORARemote(SpecialRemote):
         cfg_map = {"ora-force-write": "force_write",
                    "ora-ignore-ria-config": "ignore_remote_config",
                    "ora-buffer-size": "buffer_size",
+                   "ora-archive-toc": "persist_archive_toc",
                    "ora-url": "ria_store_url",
                    "ora-push-url": "ria_store_pushurl"
                    }
@@ -1004,6 +1215,16 @@ class ORARemote(SpecialRemote):
                                  f"'remote.{gitcfg_name}."
                                  f"ora-buffer-size': {self.buffer_size}")
                     self.buffer_size = DEFAULT_BUFFER_SIZE
+            if self.persist_archive_toc:
+                try:
+                    self.persist_archive_toc = \
+                        anything2bool(self.persist_archive_toc)
+                except TypeError:
+                    self.message(f"Invalid value of config "
+                                 f"'remote.{gitcfg_name}."
+                                 f"ora-archive-toc': "
+                                 f"{self.persist_archive_toc}")
+                    self.persist_archive_toc = False
 
         if self.name:
             # Consider deprecated configs if there's no value yet
@@ -1374,31 +1595,35 @@ class ORARemote(SpecialRemote):
 
     @property
     def io(self):
-        if not self._io:
-            if self._local_io():
-                self._io = LocalIO()
-            elif self.ria_store_url.startswith("ria+http"):
-                # TODO: That construction of "http(s)://host/" should probably
-                #       be moved, so that we get that when we determine
-                #       self.storage_host. In other words: Get the parsed URL
-                #       instead and let HTTPRemoteIO + SSHRemoteIO deal with it
-                #       uniformly. Also: Don't forget about a possible port.
-
-                url_parts = self.ria_store_url[4:].split('/')
-                # we expect parts: ("http(s):", "", host:port, path)
-                self._io = HTTPRemoteIO(
-                    url_parts[0] + "//" + url_parts[2],
-                    self.buffer_size
-                )
-            elif self.storage_host:
-                self._io = SSHRemoteIO(self.storage_host, self.buffer_size)
-                from atexit import register
-                register(self._io.close)
-            else:
-                raise RIARemoteError(
-                    "Local object tree base path does not exist, and no SSH"
-                    "host configuration found.")
-        return self._io
+        with self._io_lock:
+            if not self._io:
+                if self._local_io():
+                    self._io = LocalIO(
+                        persist_archive_toc=bool(self.persist_archive_toc))
+                elif self.ria_store_url.startswith("ria+http"):
+                    # TODO: That construction of "http(s)://host/" should probably
+                    #       be moved, so that we get that when we determine
+                    #       self.storage_host. In other words: Get the parsed URL
+                    #       instead and let HTTPRemoteIO + SSHRemoteIO deal with it
+                    #       uniformly. Also: Don't forget about a possible port.
+
+                    url_parts = self.ria_store_url[4:].split('/')
+                    # we expect parts: ("http(s):", "", host:port, path)
+                    self._io = HTTPRemoteIO(
+                        url_parts[0] + "//" + url_parts[2],
+                        self.buffer_size
+                    )
+                elif self.storage_host:
+                    self._io = SSHRemoteIO(
+                        self.storage_host, self.buffer_size,
+                        persist_archive_toc=bool(self.persist_archive_toc))
+                    from atexit import register
+                    register(self._io.close)
+                else:
+                    raise RIARemoteError(
+                        "Local object tree base path does not exist, and no SSH"
+                        "host configuration found.")
+            return self._io
 
     @property
     def push_io(self):
@@ -1411,55 +1636,64 @@ class ORARemote(SpecialRemote):
         # remote protocol - we don't know which annex command is running and
         # therefore we don't know whether to use fetch or push URL during
         # PREPARE.
+        # Concurrent jobs read the IO and the locations in the store under
+        # the lock (see `_get_io_and_location()`), hence they never see a
+        # mix of the state before and after the switch.
+        with self._io_lock:
+            if not self._push_io:
+                if self.ria_store_pushurl:
+                    self.message("switching ORA to push-url")
+                    # Build the new state first, and swap it in at once.
+                    # Not-implemented-push-HTTP is ruled out already when reading
+                    # push-url, so either local or SSH:
+                    if not self.storage_host_push:
+                        # local operation
+                        push_io = LocalIO(
+                            persist_archive_toc=bool(self.persist_archive_toc))
+                    else:
+                        push_io = SSHRemoteIO(
+                            self.storage_host_push, self.buffer_size,
+                            persist_archive_toc=bool(self.persist_archive_toc))
+                    store_base_path = (
+                        url_path2local_path(self.store_base_path_push)
+                        if self._local_io
+                        else self.store_base_path_push)
+                    layout_locations = self.get_layout_locations(
+                        store_base_path, self.archive_id)
+
+                    # We have a new instance. Kill the existing one and replace.
+                    # Other jobs might still be using it, when serving
+                    # git-annex asynchronously. It is closed at exit then.
+                    from atexit import register, unregister
+                    if hasattr(self.io, 'close') and \
+                            not getattr(self.annex, 'async_enabled', False):
+                        unregister(self.io.close)
+                        self.io.close()
+
+                    # XXX now also READ IO is done with the write IO
+                    # this explicitly ignores the remote config
+                    # that distinguishes READ from WRITE with different
+                    # methods
+                    self._push_io = self._io = push_io
+                    if hasattr(push_io, 'close'):
+                        register(push_io.close)
+
+                    self.storage_host = self.storage_host_push
+                    self.store_base_path = self.store_base_path_push
+
+                    # delete/update cached locations:
+                    self._last_archive_path = None
+                    self._last_keypath = (None, None)
+
+                    self.remote_git_dir, \
+                    self.remote_archive_dir, \
+                    self.remote_obj_dir = layout_locations
 
-        if not self._push_io:
-            if self.ria_store_pushurl:
-                self.message("switching ORA to push-url")
-                # Not-implemented-push-HTTP is ruled out already when reading
-                # push-url, so either local or SSH:
-                if not self.storage_host_push:
-                    # local operation
-                    self._push_io = LocalIO()
                 else:
-                    self._push_io = SSHRemoteIO(self.storage_host_push,
-                                                self.buffer_size)
-
-                # We have a new instance. Kill the existing one and replace.
-                from atexit import register, unregister
-                if hasattr(self.io, 'close'):
-                    unregister(self.io.close)
-                    self.io.close()
-
-                # XXX now also READ IO is done with the write IO
-                # this explicitly ignores the remote config
-                # that distinguishes READ from WRITE with different
-                # methods
-                self._io = self._push_io
-                if hasattr(self.io, 'close'):
-                    register(self.io.close)
-
-                self.storage_host = self.storage_host_push
-                self.store_base_path = self.store_base_path_push
-
-                # delete/update cached locations:
-                self._last_archive_path = None
-                self._last_keypath = (None, None)
-
-                store_base_path = (
-                    url_path2local_path(self.store_base_path)
-                    if self._local_io
-                    else self.store_base_path)
-
-                self.remote_git_dir, \
-                self.remote_archive_dir, \
-                self.remote_obj_dir = \
-                    self.get_layout_locations(store_base_path, self.archive_id)
-
-            else:
-                # no push-url: use existing IO
-                self._push_io = self._io
+                    # no push-url: use existing IO
+                    self._push_io = self._io
 
-        return self._push_io
+            return self._push_io
 
     @handle_errors
     def prepare(self):
@@ -1489,34 +1723,33 @@ class ORARemote(SpecialRemote):
         # we need a file-system compatible name for the key
         key = _sanitize_key(key)
 
-        dsobj_dir, archive_path, key_path = self._get_obj_location(key)
+        io, remote_git_dir, (dsobj_dir, archive_path, key_path) = \
+            self._get_io_and_location(key, push=True)
         key_path = dsobj_dir / key_path
 
-        if self.push_io.exists(key_path):
+        if io.exists(key_path):
             # if the key is here, we trust that the content is in sync
             # with the key
             return
 
-        self.push_io.mkdir(key_path.parent)
-
         # We need to copy to a temp location to let checkpresent fail while the
         # transfer is still in progress and furthermore not interfere with
         # administrative tasks in annex/objects.
         # In addition include uuid, to not interfere with parallel uploads from
         # different clones.
         transfer_dir = \
-            self.remote_git_dir / "ora-remote-{}".format(self._repo.uuid) / "transfer"
-        self.push_io.mkdir(transfer_dir)
+            remote_git_dir / "ora-remote-{}".format(self._repo.uuid) / "transfer"
+        io.mkdir_many([key_path.parent, transfer_dir])
         tmp_path = transfer_dir / key
 
         try:
-            self.push_io.put(filename, tmp_path, self.annex.progress)
+            io.put(filename, tmp_path, self.annex.progress)
             # copy done, atomic rename to actual target
-            self.push_io.rename(tmp_path, key_path)
+            io.rename(tmp_path, key_path)
         except Exception as e:
             # whatever went wrong, we don't want to leave the transfer location
             # blocked
-            self.push_io.remove(tmp_path)
+            io.remove(tmp_path)
             raise e
 
     @handle_errors
@@ -1524,15 +1757,16 @@ class ORARemote(SpecialRemote):
         # we need a file-system compatible name for the key
         key = _sanitize_key(key)
 
-        dsobj_dir, archive_path, key_path = self._get_obj_location(key)
+        io, _, (dsobj_dir, archive_path, key_path) = \
+            self._get_io_and_location(key)
         abs_key_path = dsobj_dir / key_path
         # sadly we have no idea what type of source gave checkpresent->true
         # we can either repeat the checks, or just make two opportunistic
         # attempts (at most)
         try:
-            self.io.get(abs_key_path, filename, self.annex.progress)
+            io.get(abs_key_path, filename, self.annex.progress)
         except Exception as e1:
-            if isinstance(self.io, HTTPRemoteIO):
+            if isinstance(io, HTTPRemoteIO):
                 # no client-side archive access over HTTP
                 # Note: This is intentional, as it would mean one additional
                 # request per key. However, server response to the GET can
@@ -1540,8 +1774,8 @@ class ORARemote(SpecialRemote):
                 raise
             # catch anything and keep it around for a potential re-raise
             try:
-                self.io.get_from_archive(archive_path, key_path, filename,
-                                         self.annex.progress)
+                io.get_from_archive(archive_path, key_path, filename,
+                                    self.annex.progress)
             except Exception as e2:
                 # TODO properly report the causes
                 raise RIARemoteError('Failed to obtain key: {}'
@@ -1552,20 +1786,19 @@ class ORARemote(SpecialRemote):
         # we need a file-system compatible name for the key
         key = _sanitize_key(key)
 
-        dsobj_dir, archive_path, key_path = self._get_obj_location(key)
+        io, _, (dsobj_dir, archive_path, key_path) = \
+            self._get_io_and_location(key)
         abs_key_path = dsobj_dir / key_path
-        if self.io.exists(abs_key_path):
+        if io.exists(abs_key_path):
             # we have an actual file for this key
             return True
-        if isinstance(self.io, HTTPRemoteIO):
+        if isinstance(io, HTTPRemoteIO):
             # no client-side archive access over HTTP
             return False
-        # do not make a careful check whether an archive exists, because at
-        # present this requires an additional SSH call for remote operations
-        # which may be rather slow. Instead just try to run 7z on it and let
-        # it fail if no archive is around
+        # the archive is only listed on the first call, all other keys are
+        # looked up in its table of contents
         # TODO honor future 'archive-mode' flag
-        return self.io.in_archive(archive_path, key_path)
+        return io.in_archive(archive_path, key_path)
 
     @handle_errors
     def remove(self, key):
@@ -1574,16 +1807,17 @@ class ORARemote(SpecialRemote):
 
         self._ensure_writeable()
 
-        dsobj_dir, archive_path, key_path = self._get_obj_location(key)
+        io, _, (dsobj_dir, archive_path, key_path) = \
+            self._get_io_and_location(key, push=True)
         key_path = dsobj_dir / key_path
-        if self.push_io.exists(key_path):
-            self.push_io.remove(key_path)
+        if io.exists(key_path):
+            io.remove(key_path)
         key_dir = key_path
         # remove at most two levels of empty directories
         for level in range(2):
             key_dir = key_dir.parent
             try:
-                self.push_io.remove_dir(key_dir)
+                io.remove_dir(key_dir)
             except Exception:
                 break
 
@@ -1601,18 +1835,21 @@ class ORARemote(SpecialRemote):
         # we need a file-system compatible name for the key
         key = _sanitize_key(key)
 
-        dsobj_dir, archive_path, key_path = self._get_obj_location(key)
-        if isinstance(self.io, HTTPRemoteIO):
+        with self._io_lock:
+            io, remote_git_dir, (dsobj_dir, archive_path, key_path) = \
+                self._get_io_and_location(key)
+            storage_host = self.storage_host
+        if isinstance(io, HTTPRemoteIO):
             # display the URL for a request
             # TODO: method of HTTPRemoteIO
             # in case of a HTTP remote (unchecked for others), storage_host
             # is not just a host, but a full URL without a path
-            return f'{self.storage_host}{dsobj_dir}/{key_path}'
+            return f'{storage_host}{dsobj_dir}/{key_path}'
 
         return str(dsobj_dir / key_path) if self._local_io() \
             else '{}: {}:{}'.format(
-                self.storage_host,
-                self.remote_git_dir,
+                storage_host,
+                remote_git_dir,
                 sh_quote(str(key_path)),
         )
 
@@ -1620,6 +1857,17 @@ class ORARemote(SpecialRemote):
     def get_layout_locations(base_path, dsid):
         return get_layout_locations(1, base_path, dsid)
 
+    def _get_io_and_location(self, key, push=False):
+        """Return the IO, the dataset directory in the store, and the
+        location of `key` (see `_get_obj_location()`)
+
+        They are read at once, as `push_io` might replace them while other
+        jobs are running.
+        """
+        with self._io_lock:
+            io = self.push_io if push else self.io
+            return io, self.remote_git_dir, self._get_obj_location(key)
+
     def _get_obj_location(self, key):
         # Notes: - Changes to this method may require an update of
         #          ORARemote._layout_version
@@ -1629,7 +1877,9 @@ class ORARemote(SpecialRemote):
 
         if not self._last_archive_path:
             self._last_archive_path = self.remote_archive_dir / 'archive.7z'
-        if self._last_keypath[0] != key:
+        # the cache is read once, because concurrent jobs might replace it
+        last_key, key_path = self._last_keypath
+        if last_key != key:
             if self.remote_object_tree_version == '1':
                 key_dir = self.annex.dirhash_lower(key)
 
@@ -1641,10 +1891,10 @@ class ORARemote(SpecialRemote):
                 key_dir = self.annex.dirhash(key)
             # double 'key' is not a mistake, but needed to achieve the exact
             # same layout as the annex/objects tree
-            self._last_keypath = (key, Path(key_dir) / key / key)
+            key_path = Path(key_dir) / key / key
+            self._last_keypath = (key, key_path)
 
-        return self.remote_obj_dir, self._last_archive_path, \
-            self._last_keypath[1]
+        return self.remote_obj_dir, self._last_archive_path, key_path
 
     # TODO: implement method 'error'
 
@@ -8,7 +8,10 @@
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 
 import logging
+import os
 import stat
+import subprocess
+from unittest.mock import patch
 
 from datalad.api import (
     Dataset,
@@ -23,7 +26,10 @@ from datalad.customremotes.ria_utils import (
 )
 from datalad.distributed.ora_remote import (
     LocalIO,
+    RemoteCommandFailedError,
+    RIARemoteError,
     SSHRemoteIO,
+    _parse_7z_members,
     _sanitize_key,
 )
 from datalad.distributed.tests.ria_utils import (
@@ -58,7 +64,10 @@ from datalad.tests.utils_pytest import (
     turtle,
     with_tempfile,
 )
-from datalad.utils import Path
+from datalad.utils import (
+    Path,
+    PurePosixPath,
+)
 
 # Note, that exceptions to test for are generally CommandError since we are
 # talking to the special remote via annex.
@@ -734,6 +743,60 @@ def test_sanitize_key():
         assert_equal(_sanitize_key(i), o)
 
 
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+def test_push_io_switch(storepath=None, pushpath=None):
+    import threading
+    from unittest.mock import MagicMock
+    from datalad.distributed.ora_remote import ORARemote
+
+    remote = ORARemote(MagicMock(async_enabled=True))
+    remote.ria_store_url = 'ria+file://' + storepath
+    remote.ria_store_pushurl = 'ria+file://' + pushpath
+    remote.store_base_path = PurePosixPath(storepath)
+    remote.store_base_path_push = PurePosixPath(pushpath)
+    remote.archive_id = 'abcdef'
+    remote.remote_object_tree_version = '1'
+    remote.annex.dirhash_lower.return_value = 'a/b'
+    remote.remote_git_dir, remote.remote_archive_dir, remote.remote_obj_dir = \
+        get_layout_locations(1, Path(storepath), 'abcdef')
+    io = remote.io
+
+    # a job that runs while another one switches to the push-url sees either
+    # the state before or after the switch, never a mix
+    switching = threading.Event()
+    proceed = threading.Event()
+    get_layout_locations_orig = remote.get_layout_locations
+
+    def slow_get_layout_locations(*args):
+        switching.set()
+        proceed.wait(timeout=10)
+        return get_layout_locations_orig(*args)
+
+    with patch.object(remote, 'get_layout_locations',
+                      slow_get_layout_locations):
+        switcher = threading.Thread(target=lambda: remote.push_io)
+        switcher.start()
+        switching.wait(timeout=10)
+        job_results = []
+        job = threading.Thread(target=lambda: job_results.append(
+            remote._get_io_and_location('KEY')))
+        job.start()
+        # no partial state is visible while the new state is built
+        assert_true(remote._io is io)
+        assert_equal(remote.store_base_path, PurePosixPath(storepath))
+        proceed.set()
+        switcher.join()
+        job.join()
+    push_io, git_dir, (obj_dir, archive_path, key_path) = job_results[0]
+    assert_false(push_io is io)
+    assert_true(push_io is remote.push_io)
+    assert_true(str(git_dir).startswith(pushpath))
+    assert_true(str(obj_dir).startswith(pushpath))
+    assert_true(str(archive_path).startswith(pushpath))
+    assert_equal(key_path, Path('a/b/KEY/KEY'))
+
+
 # Skipping on adjusted branch as a proxy for crippledFS. Write permissions of
 # the owner on a directory can't be revoked on VFAT. "adjusted branch" is a
 # bit broad but covers the CI cases. And everything RIA/ORA doesn't currently
@@ -815,3 +878,128 @@ def test_obtain_permission_ssh():
 @skip_if_root
 def test_obtain_permission_root():
     _test_permission(None)
+
+
+def test_parse_7z_members():
+    out = """
+7-Zip [64] 16.02 : Copyright (c) 1999-2016 Igor Pavlov : 2016-05-21
+
+Listing archive: /store/archives/archive.7z
+
+--
+Path = /store/archives/archive.7z
+Type = 7z
+Physical Size = 387
+
+----------
+Path = 7f/cf
+Folder = +
+Size = 0
+
+Path = 7f/cf/MD5E-s3--abc.txt/MD5E-s3--abc.txt
+Folder = -
+Size = 3
+"""
+    assert_equal(
+        list(_parse_7z_members(out.splitlines())),
+        ['7f/cf', '7f/cf/MD5E-s3--abc.txt/MD5E-s3--abc.txt'])
+
+
+@with_tempfile(mkdir=True)
+def test_archive_toc(path=None):
+    archive = Path(path) / 'archive.7z'
+    toc_file = Path(path) / 'archive.7z.toc'
+    members = ['a/b/KEY1/KEY1', 'a/c/KEY2/KEY2']
+
+    io = LocalIO()
+    with patch.object(io, 'list_archive', return_value=members) as list_:
+        # no archive, no listing
+        assert_false(io.in_archive(archive, 'a/b/KEY1/KEY1'))
+        list_.assert_not_called()
+        assert_raises(Exception, io.get_from_archive,
+                      archive, Path('a/b/KEY1/KEY1'), Path(path) / 'out',
+                      None)
+
+    archive.write_text('dummy')
+    for persist in (False, True):
+        io = LocalIO(persist_archive_toc=persist)
+        with patch.object(io, 'list_archive', return_value=members) as list_:
+            assert_true(io.in_archive(archive, Path('a/b/KEY1/KEY1')))
+            assert_true(io.in_archive(archive, 'a/c/KEY2/KEY2'))
+            assert_false(io.in_archive(archive, 'a/c/KEY3/KEY3'))
+            # the archive was listed only once
+            assert_equal(list_.call_count, 1)
+        assert_equal(toc_file.exists(), persist)
+
+    # a new session reuses the stored table of contents
+    io = LocalIO(persist_archive_toc=True)
+    with patch.object(io, 'list_archive', return_value=[]) as list_:
+        assert_true(io.in_archive(archive, 'a/b/KEY1/KEY1'))
+        list_.assert_not_called()
+
+    # but not if the archive was modified
+    archive.write_text('modified')
+    io = LocalIO(persist_archive_toc=True)
+    with patch.object(io, 'list_archive',
+                      return_value=members[1:]) as list_:
+        assert_false(io.in_archive(archive, 'a/b/KEY1/KEY1'))
+        assert_equal(list_.call_count, 1)
+    assert_not_in('a/b/KEY1/KEY1', toc_file.read_text().splitlines())
+    assert_equal(
+        [f for f in os.listdir(path) if f.startswith('archive.7z.toc')],
+        ['archive.7z.toc'])
+
+
+def _open_local_shell(self):
+    shell = subprocess.Popen(['sh'],
+                             stderr=subprocess.DEVNULL,
+                             stdout=subprocess.PIPE,
+                             stdin=subprocess.PIPE)
+    self._shells.append(shell)
+    return shell
+
+
+@with_tempfile(mkdir=True)
+def test_ssh_remote_io_pipelining(path=None):
+    path = Path(path)
+    # talk to a local shell instead of a remote one
+    with patch('datalad.distributed.ora_remote.ssh_manager'), \
+            patch.object(SSHRemoteIO, '_open_shell', _open_local_shell), \
+            patch.object(SSHRemoteIO, 'pipeline_size', 3):
+        io = SSHRemoteIO('localhost', buffer_size=4)
+        try:
+            dirs = [path / 'store' / str(i) for i in range(5)]
+            io.mkdir_many(dirs)
+            assert_true(all(d.is_dir() for d in dirs))
+
+            # all responses are read before a failure is reported
+            assert_raises(
+                RemoteCommandFailedError,
+                io._run_many,
+                ['true', 'false', 'echo late'], no_output=False, check=True)
+            assert_equal(io._run('echo in sync', no_output=False),
+                         'in sync\n')
+
+            keys = ['MD5E-s{}--{}'.format(i * 5, i) for i in range(7)]
+            files = []
+            for i, key in enumerate(keys):
+                src = path / 'store' / key
+                src.write_bytes(b'12345' * i)
+                files.append((src, path / 'local{}'.format(i)))
+            progress = []
+            for src, dst in files:
+                io.get(src, dst, progress.append)
+            for i, (_, dst) in enumerate(files):
+                assert_equal(dst.read_bytes(), b'12345' * i)
+            assert_equal(progress[-1], 30)
+
+            # a missing file is reported, and the shell stays usable
+            with assert_raises(RIARemoteError):
+                io.get(path / 'store' / 'MD5E-s3--missing',
+                       path / 'local_missing', progress.append)
+            io.get(*files[2], progress.append)
+            assert_equal(files[2][1].read_bytes(), b'12345' * 2)
+            assert_equal(io._run('echo in sync', no_output=False),
+                         'in sync\n')
+        finally:
+            io.close()
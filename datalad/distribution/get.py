@@ -12,6 +12,7 @@
 
 import logging
 import re
+from os import cpu_count
 
 import os.path as op
 
@@ -59,6 +60,7 @@ from datalad.support.network import (
     urlquote,
 )
 from datalad.support.parallel import (
+    ProducerConsumer,
     ProducerConsumerProgressLog,
 )
 from datalad.utils import (
@@ -707,6 +709,52 @@ def _get_targetpaths(ds, content, refds_path, source, jobs):
         yield r
 
 
+def _get_transfer_jobs(jobs, config):
+    """Return the overall number of transfer jobs for a `jobs` specification
+
+    'auto' is resolved like for a single `git annex` call, using the
+    ConfigManager `config` of the reference dataset.
+    """
+    if jobs == 'auto':
+        return min(config.obtain('datalad.runtime.max-annex-jobs'),
+                   max(3, cpu_count() or 1))
+    return jobs or 1
+
+
+def _get_content_by_ds(content_by_ds, refds_path, source, jobs):
+    """Get content of multiple datasets, within a single budget of jobs
+
+    Instead of applying `jobs` to the annex-get of one dataset after the
+    other, the annex-get calls of multiple datasets run concurrently. The
+    overall number of transfer jobs is split among them, such that many
+    datasets with few files each are processed in parallel, and a single
+    dataset gets all jobs.
+
+    Results are yielded in the order of `content_by_ds`.
+    """
+    total_jobs = _get_transfer_jobs(jobs, Dataset(refds_path).config)
+    ds_jobs = min(total_jobs, len(content_by_ds))
+    annex_jobs = max(1, total_jobs // ds_jobs) if ds_jobs else 1
+    lgr.debug("Getting content of %d datasets with %d concurrent annex-get "
+              "calls of %d jobs each",
+              len(content_by_ds), ds_jobs, annex_jobs)
+
+    def consumer(ds_content):
+        ds, content = ds_content
+        yield from _get_targetpaths(
+            Dataset(ds), content, refds_path, source, annex_jobs)
+
+    yield from ProducerConsumer(
+        content_by_ds.items(),
+        consumer,
+        # no threads, if only a single dataset is processed at a time
+        jobs=ds_jobs if ds_jobs > 1 else 0,
+        # content is a set, not hashable
+        producer_future_key=lambda ds_content: ds_content[0],
+        ordered=True,
+    )
+
+
 def _check_error_reported_before(res: dict, error_dict: dict):
     # Helper to check if an impossible result for a path that does
     # not exist has already been yielded before. If not, add path
@@ -992,15 +1040,10 @@ class Get(Interface):
             # done already
             return
 
-        # and now annex-get, this could all be done in parallel now
-        for ds, content in content_by_ds.items():
-            for res in _get_targetpaths(
-                    Dataset(ds),
-                    content,
-                    refds.path,
-                    source,
-                    jobs):
-                if 'path' not in res or res['path'] not in content_by_ds:
-                    # we had reports on datasets and subdatasets already
-                    # before the annex stage
-                    yield res
+        # and now annex-get, for all datasets at once
+        for res in _get_content_by_ds(
+                content_by_ds, refds.path, source, jobs):
+            if 'path' not in res or res['path'] not in content_by_ds:
+                # we had reports on datasets and subdatasets already
+                # before the annex stage
+                yield res
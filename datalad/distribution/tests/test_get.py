@@ -24,6 +24,7 @@ from datalad.api import (
 )
 from datalad.distribution.get import (
     _get_flexible_source_candidates_for_submodule,
+    _get_transfer_jobs,
 )
 from datalad.interface.results import only_matching_paths
 from datalad.support.annexrepo import AnnexRepo
@@ -476,6 +477,48 @@ def test_get_greedy_recurse_subdatasets(src=None, path=None):
     ok_(subds2.repo.file_has_content('test-annex.dat') is True)
 
 
+@with_tempfile(mkdir=True)
+def test_get_transfer_jobs(path=None):
+    ds = Dataset(path).create()
+    eq_(_get_transfer_jobs(None, ds.config), 1)
+    eq_(_get_transfer_jobs(0, ds.config), 1)
+    eq_(_get_transfer_jobs(5, ds.config), 5)
+    eq_(_get_transfer_jobs('auto', ds.config), 1)
+    # the dataset configuration is honored
+    ds.config.set('datalad.runtime.max-annex-jobs', '2', scope='branch')
+    eq_(_get_transfer_jobs('auto', ds.config), 2)
+
+
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+def test_get_jobs_across_datasets(src=None, path=None):
+    _mk_submodule_annex(src, 'test-annex.dat', 'irrelevant')
+
+    ds = install(
+        path, source=src,
+        result_xfm='datasets', return_type='item-or-list')
+
+    annex_jobs = {}
+    orig_get = AnnexRepo.get
+
+    def get_(repo, files, *args, **kwargs):
+        annex_jobs[repo.path] = kwargs.get('jobs')
+        return orig_get(repo, files, *args, **kwargs)
+
+    with patch.object(AnnexRepo, 'get', get_):
+        res = ds.get(['subm 1', '2'], jobs=4)
+    assert_status('ok', res)
+    # both subdatasets were processed at once, and split the jobs
+    subds1, subds2 = ds.subdatasets(result_xfm='datasets')
+    eq_(annex_jobs, {subds1.path: 2, subds2.path: 2})
+    ok_(subds1.repo.file_has_content('test-annex.dat') is True)
+    ok_(subds2.repo.file_has_content('test-annex.dat') is True)
+    # results of the content come in the order of the datasets
+    eq_([r['path'] for r in res if r.get('type') == 'file'],
+        [str(subds1.pathobj / 'test-annex.dat'),
+         str(subds2.pathobj / 'test-annex.dat')])
+
+
 @with_tempfile(mkdir=True)
 @with_tempfile(mkdir=True)
 def test_get_install_missing_subdataset(src=None, path=None):
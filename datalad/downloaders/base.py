@@ -12,6 +12,7 @@
 
 __docformat__ = 'restructuredtext'
 
+import json
 import msgpack
 import os
 import sys
@@ -62,6 +63,9 @@ class DownloaderSession(object):
     .download method
     """
 
+    # Whether `download()` can continue a partial download, see its `offset`
+    supports_resume = False
+
     def __init__(self, size=None, filename=None, url=None, headers=None):
         self.size = size
         self.filename = filename
@@ -69,6 +73,14 @@ class DownloaderSession(object):
         self.url = url
 
     def download(self, f=None, pbar=None, size=None):
+        """Download the content into `f`, or return it
+
+        Sessions that support resume also take an `offset` argument: the
+        number of bytes of the content already present in `f`. Only the
+        remaining content is then downloaded and appended to `f`. If the
+        content cannot be resumed, `f` is truncated and all content is
+        downloaded.
+        """
         raise NotImplementedError("must be implemented in subclases")
 
         # TODO: get_status ?
@@ -363,6 +375,46 @@ class BaseDownloader(object, metaclass=ABCMeta):
         # .git/datalad/tmp
         return filepath + ".datalad-download-temp"
 
+    @staticmethod
+    def _get_resume_info_filename(temp_filepath):
+        """Return the file to describe the content of a partial download"""
+        return temp_filepath + ".json"
+
+    @staticmethod
+    def _get_resume_info(url, downloader_session):
+        """Return what identifies the content of a partial download
+
+        Returns None if the content of the URL cannot be identified, and a
+        partial download must not be resumed.
+        """
+        headers = downloader_session.headers or {}
+        validator = headers.get('ETag') or headers.get('Last-Modified')
+        if not (downloader_session.supports_resume and validator):
+            return None
+        return dict(url=url, validator=str(validator),
+                    size=downloader_session.size)
+
+    def _get_resume_offset(self, temp_filepath, resume_info):
+        """Return the size of a resumable partial download, or 0"""
+        info_filepath = self._get_resume_info_filename(temp_filepath)
+        if not (resume_info and exists(temp_filepath)
+                and exists(info_filepath)):
+            return 0
+        try:
+            with open(info_filepath) as f:
+                previous_info = json.load(f)
+        except (OSError, ValueError) as e:
+            lgr.debug("Cannot read %s: %s", info_filepath, e)
+            return 0
+        if previous_info != resume_info:
+            lgr.debug("Content of %s changed since the partial download %s",
+                      resume_info['url'], temp_filepath)
+            return 0
+        offset = os.stat(temp_filepath).st_size
+        if resume_info['size'] and offset >= resume_info['size']:
+            return 0
+        return offset
+
     @abstractmethod
     def get_downloader_session(self, url):
         """
@@ -460,28 +512,54 @@ class BaseDownloader(object, metaclass=ABCMeta):
 
         # FETCH CONTENT
         # TODO: pbar = ui.get_progressbar(size=response.headers['size'])
+        temp_filepath = self._get_temp_download_filename(filepath)
+        info_filepath = self._get_resume_info_filename(temp_filepath)
+        resume_info = self._get_resume_info(url, downloader_session)
+        offset = self._get_resume_offset(temp_filepath, resume_info)
+        # whether to keep a partial download, to resume it on the next attempt
+        keep_temp = False
         try:
-            temp_filepath = self._get_temp_download_filename(filepath)
-            if exists(temp_filepath):
-                # eventually we might want to continue the download
+            if offset:
+                lgr.info("Resuming download of %s at byte %d", url, offset)
+            elif exists(temp_filepath):
                 lgr.warning(
                     "Temporary file %s from the previous download was found. "
                     "It will be overridden" % temp_filepath)
-                # TODO.  also logic below would clean it up atm
+            if resume_info:
+                with open(info_filepath, 'w') as f:
+                    json.dump(resume_info, f)
 
-            with open(temp_filepath, 'wb') as fp:
+            with open(temp_filepath, 'ab' if offset else 'wb') as fp:
                 # TODO: url might be a bit too long for the beast.
                 # Consider to improve to make it animated as well, or shorten here
                 pbar = ui.get_progressbar(label=url, fill_text=filepath, total=target_size)
                 t0 = time.time()
-                downloader_session.download(fp, pbar, size=size)
+                try:
+                    if offset:
+                        downloader_session.download(
+                            fp, pbar, size=size, offset=offset)
+                    else:
+                        downloader_session.download(fp, pbar, size=size)
+                except BaseException:
+                    # whatever made it into the file can be resumed, unless
+                    # the session could not preserve the order of the content
+                    keep_temp = bool(resume_info) \
+                        and downloader_session.supports_resume
+                    raise
                 downloaded_time = time.time() - t0
                 pbar.finish()
             downloaded_size = os.stat(temp_filepath).st_size
 
             # (headers.get('Content-type', "") and headers.get('Content-Type')).startswith('text/html')
             #  and self.authenticator.html_form_failure_re: # TODO: use information in authenticator
-            self._verify_download(url, downloaded_size, target_size, temp_filepath)
+            try:
+                self._verify_download(url, downloaded_size, target_size, temp_filepath)
+            except UnaccountedDownloadError:
+                keep_temp = False
+                raise
+            except IncompleteDownloadError:
+                keep_temp = bool(resume_info)
+                raise
 
             # adjust atime/mtime according to headers/status
             if status.mtime:
@@ -496,17 +574,32 @@ class BaseDownloader(object, metaclass=ABCMeta):
                 stats.overwritten += int(existed)
                 stats.downloaded_size += downloaded_size
                 stats.downloaded_time += downloaded_time
-        except (AccessDeniedError, IncompleteDownloadError) as e:
+        except AccessDeniedError as e:
+            keep_temp = False
+            raise
+        except IncompleteDownloadError as e:
             raise
         except Exception as e:
             ce = CapturedException(e)
+            if keep_temp and os.stat(temp_filepath).st_size > offset:
+                # progress was made, a next attempt would continue from here
+                lgr.debug("Download of %s into %s was interrupted: %s",
+                          url, filepath, ce)
+                raise IncompleteDownloadError(
+                    "Download was interrupted: %s" % ce) from e
+            keep_temp = False
             lgr.error("Failed to download %s into %s: %s", url, filepath, ce)
             raise DownloadError(ce) from e # for now
         finally:
-            if exists(temp_filepath):
-                # clean up
-                lgr.debug("Removing a temporary download %s", temp_filepath)
-                unlink(temp_filepath)
+            if keep_temp and exists(temp_filepath):
+                lgr.debug("Keeping partial download %s to resume it",
+                          temp_filepath)
+            else:
+                for p in (temp_filepath, info_filepath):
+                    if exists(p):
+                        # clean up
+                        lgr.debug("Removing a temporary download %s", p)
+                        unlink(p)
 
         return filepath
 
@@ -19,9 +19,17 @@ from requests.utils import parse_dict_header
 # from urllib3.exceptions import MaxRetryError, NewConnectionError
 
 import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 
-from .. import __version__
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+
+from .. import (
+    __version__,
+    cfg,
+)
 from ..utils import (
     ensure_list_from_str,
     ensure_dict_from_str,
@@ -105,7 +113,8 @@ def process_www_authenticate(v):
 def check_response_status(response, err_prefix="", session=None):
     """Check if response's status_code signals problem with authentication etc
 
-    ATM succeeds only if response code was 200
+    ATM succeeds only if response code was 200, or 206 (partial content) in
+    response to a range request
     """
     if not err_prefix:
         err_prefix = "Access to %s has failed: " % response.url
@@ -123,7 +132,7 @@ def check_response_status(response, err_prefix="", session=None):
             supported_types=process_www_authenticate(
                 response.headers.get('WWW-Authenticate')),
             status=response.status_code)
-    elif response.status_code in {200}:
+    elif response.status_code in {200, 206}:
         pass
     elif response.status_code in {301, 302, 307}:
         # TODO: apparently tests do not exercise this one yet
@@ -444,23 +453,225 @@ class HTTPAnonBearerTokenAuthenticator(HTTPBearerTokenAuthenticator):
 
 @auto_repr
 class HTTPDownloaderSession(DownloaderSession):
+    # Minimal size of a byte range of a segmented download
+    min_segment_size = 16 * 1024 ** 2
+    # Number of times a byte range is resumed after its transfer failed
+    segment_retries = 3
+    supports_resume = True
+
     def __init__(self, size=None, filename=None,  url=None, headers=None,
-                 response=None, chunk_size=1024 ** 2):
+                 response=None, chunk_size=1024 ** 2, session=None,
+                 segments=1):
+        """
+        Parameters
+        ----------
+        session: requests.Session, optional
+          Session the response was obtained with. Sessions for the
+          requests of a segmented download are derived from it.
+        segments: int, optional
+          Maximal number of byte ranges to download concurrently, if the
+          server supports range requests.
+        """
         super(HTTPDownloaderSession, self).__init__(
             size=size, filename=filename, url=url, headers=headers,
         )
         self.chunk_size = chunk_size
         self.response = response
+        self.session = session
+        self.segments = segments
+
+    def _get_segments_count(self, f, size):
+        """Return the number of byte ranges to download into `f`"""
+        if self.segments < 2 or self.session is None or not self.size \
+                or not hasattr(os, 'pwrite'):
+            return 1
+        if size is not None and size < self.size:
+            # only a part of the content is requested
+            return 1
+        headers = self.headers or {}
+        if 'bytes' not in headers.get('Accept-Ranges', '').lower() \
+                or headers.get('Content-Encoding') \
+                or self.response is None \
+                or self.response.status_code != 200:
+            return 1
+        try:
+            f.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            return 1
+        return max(1, min(self.segments, self.size // self.min_segment_size))
+
+    def _get_range_session(self):
+        # requests.Session is not thread-safe, hence every range is
+        # requested with its own session, that authenticates as the
+        # original one
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        session.cookies.update(self.session.cookies)
+        for attr in ('auth', 'proxies', 'verify', 'cert'):
+            setattr(session, attr, getattr(self.session, attr))
+        return session
+
+    def _get_range(self, session, start, end):
+        """Request the content from byte `start` up to (excluding) `end`"""
+        headers = {
+            'Range': 'bytes=%d-%d' % (start, end - 1),
+            'Accept-Encoding': '',
+        }
+        # if the content was changed since the download was started, the
+        # server responds with all of the new content, instead of the range
+        validator = self.headers.get('ETag') or self.headers.get('Last-Modified')
+        if validator:
+            headers['If-Range'] = validator
+        response = session.get(self.url, stream=True, headers=headers)
+        check_response_status(response, session=session)
+        if response.status_code != 206:
+            response.close()
+            raise DownloadError(
+                "Server responded to a range request for %s with status %d, "
+                "the content might have changed during the download"
+                % (self.url, response.status_code))
+        return response
+
+    def _download_segmented(self, f, pbar, count):
+        """Download the content as `count` byte ranges concurrently
+
+        The content is written into `f` at the offsets of the ranges. The
+        first range is read from the response that was already received,
+        all others are requested with a Range header. If the transfer of a
+        range fails, it is resumed from the last received byte for up to
+        `segment_retries` times.
+        """
+        lgr.debug("Downloading %s in %d segments", self.url, count)
+        # the file is not filled in order, a partial download can only be
+        # resumed per range
+        self.supports_resume = False
+        f.flush()
+        fd = f.fileno()
+        # preallocate the file, such that the ranges can be written
+        # in any order
+        os.ftruncate(fd, self.size)
+        bounds = [i * self.size // count for i in range(count + 1)]
+        total = [0]
+        progress_lock = threading.Lock()
+        failed = threading.Event()
+
+        def _report(nbytes):
+            with progress_lock:
+                total[0] += nbytes
+                try:
+                    if pbar:
+                        pbar.update(total[0])
+                except Exception as e:
+                    ce = CapturedException(e)
+                    lgr.warning("Failed to update progressbar: %s", ce)
+                ui.out.flush()
+
+        def _download_range(i):
+            offset, end = bounds[i], bounds[i + 1]
+            response = self.response if i == 0 else None
+            session = None
+            attempt = 0
+            try:
+                while offset < end:
+                    try:
+                        if response is None:
+                            if session is None:
+                                session = self._get_range_session()
+                            response = self._get_range(session, offset, end)
+                        for chunk in response.raw.stream(
+                                self.chunk_size, decode_content=False):
+                            if failed.is_set():
+                                return
+                            chunk = chunk[:end - offset]
+                            while chunk:
+                                written = os.pwrite(fd, chunk, offset)
+                                chunk = chunk[written:]
+                                offset += written
+                                _report(written)
+                            if offset >= end:
+                                break
+                        if offset < end:
+                            raise IOError(
+                                "Connection closed with %d bytes of the "
+                                "range missing" % (end - offset))
+                    except (OSError, requests.RequestException,
+                            URLLib3HTTPError) as e:
+                        attempt += 1
+                        if attempt > self.segment_retries:
+                            raise
+                        lgr.debug(
+                            "Resuming download of %s from byte %d after "
+                            "failure: %s",
+                            self.url, offset, CapturedException(e))
+                    finally:
+                        if response is not None:
+                            response.close()
+                            response = None
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                if session is not None:
+                    session.close()
+
+        with ThreadPoolExecutor(
+                count, thread_name_prefix='datalad-download') as executor:
+            futures = [executor.submit(_download_range, i)
+                       for i in range(count)]
+        for future in futures:
+            # raises the first exception of a range
+            future.result()
+
+    def _resume(self, f, offset):
+        """Return a response with the content from byte `offset` on
+
+        If the server does not resume the content, e.g. because it changed,
+        `f` is truncated, and the response provides all of the content.
 
-    def download(self, f=None, pbar=None, size=None):
+        Returns
+        -------
+        response, int
+          The response, and the offset of its content.
+        """
+        if self.session is None:
+            f.seek(0)
+            f.truncate()
+            return self.response, 0
+        self.response.close()
+        headers = {
+            'Range': 'bytes=%d-' % offset,
+            'Accept-Encoding': '',
+        }
+        validator = self.headers.get('ETag') \
+            or self.headers.get('Last-Modified')
+        if validator:
+            headers['If-Range'] = validator
+        response = self.session.get(self.url, stream=True, headers=headers)
+        check_response_status(response, session=self.session)
+        if response.status_code == 206:
+            return response, offset
+        lgr.debug("Server did not resume the download of %s, starting over",
+                  self.url)
+        f.seek(0)
+        f.truncate()
+        return response, 0
+
+    def download(self, f=None, pbar=None, size=None, offset=0):
         response = self.response
+        total = 0
+        if offset:
+            response, total = self._resume(f, offset)
+        elif f is not None:
+            segments = self._get_segments_count(f, size)
+            if segments > 1:
+                self._download_segmented(f, pbar, segments)
+                return
         # content_gzipped = 'gzip' in response.headers.get('content-encoding', '').split(',')
         # if content_gzipped:
         #     raise NotImplemented("We do not support (yet) gzipped content")
         #     # see https://rationalpie.wordpress.com/2010/06/02/python-streaming-gzip-decompression/
         #     # for ways to implement in python 2 and 3.2's gzip is working better with streams
 
-        total = 0
         return_content = f is None
         if f is None:
             # no file to download to
@@ -642,7 +853,9 @@ class HTTPDownloader(BaseDownloader):
             url=response.url,
             filename=url_filename,
             headers=headers,
-            response=response
+            response=response,
+            session=self._session,
+            segments=cfg.obtain('datalad.download.segments'),
         )
 
     @classmethod
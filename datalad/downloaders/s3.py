@@ -131,13 +131,15 @@ class S3DownloaderSession(DownloaderSession):
         )
         self.key = key
 
-    def download(self, f=None, pbar=None, size=None):
+    supports_resume = True
+
+    def download(self, f=None, pbar=None, size=None, offset=0):
         # S3 specific (the rest is common with e.g. http)
         def pbar_callback(downloaded, totalsize):
-            assert (totalsize == self.key.size)
+            assert (offset or totalsize == self.key.size)
             if pbar:
                 try:
-                    pbar.update(downloaded)
+                    pbar.update(offset + downloaded)
                 except:  # MIH: what does it do? MemoryError?
                     pass  # do not let pbar spoil our fun
 
@@ -145,8 +147,10 @@ class S3DownloaderSession(DownloaderSession):
         # report for every % for files > 10MB, otherwise every 10%
         kwargs = dict(headers=headers, cb=pbar_callback,
                       num_cb=100 if self.key.size > 10*(1024**2) else 10)
-        if size:
-            headers['Range'] = 'bytes=0-%d' % (size - 1)
+        if size or offset:
+            # the ETag of the key was validated by the caller, when resuming
+            headers['Range'] = 'bytes=%d-%s' % (
+                offset, size - 1 if size else '')
         if f:
             # TODO: May be we could use If-Modified-Since
             # see http://docs.aws.amazon.com/AmazonS3/latest/API/RESTObjectGET.html
@@ -361,6 +365,8 @@ class S3Downloader(BaseDownloader):
             'Content-Length': key.size,
             'Content-Disposition': key.name
         }
+        if key.etag:
+            headers['ETag'] = key.etag
 
         if key.last_modified:
             headers['Last-Modified'] = rfc2822_to_epoch(key.last_modified)
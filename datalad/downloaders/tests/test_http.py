@@ -35,6 +35,7 @@ from ..credentials import (
     UserPassword,
 )
 from ..http import (
+    HTTPDownloaderSession,
     HTMLFormAuthenticator,
     HTTPBaseAuthenticator,
     HTTPBearerTokenAuthenticator,
@@ -71,6 +72,7 @@ from ...tests.utils_pytest import (
     assert_raises,
     known_failure_githubci_win,
     ok_file_has_content,
+    patch_config,
     serve_path_via_http,
     skip_if,
     skip_if_no_network,
@@ -741,6 +743,116 @@ def test_HTTPBearerTokenAuthenticator(d=None):
     assert_equal(content, "correct body")
 
 
+@skip_if(not httpretty, "no httpretty")
+@without_http_proxy
+@httpretty.activate
+@with_tempfile(mkdir=True)
+def test_segmented_download(d=None):
+    url = 'http://example.com/data.bin'
+    content = bytes(range(256)) * 40
+    requested_ranges = []
+    truncated = []
+
+    def request_get_callback(request, uri, headers):
+        headers['Accept-Ranges'] = 'bytes'
+        headers['ETag'] = '"v1"'
+        range_ = request.headers.get('Range')
+        if not range_:
+            return (200, headers, content)
+        requested_ranges.append(range_)
+        if request.headers.get('If-Range') != '"v1"':
+            return (200, headers, content)
+        start, last = map(int, range_[len('bytes='):].split('-'))
+        body = content[start:last + 1]
+        if not truncated:
+            # fail a range once, it must be resumed
+            truncated.append(range_)
+            body = body[:100]
+        headers['Content-Range'] = 'bytes %d-%d/%d' % (
+            start, start + len(body) - 1, len(content))
+        return (206, headers, body)
+
+    httpretty.register_uri(httpretty.GET, url, body=request_get_callback)
+    fpath = opj(d, 'data.bin')
+    with patch.object(HTTPDownloaderSession, 'min_segment_size', 1000), \
+            patch_config({'datalad.download.segments': '4'}):
+        downloader = HTTPDownloader()
+        downloader.download(url, path=fpath)
+    with open(fpath, 'rb') as f:
+        assert_equal(f.read(), content)
+    # the first range comes with the initial response, the truncated range
+    # was resumed where it stopped
+    assert_equal(len(requested_ranges), 4)
+    start, last = map(int, truncated[0][len('bytes='):].split('-'))
+    assert_in('bytes=%d-%d' % (start + 100, last), requested_ranges)
+
+    # without support for ranges, the content is downloaded in one go
+    del requested_ranges[:]
+    os.unlink(fpath)
+    with patch.object(HTTPDownloaderSession, 'min_segment_size', 1000):
+        HTTPDownloader().download(url, path=fpath)
+    assert_equal(requested_ranges, [])
+
+
+@skip_if(not httpretty, "no httpretty")
+@without_http_proxy
+@httpretty.activate
+@with_tempfile(mkdir=True)
+def test_resumed_download(d=None):
+    url = 'http://example.com/data.bin'
+    # more than a chunk, such that the first one is received completely
+    content = bytes(range(256)) * 4096 * 2
+    requests_ = []
+    etag = ['"v1"']
+    broken = []
+
+    def request_get_callback(request, uri, headers):
+        headers['ETag'] = etag[0]
+        range_ = request.headers.get('Range')
+        requests_.append((range_, request.headers.get('If-Range')))
+        if not broken:
+            # connection breaks after 3/4 of the content
+            broken.append(True)
+            headers['Content-Length'] = str(len(content))
+            return (200, headers, content[:len(content) * 3 // 4])
+        if not range_ or request.headers.get('If-Range') != etag[0]:
+            return (200, headers, content)
+        start = int(range_[len('bytes='):-1])
+        headers['Content-Range'] = 'bytes %d-%d/%d' % (
+            start, len(content) - 1, len(content))
+        return (206, headers, content[start:])
+
+    httpretty.register_uri(httpretty.GET, url, body=request_get_callback)
+    fpath = opj(d, 'data.bin')
+    downloader = HTTPDownloader()
+    downloader.download(url, path=fpath)
+    with open(fpath, 'rb') as f:
+        assert_equal(f.read(), content)
+    # the second attempt continued after the last complete chunk
+    assert_equal(requests_[-1], ('bytes=%d-' % (1024 ** 2), '"v1"'))
+    temp_filepath = downloader._get_temp_download_filename(fpath)
+    assert_false(os.path.exists(temp_filepath))
+    assert_false(os.path.exists(
+        downloader._get_resume_info_filename(temp_filepath)))
+
+    # a partial download that is left behind is resumed, as long as the
+    # content did not change
+    for new_etag, expected_range in (('"v1"', 'bytes=100-'), ('"v2"', None)):
+        os.unlink(fpath)
+        with open(temp_filepath, 'wb') as f:
+            f.write(content[:100])
+        with open(downloader._get_resume_info_filename(temp_filepath),
+                  'w') as f:
+            f.write('{"url": "%s", "validator": "\\"v1\\"", "size": %d}'
+                    % (url, len(content)))
+        etag[0] = new_etag
+        del requests_[:]
+        downloader.download(url, path=fpath, overwrite=True)
+        with open(fpath, 'rb') as f:
+            assert_equal(f.read(), content)
+        assert_equal(requests_[-1][0], expected_range)
+
+
 class FakeLorisCredential(Token):
     """Credential to test scenarios."""
     _fixed_credentials = {'token' : 'testtoken' }
@@ -56,6 +56,7 @@ from datalad.interface.utils import (
     xfm_result,
     _process_results
 )
+from datalad.runner import telemetry as runner_telemetry
 from datalad.support.exceptions import (
     CapturedException,
     IncompleteResultsError,
@@ -869,10 +870,16 @@ def _execute_command_(
                     'custom_result_summary_renderer_pass_summary',
                     None)
 
+    # execution
+    cmd_results = cmd(*cmd_args, **cmd_kwargs)
+    if runner_telemetry.is_active() and inspect.isgenerator(cmd_results):
+        # attribute subprocess executions to this command
+        cmd_results = runner_telemetry.track_interface(
+            interface.__module__.split('.')[-1], cmd_results)
+
     # process main results
     for r in _process_results(
-            # execution
-            cmd(*cmd_args, **cmd_kwargs),
+            cmd_results,
             interface,
             allkwargs['on_failure'],
             # bookkeeping
@@ -230,6 +230,26 @@ _definitions = {
         'type': bool,
         'default': False,
     },
+    'datalad.customremotes.async-jobs': {
+        'ui': ('question', {
+               'title': 'Maximum number of concurrent jobs of a special remote process',
+               'text': "DataLad's special remotes that support git-annex's ASYNC protocol extension "
+                       "(currently: ora) serve all jobs of git-annex (e.g. 'git annex get -J8') with "
+                       "this many threads of a single process. With a value of 1 or less, git-annex "
+                       "starts a special remote process per job instead."}),
+        'type': EnsureInt(),
+        'default': 8,
+    },
+    'datalad.download.segments': {
+        'ui': ('question', {
+               'title': 'Number of concurrent connections to download a single file',
+               'text': 'If an HTTP server supports range requests, a large file is '
+                       'downloaded as this many byte ranges concurrently, each of at '
+                       'least 16 MB. With a value of 1 or less, files are downloaded '
+                       'with a single connection.'}),
+        'type': EnsureInt(),
+        'default': 1,
+    },
     'datalad.extensions.load': {
         'ui': ('question', {
                'title': 'DataLad extension packages to load',
@@ -514,12 +534,34 @@ _definitions = {
         'type': EnsureInt(),
         'default': 3,
     },
+    'datalad.archives.cache-size': {
+        'ui': ('question', {
+            'title': 'Maximal size (in bytes) of the cache of extracted archives',
+            'text': 'When the archives extracted by the datalad-archives '
+                    'special remote, or add-archive-content, exceed this '
+                    'size, the least recently used archives are removed from '
+                    'the cache. 0 disables the limit.'}),
+        'type': EnsureInt(),
+        'default': 0,
+    },
     'datalad.repo.backend': {
         'ui': ('question', {
                'title': 'git-annex backend',
                'text': 'Backend to use when creating git-annex repositories'}),
         'default': 'MD5E',
     },
+    'datalad.repo.contentinfo-cache': {
+        'ui': ('yesno', {
+               'title': 'Cache content listings of repositories',
+               'text': 'If enabled, parsed records of tracked repository '
+                       'content (git ls-files/ls-tree) are cached under '
+                       '.git/datalad/cache, keyed by the state of the Git '
+                       'index or the queried tree. This speeds up repeated '
+                       'status/save/diff queries on repositories with many '
+                       'files'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
     'datalad.repo.direct': {
         'ui': ('yesno', {
                'title': 'Direct Mode for git-annex repositories',
@@ -534,6 +576,20 @@ _definitions = {
         'type': EnsureInt(),
         'default': 8,
     },
+    'datalad.repo.worktree-cache': {
+        'ui': ('yesno', {
+               'title': 'Use Git worktree caches for status queries',
+               'text': 'If enabled, the worktree state of repositories is '
+                       'queried via `git status`, and Git\'s untracked cache '
+                       '(core.untrackedCache) and, where supported, its '
+                       'builtin filesystem monitor (core.fsmonitor) are '
+                       'enabled for each queried repository (unless already '
+                       'configured). Repeated status queries on large and '
+                       'mostly unmodified dataset hierarchies can be much '
+                       'faster'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
     'datalad.runtime.max-annex-jobs': {
         'ui': ('question', {
                'title': 'Maximum number of git-annex jobs to request when "jobs" option set to "auto" (default)',
@@ -548,6 +604,15 @@ _definitions = {
         'type': EnsureInt(),
         'default': 20,
     },
+    'datalad.runtime.max-batched-per-repo': {
+        'ui': ('question', {
+            'title': 'Maximum number of batched git-annex commands to run per repository',
+            'text': 'When more batched git-annex processes would be needed for a '
+                    'single repository, the least recently used idle one is '
+                    'closed. It is restarted on its next use. 0 disables the limit.'}),
+        'type': EnsureInt(),
+        'default': 8,
+    },
     'datalad.runtime.max-inactive-age': {
         'ui': ('question', {
             'title': 'Maximum time (in seconds) a batched command can be'
@@ -555,7 +620,8 @@ _definitions = {
             'text': 'Automatic cleanup of batched commands will consider an'
                     ' inactive command eligible for cleanup if more than this'
                     ' many seconds have transpired since the command\'s last'
-                    ' activity.'}),
+                    ' activity. Batched git-annex commands of a repository'
+                    ' are closed after this time of inactivity.'}),
         'type': EnsureInt(),
         'default': 60,
     },
@@ -568,6 +634,20 @@ _definitions = {
         'type': EnsureInt(),
         'default': 1,
     },
+    'datalad.runtime.native-gitconfig': {
+        'ui': ('yesno', {
+               'title': 'Read Git configuration without calling git-config',
+               'text': 'If enabled, configuration of datasets is read from '
+                       'Git config files directly, instead of calling '
+                       '`git config`. Parsed files are cached for the '
+                       'lifetime of a process, and reused as long as they '
+                       'remain unmodified. Setups that cannot be handled '
+                       '(e.g. configuration via GIT_CONFIG_PARAMETERS, or '
+                       '"hasconfig" include conditions) are still read via '
+                       'git-config'}),
+        'type': EnsureBool(),
+        'default': False,
+    },
     'datalad.runtime.pathspec-from-file': {
         'ui': ('question', {
             'title': 'Provide list of files to git commands via --pathspec-from-file',
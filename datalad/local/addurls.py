@@ -9,6 +9,7 @@
 """Create and update a dataset from a list of URLs.
 """
 
+import itertools
 import json
 import logging
 import os
@@ -127,11 +128,15 @@ class Formatter(string.Formatter):
 
 class RepFormatter(Formatter):
     """Extend Formatter to support a {_repindex} placeholder.
+
+    The number of repeats of each formatted value is kept in `repeats`, a dict
+    by default.  Any other object that supports `in`, item access and item
+    assignment can be passed instead.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, repeats=None, **kwargs):
         super(RepFormatter, self).__init__(*args, **kwargs)
-        self.repeats = {}
+        self.repeats = {} if repeats is None else repeats
         self.repindex = 0
 
     def format(self, *args, **kwargs):
@@ -379,10 +384,27 @@ def fmt_to_name(format_string, num_to_name):
         return name
 
 
-INPUT_TYPES = ["ext", "csv", "tsv", "json"]
+INPUT_TYPES = ["ext", "csv", "tsv", "json", "jsonl"]
 
 
-def _read(stream, input_type):
+def _iter_json_lines(stream):
+    for lineno, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.decoder.JSONDecodeError as e:
+            raise ValueError(
+                f"Failed to read JSON from line {lineno} of stream {stream}"
+            ) from e
+
+
+def _iter_read(stream, input_type):
+    """Like `_read`, but provide the rows as an iterator.
+
+    CSV, TSV, and JSON lines input is read from `stream` only as the rows are
+    consumed, while a JSON array is loaded as a whole.
+    """
     if input_type in ["csv", "tsv"]:
         import csv
         csvrows = csv.reader(stream,
@@ -395,17 +417,25 @@ def _read(stream, input_type):
         lgr.debug("Taking %s fields from first line as headers: %s",
                   len(headers), headers)
         idx_map = dict(enumerate(headers))
-        rows = [dict(zip(headers, r)) for r in csvrows]
+        rows = (dict(zip(headers, r)) for r in csvrows)
     elif input_type == "json":
-        import json
         try:
-            rows = json.load(stream)
+            rows = iter(json.load(stream))
         except json.decoder.JSONDecodeError as e:
             raise ValueError(
                 f"Failed to read JSON from stream {stream}") from e
         # For json input, we do not support indexing by position,
         # only names.
         idx_map = {}
+    elif input_type == "jsonl":
+        rows = _iter_json_lines(stream)
+        try:
+            first_row = next(rows)
+        except StopIteration:
+            raise ValueError("Failed to read JSONL rows from {}"
+                             .format(stream))
+        rows = itertools.chain([first_row], rows)
+        idx_map = {}
     else:
         raise ValueError(
             "input_type {} is invalid. Known values: {}"
@@ -413,19 +443,31 @@ def _read(stream, input_type):
     return rows, idx_map
 
 
+def _read(stream, input_type):
+    rows, idx_map = _iter_read(stream, input_type)
+    return list(rows), idx_map
+
+
+def _get_input_type(fname, input_type):
+    """Resolve the "ext" input type of `fname`.
+    """
+    if input_type != "ext":
+        return input_type
+    if fname == "-":
+        return "json"
+    extension = os.path.splitext(fname)[1]
+    if extension == ".json":
+        return "json"
+    elif extension == ".jsonl":
+        return "jsonl"
+    elif extension == ".tsv":
+        return "tsv"
+    return "csv"
+
+
 def _read_from_file(fname, input_type):
     from_stdin = fname == "-"
-    if input_type == "ext":
-        if from_stdin:
-            input_type = "json"
-        else:
-            extension = os.path.splitext(fname)[1]
-            if extension == ".json":
-                input_type = "json"
-            elif extension == ".tsv":
-                input_type = "tsv"
-            else:
-                input_type = "csv"
+    input_type = _get_input_type(fname, input_type)
 
     fd = sys.stdin if from_stdin else open(fname)
     try:
@@ -753,19 +795,62 @@ def extract(rows, colidx_to_name=None,
     for each row and the second item a list subdataset paths, sorted
     breadth-first.
     """
-    meta = ensure_list(meta)
     colidx_to_name = colidx_to_name or {}
 
     # Formatter for everything but file names
     fmt = Formatter(colidx_to_name, missing_value)
     format_url = partial(fmt.format, url_format)
+    info_fns = _get_info_fns(rows[0], fmt, colidx_to_name, url_format,
+                             exclude_autometa, meta, key)
+
+    rows_with_url = []
+    infos = []
+    for idx, row in enumerate(rows):
+        try:
+            url = format_url(row)
+        except KeyError as exc:
+            raise _get_placeholder_exception(
+                exc, "URL", row)
+        if not url or url == missing_value:
+            continue  # pragma: no cover, peephole optimization
+        rows_with_url.append(row)
+        info = {"url": url, "input_idx": idx}
+        for fn in info_fns:
+            fn(info, row)
+        infos.append(info)
+
+    n_dropped = len(rows) - len(rows_with_url)
+    if n_dropped:
+        lgr.warning("Dropped %d row(s) that had an empty URL", n_dropped)
+
+    # Format the filename in a second pass so that we can provide
+    # information about the formatted URLs.
+    add_extra_filename_values(filename_format, rows_with_url,
+                              [i["url"] for i in infos],
+                              dry_run)
+
+    # For the file name, we allow the _repindex special key.
+    format_filename = partial(
+        RepFormatter(colidx_to_name, missing_value).format,
+        filename_format)
+    subpaths = _format_filenames(format_filename, rows_with_url, infos)
+    return infos, list(sort_paths(subpaths))
+
 
+def _get_info_fns(first_row, fmt, colidx_to_name, url_format,
+                  exclude_autometa, meta, key):
+    """Return functions that add metadata and key information of a row.
+
+    Each function is called with the information dict of a row, and the row.
+    Automatic metadata fields are taken from `first_row`.
+    """
+    meta = ensure_list(meta)
     auto_meta_args = []
     if exclude_autometa not in ["*", ""]:
         urlcol = fmt_to_name(url_format, colidx_to_name)
         # TODO: Try to normalize invalid fields, checking for any
         # collisions.
-        metacols = (c for c in sorted(rows[0].keys()) if c != urlcol)
+        metacols = (c for c in sorted(first_row.keys()) if c != urlcol)
         if exclude_autometa:
             metacols = (c for c in metacols
                         if not re.search(exclude_autometa, c))
@@ -788,39 +873,176 @@ def extract(rows, colidx_to_name=None,
         def set_key(info, row):
             info["key"] = key_parser.parse(row)
         info_fns.append(set_key)
+    return info_fns
 
-    rows_with_url = []
-    infos = []
+
+def _iter_extract(rows, colidx_to_name=None,
+                  url_format="{0}", filename_format="{1}",
+                  exclude_autometa=None, meta=None, key=None,
+                  dry_run=False, missing_value=None, repeats=None):
+    """Like `extract`, but process `rows` one at a time.
+
+    Parameters
+    ----------
+    rows : iterable of dict
+    colidx_to_name : dict, optional
+        Mapping from a position index to a column name.
+    repeats : optional
+        Passed to `RepFormatter`.
+
+    All other parameters match those described in `AddUrls`.
+
+    Returns
+    -------
+    Generator of tuples where the first item is a dict of extracted
+    information for a row, and the second item is a list of the subdataset
+    paths of this row.
+    """
+    colidx_to_name = colidx_to_name or {}
+
+    fmt = Formatter(colidx_to_name, missing_value)
+    format_url = partial(fmt.format, url_format)
+    format_filename = partial(
+        RepFormatter(colidx_to_name, missing_value, repeats=repeats).format,
+        filename_format)
+
+    file_fields = list(get_fmt_names(filename_format))
+    add_url_parts = any(i.startswith("_url") for i in file_fields)
+    add_url_filename = any(i.startswith("_url_filename") for i in file_fields)
+    if add_url_filename and not dry_run:
+        raise ValueError(
+            "_url_filename placeholders require requesting all URLs up "
+            "front, and are not supported when streaming")
+    dummy = get_file_parts("BASE.EXT", "_url_filename")
+
+    info_fns = None
+    n_dropped = 0
     for idx, row in enumerate(rows):
+        if info_fns is None:
+            info_fns = _get_info_fns(row, fmt, colidx_to_name, url_format,
+                                     exclude_autometa, meta, key)
         try:
             url = format_url(row)
         except KeyError as exc:
             raise _get_placeholder_exception(
                 exc, "URL", row)
         if not url or url == missing_value:
-            continue  # pragma: no cover, peephole optimization
-        rows_with_url.append(row)
+            n_dropped += 1
+            continue
         info = {"url": url, "input_idx": idx}
         for fn in info_fns:
             fn(info, row)
-        infos.append(info)
 
-    n_dropped = len(rows) - len(rows_with_url)
+        if add_url_parts:
+            row.update(get_url_parts(url))
+        if add_url_filename:
+            row.update({k: v + str(idx - n_dropped)
+                        for k, v in dummy.items()})
+        try:
+            filename = format_filename(row)
+        except KeyError as exc:
+            raise _get_placeholder_exception(
+                exc, "file name", row)
+        filename, spaths = get_subpaths(filename)
+        info["filename"] = filename
+        info["subpath"] = spaths[-1] if spaths else None
+        yield info, spaths
+
     if n_dropped:
         lgr.warning("Dropped %d row(s) that had an empty URL", n_dropped)
 
-    # Format the filename in a second pass so that we can provide
-    # information about the formatted URLs.
-    add_extra_filename_values(filename_format, rows_with_url,
-                              [i["url"] for i in infos],
-                              dry_run)
 
-    # For the file name, we allow the _repindex special key.
-    format_filename = partial(
-        RepFormatter(colidx_to_name, missing_value).format,
-        filename_format)
-    subpaths = _format_filenames(format_filename, rows_with_url, infos)
-    return infos, list(sort_paths(subpaths))
+class _IndexedCounts(object):
+    """Counts by name in a table of a `_FilenameIndex`, for `RepFormatter`.
+    """
+
+    def __init__(self, db, table):
+        self._db = db
+        self._table = table
+        db.execute(f"DROP TABLE IF EXISTS {table}")
+        db.execute(f"CREATE TABLE {table} (name TEXT PRIMARY KEY, n INTEGER)")
+
+    def _get(self, name):
+        row = self._db.execute(
+            f"SELECT n FROM {self._table} WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def __contains__(self, name):
+        return self._get(name) is not None
+
+    def __getitem__(self, name):
+        n = self._get(name)
+        if n is None:
+            raise KeyError(name)
+        return n
+
+    def __setitem__(self, name, n):
+        self._db.execute(
+            f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?)", (name, n))
+
+
+class _FilenameIndex(object):
+    """Index of the file names of all rows, to handle collisions when streaming.
+
+    The index is kept in a temporary on-disk SQLite database, so its memory
+    use does not grow with the number of rows.
+    """
+
+    def __init__(self):
+        import sqlite3
+
+        # An empty name gives a temporary on-disk database, which is removed
+        # when closed. The index is filled and queried by one thread at a
+        # time, but not necessarily the one that created it.
+        self._db = sqlite3.connect("", check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE names (name TEXT PRIMARY KEY, first INTEGER, "
+            "last INTEGER, count INTEGER, value TEXT, differ INTEGER)")
+
+    def add(self, info):
+        """Add the file name of the row with the extracted information `info`.
+        """
+        value = json.dumps([info["url"], info.get("meta_args")],
+                           sort_keys=True)
+        self._db.execute(
+            "INSERT INTO names VALUES (?, ?, ?, 1, ?, 0) "
+            "ON CONFLICT(name) DO UPDATE SET "
+            "last = excluded.last, count = count + 1, "
+            "differ = differ OR value != excluded.value",
+            (info["filename"], info["input_idx"], info["input_idx"], value))
+
+    def collisions(self, mismatches_only=False):
+        """Generate file names that more than one row produces.
+
+        Parameters
+        ----------
+        mismatches_only : boolean, optional
+            Only consider collisions where at least one colliding row has a
+            different URL or metadata field value.
+        """
+        query = "SELECT name FROM names WHERE count > 1"
+        if mismatches_only:
+            query += " AND differ"
+        for name, in self._db.execute(query):
+            yield name
+
+    def is_taken(self, info, last_wins=True):
+        """Whether the row with the information `info` wins a collision.
+        """
+        first, last = self._db.execute(
+            "SELECT first, last FROM names WHERE name = ?",
+            (info["filename"],)).fetchone()
+        return info["input_idx"] == (last if last_wins else first)
+
+    def counts(self, table):
+        """Return (cleared) counts by name in `table`, for `RepFormatter`.
+        """
+        return _IndexedCounts(self._db, table)
+
+    def close(self):
+        self._db.close()
 
 
 def _add_url(row, ds, repo, options=None, drop_after=False):
@@ -1081,6 +1303,312 @@ def _add_urls(rows, ds, repo, ifexists=None, options=None,
                 yield res
 
 
+def _add_rows_to_ds(ds, ds_path, rows, version_urls=False, **kwargs):
+    """Add the URLs of `rows` to the (sub)dataset `ds`.
+
+    Parameters
+    ----------
+    ds : Dataset
+    ds_path : str
+        Path of the top-level dataset, which the file names of `rows` are
+        relative to.
+    rows : sequence of dict
+    version_urls : boolean, optional
+
+    All other keyword arguments are passed to `_add_urls`.
+    """
+    for row in rows:
+        # Add additional information that we'll need for various
+        # operations.
+        filename_abs = op.join(ds_path, row["filename"])
+        ds_filename = op.relpath(filename_abs, ds.path)
+        row.update({"filename_abs": filename_abs,
+                    "ds_filename": ds_filename})
+
+    repo = ds.repo  # "expensive" so we get it once
+
+    if version_urls:
+        num_urls = len(rows)
+        log_progress(lgr.info, "addurls_versionurls",
+                     "Versioning %d URLs", num_urls,
+                     label="Versioning URLs",
+                     total=num_urls, unit=" URLs")
+        for row in rows:
+            url = row["url"]
+            try:
+                # TODO: make get_versioned_url more efficient while going
+                # through the same bucket(s)
+                row["url"] = get_versioned_url(url)
+            except (ValueError, NotImplementedError) as exc:
+                ce = CapturedException(exc)
+                # We don't expect this to happen because get_versioned_url
+                # should return the original URL if it isn't an S3 bucket.
+                # It only raises exceptions if it doesn't know how to
+                # handle the scheme for what looks like an S3 bucket.
+                lgr.warning("error getting version of %s: %s", row["url"], ce)
+            log_progress(lgr.info, "addurls_versionurls",
+                         "Versioned result for %s: %s", url, row["url"],
+                         update=1, increment=True)
+        log_progress(lgr.info, "addurls_versionurls", "Finished versioning URLs")
+
+    yield from _add_urls(rows, ds, repo, **kwargs)
+
+
+# Number of rows that are processed at once when streaming
+STREAM_CHUNK_SIZE = 10000
+
+
+def _open_records_stream(url_file, input_type):
+    """Return a function to start another pass over the rows of `url_file`.
+
+    The returned function gives a context manager, which provides an iterator
+    over the rows and a mapping from a position index to a column name.
+    Standard input (`url_file` "-") is copied to a temporary file to be able
+    to read it more than once.
+    """
+    from contextlib import contextmanager
+
+    if not isinstance(url_file, str):
+        records = ensure_list(url_file)
+
+        @contextmanager
+        def open_records():
+            yield iter(records), {}
+        return open_records
+
+    input_type = _get_input_type(url_file, input_type)
+    if url_file == "-":
+        import shutil
+        import tempfile
+        spool = tempfile.TemporaryFile(mode="w+")
+        shutil.copyfileobj(sys.stdin, spool)
+
+        @contextmanager
+        def open_records():
+            spool.seek(0)
+            yield _iter_read(spool, input_type)
+    else:
+        @contextmanager
+        def open_records():
+            with open(url_file) as fd:
+                yield _iter_read(fd, input_type)
+    return open_records
+
+
+def _stream_addurls(ds, open_records, url_format, filename_format,
+                    exclude_autometa=None, meta=None, key=None,
+                    message=None, dry_run=False, annex_options=None,
+                    ifexists=None, missing_value=None, save=True,
+                    version_urls=False, cfg_proc=None, jobs=None,
+                    drop_after=False, on_collision="error",
+                    displayed_source=None):
+    """Add URLs to `ds` without holding all rows in memory.
+
+    A first pass over the rows of `open_records` indexes the file names (see
+    `_FilenameIndex`) to handle collisions, and finds the subdatasets to
+    create. A second pass adds the URLs, `STREAM_CHUNK_SIZE` rows at a time.
+    The files added to a dataset are saved with each chunk, and the new
+    states of the subdatasets are saved at the end.
+    """
+    from requests.exceptions import RequestException
+
+    from datalad.distribution.dataset import Dataset
+
+    if on_collision not in ["error", "error-if-different",
+                            "take-first", "take-last"]:
+        raise ValueError(f"Unsupported `on_collision` value: {on_collision}")
+
+    st_dict = get_status_dict(action="addurls", ds=ds)
+    extract_kwargs = dict(url_format=url_format,
+                          filename_format=filename_format,
+                          exclude_autometa=exclude_autometa, meta=meta,
+                          key=key, dry_run=dry_run,
+                          missing_value=missing_value)
+
+    index = _FilenameIndex()
+    try:
+        nrows = 0
+        subpaths = set()
+        try:
+            with open_records() as (records, colidx_to_name):
+                for info, spaths in _iter_extract(
+                        records, colidx_to_name,
+                        repeats=index.counts("repeats"), **extract_kwargs):
+                    index.add(info)
+                    subpaths.update(spaths)
+                    nrows += 1
+        except (ValueError, RequestException) as exc:
+            ce = CapturedException(exc)
+            yield dict(st_dict, status="error", message=str(ce),
+                       exception=ce)
+            return
+
+        if not nrows:
+            yield dict(st_dict, status="notneeded",
+                       message="No rows to process")
+            return
+
+        if on_collision in ["error", "error-if-different"]:
+            to_report = list(index.collisions(
+                mismatches_only=on_collision == "error-if-different"))
+            if to_report:
+                lgr.debug("Colliding names:\n%s", to_report)
+                yield dict(st_dict, status="error",
+                           message=("%s collided across rows; "
+                                    "troubleshoot by logging at debug level or "
+                                    "consider using {_repindex}",
+                                    single_or_plural(
+                                        "file name", "file names",
+                                        len(to_report), include_count=True)))
+                return
+        has_collisions = next(index.collisions(), None) is not None
+        last_wins = on_collision == "take-last"
+
+        def iter_rows():
+            with open_records() as (records, colidx_to_name):
+                for info, _ in _iter_extract(
+                        records, colidx_to_name,
+                        repeats=index.counts("repeats"), **extract_kwargs):
+                    if has_collisions and not index.is_taken(info, last_wins):
+                        lgr.debug("Ignoring collision of file name '%s' at "
+                                  "row %d", info["filename"],
+                                  info["input_idx"])
+                        if dry_run:
+                            lgr.info("Would ignore row %d due to collision",
+                                     info["input_idx"])
+                        continue
+                    yield info
+
+        if dry_run:
+            for subpath in sort_paths(subpaths):
+                lgr.info("Would create a subdataset at %s", subpath)
+            for row in iter_rows():
+                lgr.info("Would %s %s to %s",
+                         "register" if row.get("key") else "download",
+                         row["url"],
+                         os.path.join(ds.path, row["filename"]))
+                if "meta_args" in row:
+                    lgr.info("Metadata: %s",
+                             sorted(u"{}={}".format(k, v)
+                                    for k, v in row["meta_args"].items()))
+            yield dict(st_dict, status="ok", message="dry-run finished")
+            return
+
+        if not ds.repo:
+            # Populate a new dataset with the URLs.
+            yield from ds.create(
+                result_xfm=None,
+                return_type='generator',
+                result_renderer='disabled',
+                cfg_proc=cfg_proc)
+
+        # All subdatasets are known, create them before adding any URL
+        ds_path = ds.path
+        created_subds = []
+        for subpath in sort_paths(subpaths):
+            subds = Dataset(op.join(ds_path, subpath))
+            if subds.is_installed():
+                lgr.debug(
+                    "Not creating subdataset at existing path: %s",
+                    subds.path)
+                continue
+            for res in subds.create(result_xfm=None,
+                                    cfg_proc=cfg_proc,
+                                    result_renderer='disabled',
+                                    return_type='generator'):
+                if res.get("action") == "create":
+                    res["addurls.refds"] = ds_path
+                yield res
+            created_subds.append(subpath)
+
+        def keyfn(d):
+            # The top-level dataset has a subpath of None.
+            return d.get("subpath") or ""
+
+        def iter_chunks():
+            """The "producer" of rows by dataset, a chunk at a time"""
+            rows = iter_rows()
+            for chunk_idx in itertools.count():
+                chunk = list(itertools.islice(rows, STREAM_CHUNK_SIZE))
+                if not chunk:
+                    return
+                for subpath, ds_rows in groupby_sorted(chunk, key=keyfn):
+                    yield chunk_idx, subpath, tuple(ds_rows)
+
+        def get_message(nfiles, nds=None):
+            if message:
+                return message
+            target = f" to {nds} (sub)datasets" if nds is not None else ""
+            extra_msgs = []
+            if nds is not None and created_subds:
+                extra_msgs.extend(
+                    [f"{len(created_subds)} subdatasets were created", ''])
+            return f"""\
+[DATALAD] add {single_or_plural("file", "files", nfiles, include_count=True)}{target} from URLs
+
+{os.linesep.join(extra_msgs)}
+url_file={displayed_source}
+url_format='{url_format}'
+filename_format='{filename_format}'"""
+
+        # Subdatasets with rows, and the number of added files of each chunk
+        subpaths_with_rows = set()
+        nadded = []
+
+        def addurls_to_ds(args):
+            """The "consumer" for ProducerConsumer parallel execution"""
+            _, subpath, rows = args
+            subpaths_with_rows.add(subpath)
+            subds = Dataset(op.join(ds_path, subpath)) if subpath else ds
+            # Bounded by the chunk size
+            files_to_save = []
+            for r in _add_rows_to_ds(subds, ds_path, rows,
+                                     version_urls=version_urls,
+                                     ifexists=ifexists,
+                                     options=annex_options,
+                                     drop_after=drop_after, by_key=key):
+                if r["status"] == "ok" and r.get("type") == "file" \
+                        and r.get("action") in ["addurl", "addurls"]:
+                    files_to_save.append(r["path"])
+                yield r
+            if save and files_to_save:
+                nadded.append(len(files_to_save))
+                # No other job uses this dataset (see `no_ds_in_futures`)
+                yield from subds.save(
+                    files_to_save,
+                    message=get_message(len(files_to_save)),
+                    result_renderer='disabled',
+                    return_type='generator')
+
+        def no_ds_in_futures(futures, chunk_subpath):
+            # A (batched) annex process must not be used by two jobs at once
+            return all(k[1] != chunk_subpath[1] for k in futures)
+
+        yield from ProducerConsumerProgressLog(
+            iter_chunks(),
+            addurls_to_ds,
+            agg=lambda *args: nrows,
+            safe_to_consume=no_ds_in_futures,
+            producer_future_key=lambda chunk: chunk[:2],
+            jobs=jobs,
+            log_filter=_log_filter_addurls,
+            unit="files",
+            lgr=lgr,
+        )
+    finally:
+        index.close()
+
+    if save and subpaths:
+        # The files were saved already, only record the new states of the
+        # subdatasets
+        yield from ds.save(
+            [op.join(ds_path, p) for p in sorted(subpaths)],
+            message=get_message(sum(nadded), len(subpaths_with_rows)),
+            jobs=jobs,
+            result_renderer='disabled',
+            return_type='generator')
+
+
 @build_doc
 class Addurls(Interface):
     """Create and update a dataset from a list of URLs.
@@ -1216,9 +1744,11 @@ class Addurls(Interface):
             args=("-t", "--input-type"),
             metavar="TYPE",
             doc="""Whether `URL-FILE` should be considered a CSV file, TSV
-            file, or JSON file. The default value, "ext", means to consider
-            `URL-FILE` as a JSON file if it ends with ".json" or a TSV file if
-            it ends with ".tsv". Otherwise, treat it as a CSV file.""",
+            file, JSON file, or JSON lines file (one JSON object per line).
+            The default value, "ext", means to consider `URL-FILE` as a JSON
+            file if it ends with ".json", a JSON lines file if it ends with
+            ".jsonl", or a TSV file if it ends with ".tsv". Otherwise, treat
+            it as a CSV file.""",
             constraints=EnsureChoice(*INPUT_TYPES)),
         exclude_autometa=Parameter(
             args=("-x", "--exclude-autometa"),
@@ -1323,6 +1853,19 @@ class Addurls(Interface):
             the same URL and metadata. "take-first" or "take-last" indicate to
             instead take the first row or last row from each set of colliding
             rows."""),
+        streaming=Parameter(
+            args=("--streaming",),
+            action="store_true",
+            doc="""Process the rows of `URL-FILE` as they are read, instead of
+            loading all of them first, so that memory use does not grow with
+            the number of rows. File name collisions are detected with an
+            on-disk index, which requires reading `URL-FILE` twice (standard
+            input is copied to a temporary file for that). Rows are added in
+            chunks, and the files added to a dataset are saved with a commit
+            per chunk. The new states of subdatasets are saved in a final
+            commit. Use a CSV, TSV, or JSON lines `URL-FILE`, as a JSON array
+            is still loaded at once. The "_url_filename" placeholders are not
+            supported in this mode."""),
     )
 
     result_renderer = "tailored"
@@ -1337,7 +1880,7 @@ class Addurls(Interface):
                  message=None, dry_run=False, fast=False, ifexists=None,
                  missing_value=None, save=True, version_urls=False,
                  cfg_proc=None, jobs=None, drop_after=False,
-                 on_collision="error"):
+                 on_collision="error", streaming=False):
         # This was to work around gh-2269. That's fixed, but changing the
         # positional argument names now would cause breakage for any callers
         # that used these arguments as keyword arguments.
@@ -1375,6 +1918,25 @@ class Addurls(Interface):
                     yield dict(st_dict, status="error", message=old_msg)
                     return
 
+        if streaming:
+            if isinstance(url_file, str):
+                if url_file != "-":
+                    url_file = str(resolve_path(url_file, dataset))
+                displayed_source = "'{}'".format(urlfile)
+            else:
+                displayed_source = "<records>"
+            yield from _stream_addurls(
+                ds, _open_records_stream(url_file, input_type),
+                url_format, filename_format,
+                exclude_autometa=exclude_autometa, meta=meta, key=key,
+                message=message, dry_run=dry_run,
+                annex_options=["--fast"] if fast else [],
+                ifexists=ifexists, missing_value=missing_value, save=save,
+                version_urls=version_urls, cfg_proc=cfg_proc, jobs=jobs,
+                drop_after=drop_after, on_collision=on_collision,
+                displayed_source=displayed_source)
+            return
+
         if isinstance(url_file, str):
             if url_file != "-":
                 url_file = str(resolve_path(url_file, dataset))
@@ -1464,14 +2026,6 @@ class Addurls(Interface):
             else:
                 subds_path = ds_path
 
-            for row in rows:
-                # Add additional information that we'll need for various
-                # operations.
-                filename_abs = op.join(ds_path, row["filename"])
-                ds_filename = op.relpath(filename_abs, subds_path)
-                row.update({"filename_abs": filename_abs,
-                            "ds_filename": ds_filename})
-
             subds = Dataset(subds_path)
 
             if subds.is_installed():
@@ -1487,36 +2041,12 @@ class Addurls(Interface):
                         res["addurls.refds"] = ds_path
                     yield res
                 created_subds.append(subpath)
-            repo = subds.repo  # "expensive" so we get it once
-
-            if version_urls:
-                num_urls = len(rows)
-                log_progress(lgr.info, "addurls_versionurls",
-                             "Versioning %d URLs", num_urls,
-                             label="Versioning URLs",
-                             total=num_urls, unit=" URLs")
-                for row in rows:
-                    url = row["url"]
-                    try:
-                        # TODO: make get_versioned_url more efficient while going
-                        # through the same bucket(s)
-                        row["url"] = get_versioned_url(url)
-                    except (ValueError, NotImplementedError) as exc:
-                        ce = CapturedException(exc)
-                        # We don't expect this to happen because get_versioned_url
-                        # should return the original URL if it isn't an S3 bucket.
-                        # It only raises exceptions if it doesn't know how to
-                        # handle the scheme for what looks like an S3 bucket.
-                        lgr.warning("error getting version of %s: %s", row["url"], ce)
-                    log_progress(lgr.info, "addurls_versionurls",
-                                 "Versioned result for %s: %s", url, row["url"],
-                                 update=1, increment=True)
-                log_progress(lgr.info, "addurls_versionurls", "Finished versioning URLs")
 
             subds_files_to_add = set()
-            for r in _add_urls(rows, subds, repo,
-                               ifexists=ifexists, options=annex_options,
-                               drop_after=drop_after, by_key=key):
+            for r in _add_rows_to_ds(subds, ds_path, rows,
+                                     version_urls=version_urls,
+                                     ifexists=ifexists, options=annex_options,
+                                     drop_after=drop_after, by_key=key):
                 if r["status"] == "ok":
                     subds_files_to_add.add(r["path"])
                 yield r
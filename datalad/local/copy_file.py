@@ -12,8 +12,8 @@ __docformat__ = 'restructuredtext'
 
 
 import logging
+import os
 import os.path as op
-from shutil import copyfile
 import sys
 
 from datalad.interface.base import Interface
@@ -32,9 +32,14 @@ from datalad.distribution.dataset import (
     require_dataset,
 )
 from datalad.support.annexrepo import AnnexRepo
-from datalad.support.exceptions import CapturedException
+from datalad.support.exceptions import (
+    CapturedException,
+    CommandError,
+)
 from datalad.utils import (
+    copy_file_content,
     ensure_list,
+    generate_chunks,
     get_dataset_root,
     Path,
 )
@@ -48,6 +53,10 @@ from functools import lru_cache
 
 lgr = logging.getLogger('datalad.local.copy_file')
 
+# Number of files for which annex information is queried, and content is
+# reinjected, at once
+_COPY_CHUNK_SIZE = 1000
+
 
 class _CachedRepo(object):
     """Custom wrapper around a Repo instance
@@ -65,6 +74,16 @@ class _CachedRepo(object):
         self._repo = Dataset(path).repo
         self._tmpdir = None
         self._ismanagedbranch = None
+        # records queried ahead of time by prefetch_annexinfo(), consumed
+        # on first access
+        self._annexinfo = {}
+        self._whereis = {}
+        # (src, dest) pairs of content to reinject
+        self._reinject_queue = []
+        # destinations by the key of the queued content
+        self._reinject_dests = {}
+        # batched annex processes used for copying, by name
+        self._batched_cmds = {}
 
     def __getattr__(self, name):
         """Fall back on the actual repo instance, if we have nothing"""
@@ -79,9 +98,41 @@ class _CachedRepo(object):
             for k, v in self._repo.get_special_remotes().items()
         }
 
+    def prefetch_annexinfo(self, fpaths):
+        """Query annex info of files, and whereis of their keys, at once
+
+        The records are returned by the next `get_file_annexinfo()` and
+        `get_whereis_key_by_specialremote()` call for the respective file
+        or key, instead of querying one file or key at a time.
+
+        Parameters
+        ----------
+        fpaths : list of Path
+        """
+        rpaths = [str(p.relative_to(self._unresolved_path)) for p in fpaths]
+        finfos = self._repo.get_content_annexinfo(
+            paths=rpaths,
+            eval_availability=True,
+        )
+        keys_by_rpath = {}
+        for fpath, rpath in zip(fpaths, rpaths):
+            finfo = finfos.get(self._repo.pathobj / rpath, {})
+            self._annexinfo[fpath] = finfo
+            if 'key' in finfo and finfo['key'] not in self._whereis:
+                keys_by_rpath[rpath] = finfo['key']
+        if keys_by_rpath:
+            # whereis takes many files, but only a single key per call
+            whereis = self._repo.whereis(
+                list(keys_by_rpath), output='full')
+            for rpath, key in keys_by_rpath.items():
+                self._whereis[key] = whereis.get(rpath, {})
+
     # there can be many files, and the records per file are smallish
     @lru_cache(maxsize=10000)
     def get_file_annexinfo(self, fpath):
+        finfo = self._annexinfo.pop(fpath, None)
+        if finfo is not None:
+            return finfo
         rpath = str(fpath.relative_to(self._unresolved_path))
         finfo = self._repo.get_content_annexinfo(
             paths=[rpath],
@@ -102,7 +153,9 @@ class _CachedRepo(object):
           Keys are special remote IDs, values are dicts with all relevant
           whereis properties, currently ('urls' (list), 'here' (bool)).
         """
-        whereis = self._repo.whereis(key, key=True, output='full')
+        whereis = self._whereis.pop(key, None)
+        if whereis is None:
+            whereis = self._repo.whereis(key, key=True, output='full')
         whereis_by_sr = {
             k: {prop: v[prop] for prop in ('urls', 'here')
                 if v.get(prop) not in (None, [])}
@@ -110,6 +163,98 @@ class _CachedRepo(object):
         }
         return whereis_by_sr
 
+    def calckey(self, fpath):
+        """Return the key of a file in this repository, via `calckey --batch`
+
+        Returns an empty string, if no key could be computed.
+        """
+        return self._get_batched('calckey')(str(fpath))
+
+    def fromkey(self, key, fpath):
+        """Create an annexed file for a key, via `fromkey --batch`
+
+        Returns the JSON record of git-annex.
+        """
+        return self._get_batched(
+            'fromkey', json=True,
+            # we use force, because in all likelihood there is no content for
+            # this key yet
+            annex_options=['--force'])((key, str(fpath)))
+
+    def _get_batched(self, codename, **kwargs):
+        bcmd = self._repo._batched.get(
+            codename, path=self._repo.path, **kwargs)
+        self._batched_cmds[codename] = bcmd
+        return bcmd
+
+    def close_batched(self):
+        """Close the batched annex processes used for copying
+
+        `fromkey --batch` only records the files it created in the index
+        when its process finishes.
+        """
+        for bcmd in self._batched_cmds.values():
+            bcmd.close()
+        self._batched_cmds = {}
+
+    def needs_content(self, key, dest):
+        """Whether content for `key` still needs to be placed for `dest`
+
+        Content of a key is reinjected only once, any further destination
+        with the same key is just recorded, to report the outcome of the
+        reinjection for it too.
+        """
+        dests = self._reinject_dests.get(key)
+        if dests is None:
+            return True
+        dests.append(dest)
+        return False
+
+    def reinject(self, src, dest, key):
+        """Queue the content at `src` to be reinjected for file `dest`
+
+        The content is only reinjected by `flush_reinject()`.
+        """
+        self._reinject_queue.append((src, dest))
+        self._reinject_dests[key] = [dest]
+
+    def flush_reinject(self):
+        """Reinject all queued content, with as few annex calls as possible
+
+        Returns
+        -------
+        dict
+          Error messages of failed reinjections, by destination path.
+        """
+        queue, self._reinject_queue = self._reinject_queue, []
+        dests_by_src_dest = {
+            d[0]: d for d in self._reinject_dests.values()}
+        self._reinject_dests = {}
+        failed = {}
+        # reinject takes any number of SRC DEST pairs, but let's not come
+        # close to the limit of the length of a command line
+        for chunk in generate_chunks(queue, 100):
+            try:
+                records = self._repo._call_annex_records(
+                    ['reinject'] + [p for pair in chunk for p in pair])
+            except CommandError as e:
+                records = e.kwargs.get('stdout_json') or [
+                    {'input': pair, 'success': False,
+                     'error-messages': [str(CapturedException(e))]}
+                    for pair in chunk]
+            for r in records:
+                if not r.get('success') and len(r.get('input', [])) == 2:
+                    src, dest = r['input']
+                    msg = '; '.join(r.get('error-messages', [])) \
+                        or 'failed to reinject content'
+                    # all files with this key lack the content
+                    for d in dests_by_src_dest.get(dest, [dest]):
+                        failed[d] = msg
+                    # do not leave the content behind in the temp dir
+                    if op.lexists(src):
+                        os.unlink(src)
+        return failed
+
     def is_managed_branch(self):
         if self._ismanagedbranch is None:
             self._ismanagedbranch = self._repo.is_managed_branch()
@@ -390,6 +535,20 @@ class CopyFile(Interface):
         repo_cache = _StaticRepoCache()
         # which paths to pass on to save
         to_save = []
+        # src/dest file pairs to be copied in bulk
+        pending = []
+
+        def copy_pending():
+            pairs = pending[:]
+            pending.clear()
+            for res in _copy_files(pairs, cache=repo_cache):
+                yield dict(
+                    res,
+                    **res_kwargs
+                )
+                if res.get('status', None) == 'ok':
+                    to_save.append(res['destination'])
+
         try:
             for src_path, dest_path in _yield_specs(specs_from):
                 src_path = Path(src_path)
@@ -411,6 +570,8 @@ class CopyFile(Interface):
                     msg_impossible = 'need destination path or target directory'
 
                 if msg_impossible:
+                    # keep the order of results
+                    yield from copy_pending()
                     yield dict(
                         path=str(src_path),
                         status='impossible',
@@ -424,6 +585,7 @@ class CopyFile(Interface):
                     if ds and ds.pathobj not in dest_file.parents:
                         # take time to compose proper error
                         dpath = str(target_dir if target_dir else dest_path)
+                        yield from copy_pending()
                         yield dict(
                             path=dpath,
                             status='error',
@@ -436,13 +598,10 @@ class CopyFile(Interface):
                         # only recursion could yield further results, which would
                         # all have the same issue, so call it over right here
                         break
-                    for res in _copy_file(src_file, dest_file, cache=repo_cache):
-                        yield dict(
-                            res,
-                            **res_kwargs
-                        )
-                        if res.get('status', None) == 'ok':
-                            to_save.append(res['destination'])
+                    pending.append((src_file, dest_file))
+                    if len(pending) >= _COPY_CHUNK_SIZE:
+                        yield from copy_pending()
+            yield from copy_pending()
         finally:
             # cleanup time
             repo_cache.clear()
@@ -534,6 +693,52 @@ def _yield_src_dest_filepaths(src, dest, src_base=None, target_dir=None):
     yield src, dest
 
 
+def _copy_files(pairs, cache):
+    """Transfer files from source to target datasets in bulk
+
+    Annex information of all source files is queried at once per source
+    repository, and all content is reinjected at once per destination
+    repository, before the result records are yielded.
+
+    Parameters
+    ----------
+    pairs : list
+      Source and destination file paths.
+    cache : StaticRepoCache
+
+    Yields
+    ------
+    dict
+      Result record, in the order of `pairs`.
+    """
+    srcs_by_repo = {}
+    for src, _ in pairs:
+        if not op.lexists(str(src)):
+            continue
+        src_repo = cache[src]
+        if src_repo is not None \
+                and issubclass(src_repo.get_repotype(), AnnexRepo):
+            srcs_by_repo.setdefault(src_repo, []).append(src)
+    for src_repo, srcs in srcs_by_repo.items():
+        src_repo.prefetch_annexinfo(srcs)
+
+    results = [
+        res
+        for src, dest in pairs
+        for res in _copy_file(src, dest, cache)
+    ]
+
+    failed = {}
+    for repo in cache.values():
+        repo.close_batched()
+        failed.update(repo.flush_reinject())
+    for res in results:
+        msg = failed.get(res.get('destination'))
+        if msg is not None and res.get('status') == 'ok':
+            res = dict(res, status='error', message=msg)
+        yield res
+
+
 def _copy_file(src, dest, cache):
     """Transfer a single file from a source to a target dataset
 
@@ -665,6 +870,7 @@ def _copy_file(src, dest, cache):
         ))
 
     if not avail_remote \
+            and 'objloc' not in finfo \
             and not dest_repo.get_file_annexinfo(dest).get('has_content'):
         # not having set any remotes is not a problem, if the file content got
         # here via other means
@@ -747,7 +953,7 @@ def _replace_file(str_src, dest, str_dest, follow_symlinks):
         dest.unlink()
     else:
         dest.parent.mkdir(exist_ok=True, parents=True)
-    copyfile(str_src, str_dest, follow_symlinks=follow_symlinks)
+    copy_file_content(str_src, str_dest, follow_symlinks=follow_symlinks)
 
 
 def _place_filekey(finfo, str_src, dest, str_dest, dest_repo):
@@ -780,7 +986,13 @@ def _place_filekey(finfo, str_src, dest, str_dest, dest_repo):
     # https://github.com/datalad/datalad/issues/3357 that could prevent
     # information leakage across datasets
     if finfo.get('has_content', True):
-        dest_key = dest_repo.call_annex_oneline(['calckey', str_src])
+        dest_key = dest_repo.calckey(str_src)
+        if not dest_key:
+            return dict(
+                path=str_dest,
+                status='error',
+                message=('Failed to compute annex key for %s', str_src),
+            )
     else:
         lgr.debug(
             'File content not available, forced to reuse previous annex key: %s',
@@ -793,25 +1005,22 @@ def _place_filekey(finfo, str_src, dest, str_dest, dest_repo):
         # failing next on 'fromkey', due to a key mismatch.
         # this is more compatible with the nature of 'cp'
         dest.unlink()
-    res = dest_repo._call_annex_records(
-        # we use force, because in all likelihood there is no content for this key
-        # yet
-        ['fromkey', dest_key, str_dest, '--force'],
-    )
-    if any(not r['success'] for r in res):
+    res = dest_repo.fromkey(dest_key, str_dest)
+    if not (res and res.get('success')):
         return dict(
             path=str_dest,
             status='error',
-            message='; '.join(
-                m for r in res for m in r.get('error-messages', [])),
+            message='; '.join((res or {}).get('error-messages', []))
+            or ('Failed to create file for key %s', dest_key),
         )
-    if 'objloc' in finfo:
+    if 'objloc' in finfo and dest_repo.needs_content(dest_key, str_dest):
         # we have the chance to place the actual content into the target annex
         # put in a tmp location, git-annex will move from there
         tmploc = dest_repo.get_tmpdir() / dest_key
         _replace_file(finfo['objloc'], tmploc, str(tmploc), follow_symlinks=False)
 
-        dest_repo.call_annex(['reinject', str(tmploc), str_dest])
+        # reinjected together with other files, see _copy_files()
+        dest_repo.reinject(str(tmploc), str_dest, dest_key)
 
     return dest_key
 
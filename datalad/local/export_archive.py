@@ -137,13 +137,15 @@ class ExportArchive(Interface):
             add_method = archive.add if archivetype == 'tar' else archive.write
 
 
-            repo_files = repo.get_content_info(ref='HEAD', untracked='no')
+            # stream the file records, no need to hold a report on
+            # the entire dataset in memory
             if isinstance(repo, AnnexRepo):
                 # add availability (has_content) info
-                repo_files = repo.get_content_annexinfo(ref='HEAD',
-                                                        init=repo_files,
-                                                        eval_availability=True)
-            for p, props in repo_files.items():
+                repo_files = repo.get_content_annexinfo_(
+                    ref='HEAD', eval_availability=True)
+            else:
+                repo_files = repo.get_content_info_(ref='HEAD')
+            for p, props in repo_files:
                 if 'key' in props and not props.get('has_content', False):
                     if missing_content in ('ignore', 'continue'):
                         (lgr.warning if missing_content == 'continue' else lgr.debug)(
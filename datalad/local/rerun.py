@@ -11,6 +11,7 @@
 __docformat__ = 'restructuredtext'
 
 
+import codecs
 import json
 import logging
 import os.path as op
@@ -286,14 +287,20 @@ def _revrange_as_results(dset, revrange):
     if not rev_lines:
         return
 
-    for rev_line in rev_lines:
-        # The strip() below is necessary because, with the format above, a
-        # commit without any parent has a trailing space. (We could also use a
-        # custom `rev-list --parents ...` call to avoid this.)
-        fields = rev_line.strip().split(" ")
+    # The strip() below is necessary because, with the format above, a
+    # commit without any parent has a trailing space. (We could also use a
+    # custom `rev-list --parents ...` call to avoid this.)
+    revs = [rev_line.strip().split(" ") for rev_line in rev_lines]
+    # read all commit objects through a single `git cat-file` process
+    # rather than calling `git log` for each of them
+    commits = ds_repo.cat_objects_(fields[0] for fields in revs)
+    for fields, commit in zip(revs, commits):
         rev, parents = fields[0], fields[1:]
         res = get_status_dict("run", ds=dset, commit=rev, parents=parents)
-        full_msg = ds_repo.format_commit("%B", rev)
+        full_msg = _get_commit_message(commit['content'])
+        if full_msg is None:
+            # let Git convert the message
+            full_msg = ds_repo.format_commit("%B", rev)
         try:
             msg, info = get_run_info(dset, full_msg)
         except ValueError as exc:
@@ -635,6 +642,34 @@ def _get_script_handler(script, since, revision):
     return fn
 
 
+def _get_commit_message(commit):
+    """Return the message of a raw commit object (`git cat-file commit`)
+
+    `commit` is the decoded object (str), or the raw object (bytes) if it
+    is not valid UTF-8. The message is decoded according to the `encoding`
+    header of the commit. If that is not possible, None is returned.
+    """
+    is_bytes = isinstance(commit, bytes)
+    # headers are separated from the message by the first empty line
+    headers, _, message = commit.partition(b"\n\n" if is_bytes else "\n\n")
+    if is_bytes:
+        headers = headers.decode("utf-8", errors="replace")
+    encoding = "utf-8"
+    for line in headers.split("\n"):
+        if line.startswith("encoding "):
+            encoding = line[len("encoding "):]
+    try:
+        if is_bytes:
+            return message.decode(encoding)
+        if codecs.lookup(encoding).name == "utf-8":
+            return message
+    except (LookupError, UnicodeDecodeError):
+        pass
+    # e.g. an unknown encoding, or a message in another encoding that
+    # happened to be valid UTF-8
+    return None
+
+
 def get_run_info(dset, message):
     """Extract run information from `message`
 
@@ -335,7 +335,8 @@ def test_add_archive_content(path_orig=None, url=None, repo_path=None):
     # tested in custom remote tests, but I guess not sufficiently well enough
     repo.drop(opj('1', '1 f.txt'))  # should be all kosher
     repo.get(opj('1', '1 f.txt'))
-    ok_archives_caches(repo.path, 1, persistent=True)
+    # a single member is read from the tarball, without extracting it
+    ok_archives_caches(repo.path, 0, persistent=True)
     ok_archives_caches(repo.path, 0, persistent=False)
 
     repo.drop(opj('1', '1 f.txt'))  # should be all kosher
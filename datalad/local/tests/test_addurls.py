@@ -348,6 +348,61 @@ def test_extract_csv_json_equal(input_type):
     eq_(json_output, csv_output)
 
 
+@pytest.mark.parametrize("input_type", ["csv", "jsonl"])
+def test_iter_extract(input_type):
+    if input_type == "csv":
+        keys = ST_DATA["header"]
+        stream = [",".join(keys)]
+        stream.extend(",".join(str(row[k]) for k in keys)
+                      for row in ST_DATA["rows"])
+    else:
+        stream = StringIO(
+            "".join(json.dumps(row) + "\n\n" for row in ST_DATA["rows"]))
+
+    kwds = dict(filename_format="{age_group}//{now_dead}//{name}-{_repindex}",
+                url_format="{name}_{debut_season}.com",
+                meta=["group={age_group}"])
+    infos, subpaths = au.extract(*au._read(deepcopy(stream), input_type),
+                                 **kwds)
+
+    index = au._FilenameIndex()
+    try:
+        rows, colidx_to_name = au._iter_read(stream, input_type)
+        # rows are read lazily
+        assert not isinstance(rows, list)
+        streamed = list(au._iter_extract(rows, colidx_to_name,
+                                         repeats=index.counts("repeats"),
+                                         **kwds))
+    finally:
+        index.close()
+    eq_([i for i, _ in streamed], infos)
+    eq_(set(p for _, spaths in streamed for p in spaths), set(subpaths))
+
+
+def test_filename_index():
+    index = au._FilenameIndex()
+    try:
+        for idx, (fname, url) in enumerate([("a", "u1"), ("b", "u2"),
+                                            ("a", "u1"), ("c", "u3"),
+                                            ("c", "u4"), ("c", "u3")]):
+            index.add({"filename": fname, "url": url, "input_idx": idx})
+        eq_(sorted(index.collisions()), ["a", "c"])
+        eq_(list(index.collisions(mismatches_only=True)), ["c"])
+        assert index.is_taken({"filename": "c", "input_idx": 5})
+        assert not index.is_taken({"filename": "c", "input_idx": 3})
+        assert index.is_taken({"filename": "c", "input_idx": 3},
+                              last_wins=False)
+        assert index.is_taken({"filename": "b", "input_idx": 1})
+
+        counts = index.counts("repeats")
+        assert "a" not in counts
+        counts["a"] = 2
+        eq_(counts["a"], 2)
+        assert_raises(KeyError, counts.__getitem__, "b")
+    finally:
+        index.close()
+
+
 def test_extract_wrong_input_type():
     assert_raises(ValueError,
                   au._read, None, "invalid_input_type")
@@ -641,6 +696,54 @@ class TestAddurls(object):
                        result_renderer='disabled')
             assert_in("Not creating subdataset at existing path", cml.out)
 
+    @with_tempfile(mkdir=True)
+    def test_addurls_streaming(self=None, path=None):
+        ds = Dataset(path).create(force=True)
+        jsonl_file = op.join(self.temp_dir, "test_addurls.jsonl")
+        with open(jsonl_file, "w") as f:
+            f.write("".join(json.dumps(row) + "\n" for row in self.data))
+
+        with patch.object(au, "STREAM_CHUNK_SIZE", 2):
+            ds.addurls(jsonl_file, "{url}", "{subdir}//{name}",
+                       streaming=True, result_renderer='disabled')
+        for subdir, fnames in (("foo", ["a", "c"]), ("bar", ["b"])):
+            for fname in fnames:
+                ok_exists(op.join(ds.path, subdir, fname))
+        assert_repo_status(ds.path)
+        eq_(set(ds.subdatasets(result_xfm="relpaths")), {"foo", "bar"})
+        ok_startswith(ds.repo.format_commit('%s', DEFAULT_BRANCH),
+                      "[DATALAD] add 3 files to 2 (sub)datasets")
+        # the files of each chunk are saved on their own
+        eq_(Dataset(op.join(ds.path, "foo")).repo.call_git(
+                ["log", "--format=%s"]).splitlines().count(
+                    "[DATALAD] add 1 file from URLs"),
+            2)
+
+        # collisions are detected before anything is added
+        with assert_raises(IncompleteResultsError) as raised:
+            ds.addurls(jsonl_file, "{url}", "{subdir}-coll",
+                       streaming=True, result_renderer='disabled')
+        assert_in("collided", str(raised.value))
+        assert_false(op.lexists(op.join(ds.path, "foo-coll")))
+
+        # only added files are saved, not their directories
+        (ds.pathobj / "unrelated").write_text("unrelated")
+        ds.addurls(jsonl_file, "{url}", "{subdir}-{_repindex}",
+                   streaming=True, result_renderer='disabled')
+        for fname in ["foo-0", "bar-0", "foo-1"]:
+            ok_exists(op.join(ds.path, fname))
+        assert_repo_status(ds.path, untracked=["unrelated"])
+        (ds.pathobj / "unrelated").unlink()
+
+        # standard input is read twice
+        with patch("sys.stdin", new=StringIO(json.dumps(self.data))):
+            ds.addurls("-", "{url}", "{subdir}-last",
+                       on_collision="take-last", streaming=True,
+                       result_renderer='disabled')
+        ok_file_has_content(op.join(ds.path, "foo-last"), "c content",
+                            strip=True)
+        assert_repo_status(ds.path)
+
     @with_tempfile(mkdir=True)
     def test_addurls_repindex(self=None, path=None):
         ds = Dataset(path).create(force=True)
@@ -9,12 +9,15 @@
 
 
 from os.path import join as opj
+from unittest.mock import patch
 
 from datalad.api import copy_file
 from datalad.consts import DATALAD_SPECIAL_REMOTE
 from datalad.distribution.dataset import Dataset
+from datalad.runner.telemetry import SubprocessTelemetry
 from datalad.tests.utils_pytest import (
     assert_in_results,
+    assert_result_count,
     assert_raises,
     assert_repo_status,
     assert_status,
@@ -391,3 +394,58 @@ def test_copy_file_nourl(serv_path=None, orig_path=None, tst_path=None):
         message='no known location of file content',
         path=str(no_avail_file),
     )
+
+
+@with_tempfile(mkdir=True)
+def test_copy_file_bulk(workdir=None):
+    workdir = Path(workdir)
+    src_ds = Dataset(workdir / 'src').create()
+    nfiles = 7
+    for i in range(nfiles):
+        (src_ds.pathobj / f'file{i}.dat').write_text(f'content {i}')
+    src_ds.save()
+    dest_ds = Dataset(workdir / 'dest').create()
+    # small chunks, to also exercise flushing in between
+    with patch('datalad.local.copy_file._COPY_CHUNK_SIZE', 3), \
+            SubprocessTelemetry() as telemetry:
+        res = dest_ds.copy_file(
+            [src_ds.pathobj / f'file{i}.dat' for i in range(nfiles)]
+            + [dest_ds.pathobj])
+    assert_status('ok', res)
+    eq_(len([r for r in res if r['action'] == 'copy_file']), nfiles)
+    for i in range(nfiles):
+        ok_file_has_content(dest_ds.pathobj / f'file{i}.dat', f'content {i}')
+        ok_(dest_ds.repo.file_has_content(f'file{i}.dat'))
+    counts = {s['command']: s['count'] for s in telemetry.summary()}
+    # content is injected with one call per chunk, and keys are computed
+    # and registered by a single batched process each per chunk
+    eq_(counts['git annex reinject'], 3)
+    eq_(counts['git annex calckey'], 3)
+    eq_(counts['git annex fromkey'], 3)
+    # availability is queried once for all files of the source dataset
+    ok_(counts['git annex whereis'] < nfiles)
+    # no leftovers of temporary copies
+    tmpdir = dest_ds.pathobj / '.git' / 'tmp' / 'datalad-copy'
+    eq_(list(tmpdir.iterdir()) if tmpdir.exists() else [], [])
+
+
+@with_tempfile(mkdir=True)
+def test_copy_file_same_content(workdir=None):
+    workdir = Path(workdir)
+    src_ds = Dataset(workdir / 'src').create()
+    for fname in ('a.dat', 'b.dat'):
+        (src_ds.pathobj / fname).write_text('same content')
+    src_ds.save()
+    for dataset in (True, False):
+        dest_ds = Dataset(workdir / f'dest{dataset}').create()
+        # without a dataset, the files are only added, not saved
+        res = copy_file(
+            [src_ds.pathobj / 'a.dat', src_ds.pathobj / 'b.dat',
+             dest_ds.pathobj],
+            dataset=dest_ds if dataset else None)
+        assert_result_count(res, 2, action='copy_file', status='ok')
+        eq_(dest_ds.repo.file_has_content(['a.dat', 'b.dat']), [True, True])
+        if dataset:
+            assert_repo_status(dest_ds.path)
+        else:
+            assert_repo_status(dest_ds.path, added=['a.dat', 'b.dat'])
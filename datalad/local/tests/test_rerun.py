@@ -29,6 +29,7 @@ from datalad.core.local.run import run_command
 from datalad.core.local.tests.test_run import last_commit_msg
 from datalad.distribution.dataset import Dataset
 from datalad.local.rerun import (
+    _get_commit_message,
     diff_revision,
     get_run_info,
     new_or_modified,
@@ -269,6 +270,33 @@ def test_rerun_chain(path=None):
     eq_(info["chain"], commits[:1])
 
 
+@with_tempfile(mkdir=True)
+def test_rerun_non_utf8_message(path=None):
+    ds = Dataset(path).create()
+    ds.run("echo x > out", message="caf\u00e9")
+    # recommit the run record with a message in another encoding
+    msg_file = op.join(path, ".git", "MSG")
+    with open(msg_file, "wb") as f:
+        f.write(last_commit_msg(ds.repo).encode("latin-1"))
+    ds.repo.call_git(["-c", "i18n.commitEncoding=ISO-8859-1",
+                      "commit", "--amend", "-F", msg_file])
+    res = ds.rerun(report=True, return_type="item-or-list")
+    eq_(res["run_message"], "caf\u00e9")
+    eq_(res["run_info"]["cmd"], "echo x > out")
+
+
+def test_get_commit_message():
+    for encoding in ("utf-8", "ISO-8859-1"):
+        commit = f"tree 1\nencoding {encoding}\n\ncaf\u00e9\n\nbody"
+        eq_(_get_commit_message(commit.encode(encoding)),
+            "caf\u00e9\n\nbody")
+    eq_(_get_commit_message("tree 1\n\ncaf\u00e9"), "caf\u00e9")
+    # a message that was decoded as UTF-8, but is in another encoding
+    eq_(_get_commit_message("tree 1\nencoding ISO-8859-1\n\nabc"), None)
+    # an unknown encoding
+    eq_(_get_commit_message(b"tree 1\nencoding bogus\n\ncaf\xe9"), None)
+
+
 @with_tempfile(mkdir=True)
 def test_rerun_just_one_commit(path=None):
     ds = Dataset(path).create()
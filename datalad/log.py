@@ -35,6 +35,54 @@ __all__ = [
     'with_result_progress',
 ]
 
+# The global config manager, once it was loaded. Until then, logging is
+# configured from environment variables only, to not require running
+# `git config` merely to import datalad
+_config = None
+# (default, value) of all settings that were read from the environment
+_config_from_env = {}
+# names of loggers whose level was set explicitly, which takes precedence
+# over the configured one
+_levels_set_explicitly = set()
+
+
+def _get_log_config(key, default=None):
+    """Return the value of a logging setting"""
+    if _config is not None:
+        return _config.get(key, default)
+    value = os.environ.get(
+        key.replace('-', '__').replace('.', '_').upper(), default)
+    _config_from_env[key] = (default, value)
+    return value
+
+
+def configure_from_config(cfg):
+    """Apply logging settings of the loaded global configuration
+
+    Settings from configuration files, or from overrides, are only known
+    once the global config manager was loaded. If they differ from the
+    environment that logging was set up from, it is set up again.
+
+    Parameters
+    ----------
+    cfg : ConfigManager
+    """
+    global _config
+    _config = cfg
+    changed = set(
+        k for k, (default, value) in _config_from_env.items()
+        if cfg.get(k, default) != value)
+    _config_from_env.clear()
+    if not changed:
+        return
+    lgr.debug("Reconfiguring logging for settings %s", sorted(changed))
+    if changed.difference(('datalad.log.level',)):
+        _lgr_helper.reset()
+        _lgr_helper.get_initialized_logger()
+    elif lgr.name not in _levels_set_explicitly:
+        _lgr_helper.set_level()
+
+
 # Snippets from traceback borrowed from duecredit which was borrowed from
 # PyMVPA upstream/2.4.0-39-g69ad545  MIT license (the same copyright as DataLad)
 
@@ -223,9 +271,9 @@ class ColorFormatter(logging.Formatter):
         logging.Formatter.__init__(self, msg)
 
     def _get_format(self, log_name=False, log_pid=False):
-        from datalad import cfg
         from datalad.config import anything2bool
-        show_timestamps = anything2bool(cfg.get('datalad.log.timestamp', False))
+        show_timestamps = anything2bool(
+            _get_log_config('datalad.log.timestamp', False))
         return (("" if not show_timestamps else "$BOLD%(asctime)-15s$RESET ") +
                 ("%(name)-15s " if log_name else "") +
                 ("{%(process)d}" if log_pid else "") +
@@ -575,10 +623,17 @@ class LoggerHelper(object):
         self.name = name
         self.logtarget = logtarget
         self.lgr = logging.getLogger(logtarget if logtarget is not None else name)
+        # handlers added by get_initialized_logger()
+        self._handlers = []
 
     def _get_config(self, var, default=None):
-        from datalad import cfg
-        return cfg.get(self.name.lower() + '.log.' + var, default)
+        return _get_log_config(self.name.lower() + '.log.' + var, default)
+
+    def reset(self):
+        """Remove all handlers that were added by this helper"""
+        for handler in self._handlers:
+            self.lgr.removeHandler(handler)
+        self._handlers = []
 
     def set_level(self, level=None, default='INFO'):
         """Helper to set loglevel for an arbitrary logger
@@ -589,6 +644,8 @@ class LoggerHelper(object):
         if level is None:
             # see if nothing in the environment
             level = self._get_config('level')
+        else:
+            _levels_set_explicitly.add(self.lgr.name)
         if level is None:
             level = default
 
@@ -676,14 +733,17 @@ class LoggerHelper(object):
         if is_interactive():
             phandler = ProgressHandler(other_handler=loghandler)
             phandler.filters.extend(loghandler.filters)
-            self.lgr.addHandler(phandler)
+            loghandler = phandler
         else:
             loghandler.addFilter(partial(filter_noninteractive_progress,
                                          self.lgr))
-            self.lgr.addHandler(loghandler)
+        self.lgr.addHandler(loghandler)
+        self._handlers.append(loghandler)
 
-        self.set_level()  # set default logging level
+        if self.lgr.name not in _levels_set_explicitly:
+            self.set_level()  # set default logging level
         return self.lgr
 
 
-lgr = LoggerHelper().get_initialized_logger()
+_lgr_helper = LoggerHelper()
+lgr = _lgr_helper.get_initialized_logger()
@@ -0,0 +1,294 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""
+Event loop based subprocess execution with stdout and stderr passed to protocol
+objects
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Iterable,
+    Optional,
+)
+
+from .nonasyncrunner import ThreadedRunner
+from .runnerthreads import (
+    _try_close,
+    IOState,
+    WriteThread,
+)
+
+lgr = logging.getLogger("datalad.runner.asyncrunner")
+
+
+class _EventLoopThread:
+    """Lazily started daemon thread that runs an asyncio event loop
+
+    A single instance of this class, and therefore a single thread, serves
+    all `AsyncioRunner` instances of a process.
+    """
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        with self.lock:
+            if self.loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="datalad-runner-loop",
+                    daemon=True,
+                ).start()
+                self.loop = loop
+            return self.loop
+
+
+_event_loop_thread = _EventLoopThread()
+if hasattr(os, 'register_at_fork'):
+    # the loop thread does not exist in a forked child
+    os.register_at_fork(after_in_child=_event_loop_thread._reset)
+
+
+class AsyncioRunner(ThreadedRunner):
+    """
+    A `ThreadedRunner` that serves subprocess I/O from a shared event loop
+
+    Instead of starting a reader thread for every captured output pipe, a
+    writer thread for stdin, and a thread that waits for the process exit,
+    for every subprocess, all of this is done by non-blocking callbacks of a
+    single asyncio event loop that runs in a dedicated thread, and is shared
+    by all instances of this class. Only a `Queue`-stdin is still served by
+    a `WriteThread`, because reading from the queue might block.
+
+    The event loop callbacks enqueue exactly the same events as the
+    threads of `ThreadedRunner`. Protocol callbacks are therefore still
+    executed by the thread that runs the command, or consumes the result
+    generator, and the protocol contract is unchanged.
+
+    This runner requires an event loop that supports watching pipes, i.e.,
+    it is not available on Windows.
+    """
+    # Maximum number of bytes that are read from, or written to, a pipe
+    # in a single call.
+    read_size = 65536
+
+    def __init__(self,
+                 cmd: str | list,
+                 protocol_class,
+                 stdin: Any,
+                 protocol_kwargs: Optional[dict] = None,
+                 timeout: Optional[float] = None,
+                 exception_on_error: bool = True,
+                 **popen_kwargs
+                 ):
+        """
+        See `ThreadedRunner.__init__()` for a documentation of the
+        parameters.
+        """
+        super().__init__(
+            cmd=cmd,
+            protocol_class=protocol_class,
+            stdin=stdin,
+            protocol_kwargs=protocol_kwargs,
+            timeout=timeout,
+            exception_on_error=exception_on_error,
+            **popen_kwargs)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # Sources with callbacks in the event loop. File numbers are added
+        # by the thread that starts the process, before the callbacks are
+        # scheduled. They are removed by the event loop thread, after the
+        # last event of a source was enqueued. `None` represents the
+        # process exit monitoring.
+        self.watched_sources: set[Optional[int]] = set()
+        self.stdin_data: Optional[memoryview] = None
+
+    def _get_stdin_bytes_written(self) -> Optional[int]:
+        if self.write_stdin and isinstance(self.stdin, bytes):
+            return len(self.stdin) - len(self.stdin_data)
+        return super()._get_stdin_bytes_written()
+
+    def _start_io(self):
+        self.loop = _event_loop_thread.get_loop()
+
+        current_time = time.time()
+        if self.timeout:
+            self.last_touched[None] = current_time
+
+        read_filenos = []
+        for catch, file_number in (
+                (self.catch_stderr, self.process_stderr_fileno),
+                (self.catch_stdout, self.process_stdout_fileno)):
+            if not catch:
+                continue
+            self.active_file_numbers.add(file_number)
+            self.last_touched[file_number] = current_time
+            read_filenos.append(file_number)
+
+        write_fileno = None
+        if self.write_stdin:
+            # No timeouts for stdin
+            self.active_file_numbers.add(self.process_stdin_fileno)
+            assert self.stdin_queue is not None
+            assert self.process.stdin is not None
+            if isinstance(self.stdin, bytes):
+                write_fileno = self.process_stdin_fileno
+                self.stdin_data = memoryview(self.stdin)
+                os.set_blocking(write_fileno, False)
+            else:
+                cmd_string = self.cmd if isinstance(self.cmd, str) \
+                    else " ".join(self.cmd)
+                self.stdin_enqueueing_thread = WriteThread(
+                    identifier="STDIN: " + cmd_string[:20],
+                    user_info=self.process_stdin_fileno,
+                    signal_queues=[self.output_queue],
+                    source_queue=self.stdin_queue,
+                    destination=self.process.stdin)
+                self.stdin_enqueueing_thread.start()
+
+        # The process must not be reaped before the pidfd is created,
+        # therefore create it right here
+        pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(self.process.pid)
+            except OSError:
+                # e.g. kernel without pidfd support
+                pass
+
+        self.watched_sources.update(read_filenos)
+        if write_fileno is not None:
+            self.watched_sources.add(write_fileno)
+        self.watched_sources.add(None)
+        self.loop.call_soon_threadsafe(
+            self._watch, read_filenos, write_fileno, pidfd)
+
+    # The following methods are executed in the event loop thread
+    def _watch(self,
+               read_filenos: list[int],
+               write_fileno: Optional[int],
+               pidfd: Optional[int]):
+        for file_number in read_filenos:
+            self.loop.add_reader(file_number, self._on_readable, file_number)
+        if write_fileno is not None:
+            self.loop.add_writer(write_fileno, self._on_writable, write_fileno)
+        if pidfd is not None:
+            self.loop.add_reader(pidfd, self._on_process_exit, pidfd)
+        else:
+            # fall back to waiting in a dedicated thread. The default
+            # executor must not be used for this, because it has a bounded
+            # number of workers, which long-running processes, e.g. of
+            # `BatchedCommand`s, could occupy all, so that the exit of
+            # any other process would never be noticed.
+            def _wait():
+                self.process.wait()
+                self.loop.call_soon_threadsafe(self._on_process_exit, None)
+
+            threading.Thread(
+                target=_wait,
+                name=f"datalad-runner-wait-{self.process.pid}",
+                daemon=True,
+            ).start()
+
+    def _unwatch(self, file_number: Optional[int]):
+        if file_number not in self.watched_sources:
+            return
+        if file_number == self.process_stdin_fileno \
+                and self.stdin_data is not None:
+            self.loop.remove_writer(file_number)
+        else:
+            self.loop.remove_reader(file_number)
+        self.watched_sources.discard(file_number)
+
+    def _on_readable(self, file_number: int):
+        try:
+            data = os.read(file_number, self.read_size)
+        except OSError:
+            data = b""
+        if data:
+            self.output_queue.put((file_number, IOState.ok, data))
+            return
+        # EOF
+        self.output_queue.put((file_number, IOState.ok, None))
+        self._unwatch(file_number)
+
+    def _on_writable(self, file_number: int):
+        data = self.stdin_data
+        try:
+            written = os.write(file_number, data[:self.read_size])
+            self.stdin_data = data = data[written:]
+            if len(data) > 0:
+                return
+        except BlockingIOError:
+            return
+        except OSError:
+            # The process most likely closed its stdin
+            pass
+        self.loop.remove_writer(file_number)
+        _try_close(self.process.stdin)
+        self.output_queue.put((file_number, IOState.ok, None))
+        self.watched_sources.discard(file_number)
+
+    def _on_process_exit(self, pidfd: Optional[int]):
+        if pidfd is not None:
+            self.loop.remove_reader(pidfd)
+            os.close(pidfd)
+        self.output_queue.put((None, IOState.process_exit, None))
+        self.watched_sources.discard(None)
+
+    # The following methods are executed in the thread that runs the command
+    def _unwatch_and_wait(self, file_numbers: Iterable[Optional[int]]):
+        """Remove event loop callbacks of the given file numbers
+
+        This must be done before a file number is closed, because it
+        might be reused immediately. The loop callbacks are FIFO-ordered,
+        so that this also covers callbacks that were not yet installed.
+        """
+        file_numbers = [
+            f for f in file_numbers
+            if f is not None and f in self.watched_sources]
+        if not file_numbers:
+            return
+        done: Future = Future()
+
+        def _unwatch_all():
+            try:
+                for f in file_numbers:
+                    self._unwatch(f)
+            finally:
+                done.set_result(None)
+
+        self.loop.call_soon_threadsafe(_unwatch_all)
+        done.result()
+
+    def remove_file_number(self, file_number: int):
+        self._unwatch_and_wait([file_number])
+        super().remove_file_number(file_number)
+
+    def _ensure_closed(self, file_objects):
+        self._unwatch_and_wait(
+            self.file_to_fileno.get(f, None)
+            for f in file_objects if f is not None)
+        super()._ensure_closed(file_objects)
+
+    def is_stalled(self) -> bool:
+        # All sources enqueue their last event before they are removed
+        # from `watched_sources`.
+        return not self.watched_sources and self.output_queue.empty()
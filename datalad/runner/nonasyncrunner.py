@@ -37,6 +37,7 @@ from .protocol import (
     GeneratorMixIn,
     WitlessProtocol,
 )
+from . import telemetry
 from .runnerthreads import (
     _try_close,
     IOState,
@@ -266,6 +267,10 @@ class ThreadedRunner:
         self.process: Optional[Popen[Any]] = None
         self.return_code: Optional[int] = None
 
+        # telemetry of the current process execution, if requested
+        self.telemetry: Optional[dict] = None
+        self.bytes_read: dict[int, int] = dict()
+
         self.last_touched: dict[Optional[int], float] = dict()
         self.active_file_numbers: set[Optional[int]] = set()
         self.stall_check_interval = 10
@@ -414,6 +419,16 @@ class ThreadedRunner:
                 )
             raise
 
+        if telemetry.is_active():
+            self.telemetry = dict(
+                start=time.time(),
+                start_counter=time.perf_counter(),
+                interface=telemetry.get_current_interface(),
+            )
+            self.bytes_read = {STDOUT_FILENO: 0, STDERR_FILENO: 0}
+        else:
+            self.telemetry = None
+
         self.process_running = True
         self.active_file_numbers.add(None)
 
@@ -453,6 +468,25 @@ class ThreadedRunner:
             ) if f is not None
         }
 
+        self._start_io()
+
+        if isinstance(self.protocol, GeneratorMixIn):
+            self.generator = _ResultGenerator(
+                self,
+                self.protocol.result_queue
+            )
+            self.owning_thread = threading.get_ident()
+            return self.generator
+
+        return self.process_loop()
+
+    def _start_io(self):
+        """Start the transport of data from and to the process, and the
+        monitoring of its exit
+
+        All events are enqueued in `self.output_queue` as
+        `(file_number, IOState, data)`-tuples.
+        """
         current_time = time.time()
         if self.timeout:
             self.last_touched[None] = current_time
@@ -505,16 +539,6 @@ class ThreadedRunner:
             self.process)
         self.process_waiting_thread.start()
 
-        if isinstance(self.protocol, GeneratorMixIn):
-            self.generator = _ResultGenerator(
-                self,
-                self.protocol.result_queue
-            )
-            self.owning_thread = threading.get_ident()
-            return self.generator
-
-        return self.process_loop()
-
     def process_loop(self) -> dict:
         # Process internal messages until no more active file descriptors
         # are present. This works because active file numbers are only
@@ -600,9 +624,40 @@ class ThreadedRunner:
 
     def _set_process_exited(self):
         self.return_code = self.process.poll()
+        if self.telemetry is not None:
+            self._report_telemetry()
         self.process = None
         self.process_running = False
 
+    def _get_stdin_bytes_written(self) -> Optional[int]:
+        if not self.write_stdin:
+            return None
+        if self.stdin_enqueueing_thread is not None:
+            return self.stdin_enqueueing_thread.bytes_written
+        return None
+
+    def _report_telemetry(self):
+        info = self.telemetry
+        self.telemetry = None
+        argv = telemetry.get_argv_head(self.cmd)
+        telemetry.report(dict(
+            command=' '.join(argv),
+            argv=argv,
+            cwd=str(self.popen_kwargs.get('cwd', None) or '') or None,
+            pid=self.process.pid,
+            interface=info['interface'],
+            start=info['start'],
+            duration=time.perf_counter() - info['start_counter'],
+            stdin_bytes=self._get_stdin_bytes_written(),
+            stdout_bytes=(
+                self.bytes_read[STDOUT_FILENO] if self.catch_stdout
+                else None),
+            stderr_bytes=(
+                self.bytes_read[STDERR_FILENO] if self.catch_stderr
+                else None),
+            exit_code=self.return_code,
+        ))
+
     def process_queue(self):
         """
         Get a single event from the queue or handle a timeout. This method
@@ -647,9 +702,10 @@ class ThreadedRunner:
                 # Call the protocol handler for data
                 assert isinstance(data, bytes)
                 self.last_touched[file_number] = time.time()
-                self.protocol.pipe_data_received(
-                    self.fileno_mapping[file_number],
-                    data)
+                fileno = self.fileno_mapping[file_number]
+                if self.telemetry is not None:
+                    self.bytes_read[fileno] += len(data)
+                self.protocol.pipe_data_received(fileno, data)
 
     def remove_process(self):
         if None not in self.active_file_numbers:
@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from os import PathLike
 from queue import Queue
 from typing import (
@@ -18,6 +19,8 @@ from typing import (
     cast,
 )
 
+from datalad.utils import on_windows
+
 from .protocol import WitlessProtocol
 from .coreprotocols import NoCapture
 from .exception import CommandError
@@ -31,11 +34,39 @@ from .protocol import GeneratorMixIn
 lgr = logging.getLogger('datalad.runner.runner')
 
 
+def _get_runner_class() -> type[ThreadedRunner]:
+    """Return the runner backend class selected via DATALAD_RUNNER_BACKEND
+
+    'threads' (default) selects `ThreadedRunner`, 'asyncio' selects
+    `AsyncioRunner`.
+    """
+    # with all the nesting of config and this runner, cannot use our
+    # cfg here, so will resort to dark magic of environment options
+    backend = os.environ.get('DATALAD_RUNNER_BACKEND', 'threads').lower()
+    if backend == 'threads':
+        return ThreadedRunner
+    elif backend == 'asyncio':
+        if on_windows:
+            lgr.debug(
+                "asyncio runner backend is not supported on Windows, "
+                "using threads")
+            return ThreadedRunner
+        from .asyncrunner import AsyncioRunner
+        return AsyncioRunner
+    raise ValueError(
+        f"Unknown DATALAD_RUNNER_BACKEND {backend!r}, "
+        "must be 'threads' or 'asyncio'")
+
+
 class WitlessRunner(object):
     """Minimal Runner with support for online command output processing
 
     It aims to be as simple as possible, providing only essential
     functionality.
+
+    Subprocess I/O is handled by `ThreadedRunner`, or, if the environment
+    variable DATALAD_RUNNER_BACKEND is set to 'asyncio', by `AsyncioRunner`,
+    which serves all subprocesses from a single event loop thread.
     """
     __slots__ = ['cwd', 'env']
 
@@ -191,7 +222,7 @@ class WitlessRunner(object):
             applied_cwd
         )
 
-        threaded_runner = ThreadedRunner(
+        threaded_runner = _get_runner_class()(
             cmd=cmd,
             protocol_class=protocol,
             stdin=stdin,
@@ -0,0 +1,261 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Telemetry of subprocess executions
+
+Every subprocess that is executed by a runner is reported to all active
+`SubprocessTelemetry` collectors, as a record with the following keys:
+
+- command: label of the command, made of the executable name and its
+  (sub-)command (e.g. 'git annex find'), see `get_argv_head()`
+- argv: the same as a list of arguments
+- cwd: working directory of the subprocess
+- pid: process ID of the subprocess
+- interface: name of the DataLad command that was executing when the
+  subprocess was started, or None
+- start: start time, in seconds since the epoch
+- duration: wall time in seconds, from start until the process was reaped
+- stdin_bytes, stdout_bytes, stderr_bytes: number of bytes written to, or
+  read from the respective pipe, None for pipes that were not connected
+  to the runner
+- exit_code: exit code of the subprocess
+
+If the environment variable DATALAD_RUNNER_PROFILE is set to a file name,
+all records are appended to this file, one JSON object per line. At process
+exit, a final line with a single 'summary' key is appended, which contains
+the aggregated statistics of `SubprocessTelemetry.summary()`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+from collections.abc import Generator
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Optional,
+)
+
+lgr = logging.getLogger('datalad.runner.telemetry')
+
+# All active collectors. Runners only gather telemetry if this is not empty.
+_collectors: list[SubprocessTelemetry] = []
+_collectors_lock = threading.Lock()
+
+# Name of the DataLad command that is currently executing
+_current_interface: ContextVar[Optional[str]] = ContextVar(
+    'datalad_runner_interface', default=None)
+
+
+def is_active() -> bool:
+    """Whether any collector wants to receive telemetry records"""
+    return bool(_collectors)
+
+
+def get_current_interface() -> Optional[str]:
+    return _current_interface.get()
+
+
+def track_interface(name: str, gen: Generator) -> Generator:
+    """Mark any subprocess execution by `gen` as triggered by `name`
+
+    Parameters
+    ----------
+    name: str
+      Name of the DataLad command.
+    gen: Generator
+      Generator executing the DataLad command. Only while it is
+      advanced, `name` is considered the current interface. This
+      keeps the attribution correct when the results of a command
+      are consumed by another command.
+    """
+    while True:
+        previous = _current_interface.get()
+        _current_interface.set(name)
+        try:
+            item = next(gen)
+        except StopIteration as e:
+            return e.value
+        finally:
+            _current_interface.set(previous)
+        yield item
+
+
+def get_argv_head(cmd: str | list) -> list[str]:
+    """Return the executable name, and its (sub-)command
+
+    Options, and the values of git's `-c` and `-C` options, that precede
+    the command are skipped. The head ends with the first non-option
+    argument, or the second one for `git annex`, such that e.g.
+    `git -c a=b annex find --json file` is reported as
+    `['git', 'annex', 'find']`, and `git commit -m msg` as
+    `['git', 'commit']`.
+    """
+    if isinstance(cmd, str):
+        cmd = cmd.split()
+    if not cmd:
+        return []
+    head = [os.path.basename(str(cmd[0]))]
+    args = iter(cmd[1:])
+    for arg in args:
+        arg = str(arg)
+        if arg in ('-c', '-C'):
+            next(args, None)
+            continue
+        if arg.startswith('-'):
+            continue
+        head.append(arg)
+        if head[-2:] != ['git', 'annex']:
+            break
+    return head
+
+
+def report(record: dict[str, Any]) -> None:
+    """Pass a telemetry record to all active collectors"""
+    for collector in list(_collectors):
+        try:
+            collector.add(record)
+        except Exception as e:
+            lgr.debug('Failed to report subprocess telemetry to %s: %s',
+                      collector, e)
+
+
+class SubprocessTelemetry:
+    """Collector of telemetry records of subprocess executions
+
+    A collector must be started to receive records. It can be used as a
+    context manager::
+
+        with SubprocessTelemetry() as telemetry:
+            ds.get('.', recursive=True)
+        for rec in telemetry.summary(top=5):
+            print(rec['command'], rec['count'], rec['duration'])
+    """
+    def __init__(self, keep_records: bool = True):
+        """
+        Parameters
+        ----------
+        keep_records: bool, optional
+          Whether to keep all records in the `records` attribute. If False,
+          only the aggregated statistics for `summary()` are kept.
+        """
+        self.keep_records = keep_records
+        self.records: list[dict[str, Any]] = []
+        self._stats: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(keep_records={self.keep_records})'
+
+    def start(self) -> SubprocessTelemetry:
+        with _collectors_lock:
+            if self not in _collectors:
+                _collectors.append(self)
+        return self
+
+    def stop(self) -> None:
+        with _collectors_lock:
+            if self in _collectors:
+                _collectors.remove(self)
+
+    def __enter__(self) -> SubprocessTelemetry:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def add(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            if self.keep_records:
+                self.records.append(record)
+            stats = self._stats.get(record['command'])
+            if stats is None:
+                stats = self._stats[record['command']] = dict(
+                    command=record['command'],
+                    count=0,
+                    failed=0,
+                    duration=0.0,
+                    stdin_bytes=0,
+                    stdout_bytes=0,
+                    stderr_bytes=0,
+                )
+            stats['count'] += 1
+            stats['duration'] += record['duration']
+            if record['exit_code'] not in (0, None):
+                stats['failed'] += 1
+            for k in ('stdin_bytes', 'stdout_bytes', 'stderr_bytes'):
+                stats[k] += record[k] or 0
+
+    def summary(self, top: Optional[int] = None,
+                sort_by: str = 'duration') -> list[dict[str, Any]]:
+        """Aggregated statistics per command
+
+        Parameters
+        ----------
+        top: int, optional
+          If given, only report this many commands.
+        sort_by: {'duration', 'count'}, optional
+          Commands are reported in descending order of this property.
+
+        Returns
+        -------
+        list
+          A dict per command label, with keys 'command', 'count', 'failed',
+          'duration' (total wall time), and the total number of bytes
+          transferred per pipe.
+        """
+        with self._lock:
+            stats = [dict(s) for s in self._stats.values()]
+        stats = sorted(stats, key=lambda s: s[sort_by], reverse=True)
+        return stats[:top] if top is not None else stats
+
+
+class JSONLinesTelemetry(SubprocessTelemetry):
+    """Collector that writes all records to a JSON lines file
+
+    Records are appended to the file as soon as they are reported, hence
+    concurrent DataLad processes can write to the same file. On `stop()`,
+    a line with the aggregated statistics of all records of this collector
+    is appended as `{"summary": [...]}`.
+    """
+    def __init__(self, path: str):
+        super().__init__(keep_records=False)
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r})'
+
+    def _write(self, obj: Any) -> None:
+        line = json.dumps(obj) + '\n'
+        with open(self.path, 'a') as f:
+            f.write(line)
+
+    def add(self, record: dict[str, Any]) -> None:
+        super().add(record)
+        self._write(record)
+
+    def stop(self) -> None:
+        was_active = self in _collectors
+        super().stop()
+        if was_active:
+            self._write({'summary': self.summary()})
+
+
+def _start_profile_from_environment() -> None:
+    path = os.environ.get('DATALAD_RUNNER_PROFILE')
+    if not path:
+        return
+    collector = JSONLinesTelemetry(path).start()
+    atexit.register(collector.stop)
+
+
+_start_profile_from_environment()
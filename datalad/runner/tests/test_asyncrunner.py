@@ -0,0 +1,161 @@
+# emacs: -*- mode: python-mode; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil; coding: utf-8 -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Test the event loop based runner backend
+"""
+from __future__ import annotations
+
+import os
+import threading
+from queue import Queue
+from unittest.mock import patch
+
+import pytest
+
+from datalad.tests.utils_pytest import (
+    eq_,
+    skip_if_on_windows,
+)
+
+from .. import (
+    CommandError,
+    Runner,
+    StdOutErrCapture,
+)
+from ..asyncrunner import AsyncioRunner
+from ..protocol import GeneratorMixIn
+from ..runner import _get_runner_class
+from ..nonasyncrunner import ThreadedRunner
+from .utils import py2cmd
+
+
+class GenStdoutStderr(GeneratorMixIn, StdOutErrCapture):
+    def __init__(self, done_future=None, encoding=None):
+        StdOutErrCapture.__init__(
+            self,
+            done_future=done_future,
+            encoding=encoding)
+        GeneratorMixIn.__init__(self)
+
+    def pipe_data_received(self, fd, data):
+        self.send_result((fd, data))
+
+
+@skip_if_on_windows
+def test_asyncio_runner_capture():
+    # more output than fits into a pipe buffer, on both channels, and
+    # more input than fits, too
+    size = 1024 * 1024
+    stdin = b'x' * size
+    result = AsyncioRunner(
+        cmd=py2cmd(
+            'import sys; '
+            'd = sys.stdin.read(); '
+            'sys.stderr.write(d); '
+            'print(len(d)); '
+            'sys.exit(3)'),
+        protocol_class=StdOutErrCapture,
+        stdin=stdin,
+    ).run()
+    eq_(result['code'], 3)
+    eq_(result['stdout'].strip(), str(size))
+    eq_(result['stderr'], 'x' * size)
+
+    # empty bytes input
+    result = AsyncioRunner(
+        cmd=py2cmd('import sys; print(len(sys.stdin.read()))'),
+        protocol_class=StdOutErrCapture,
+        stdin=b'',
+    ).run()
+    eq_(result['stdout'].strip(), '0')
+
+
+@skip_if_on_windows
+def test_asyncio_runner_generator():
+    stdin_queue = Queue()
+    gen = AsyncioRunner(
+        cmd=py2cmd(
+            'import sys\n'
+            'for line in sys.stdin:\n'
+            '    sys.stdout.write(line.upper())\n'
+            '    sys.stdout.flush()\n'),
+        protocol_class=GenStdoutStderr,
+        stdin=stdin_queue,
+    ).run()
+    for word in ('one', 'two'):
+        stdin_queue.put(f'{word}\n'.encode())
+        eq_(next(gen), (1, f'{word.upper()}\n'.encode()))
+    stdin_queue.put(None)
+    eq_(list(gen), [])
+    eq_(gen.return_code, 0)
+
+    # errors are reported like with the threaded runner
+    gen = AsyncioRunner(
+        cmd=py2cmd('import sys; print("out"); sys.exit(2)'),
+        protocol_class=GenStdoutStderr,
+        stdin=None,
+    ).run()
+    with pytest.raises(CommandError) as cme:
+        list(gen)
+    eq_(cme.value.code, 2)
+
+
+@skip_if_on_windows
+def test_asyncio_runner_no_pidfd():
+    # without pidfd support, process exits are awaited by threads. More
+    # long-running processes than the default executor has workers must
+    # not prevent that the exit of another process is noticed
+    n_running = min(32, (os.cpu_count() or 1) + 4) + 1
+    with patch('os.pidfd_open', side_effect=OSError, create=True):
+        stdin_queues = [Queue() for _ in range(n_running)]
+        running = [
+            AsyncioRunner(
+                cmd=py2cmd('import sys; sys.stdin.read()'),
+                protocol_class=GenStdoutStderr,
+                stdin=q,
+            ).run()
+            for q in stdin_queues]
+        results = []
+        t = threading.Thread(
+            target=lambda: results.append(AsyncioRunner(
+                cmd=py2cmd('print("done")'),
+                protocol_class=StdOutErrCapture,
+                stdin=None,
+            ).run()),
+            daemon=True)
+        t.start()
+        t.join(timeout=60)
+        try:
+            assert not t.is_alive()
+            eq_(results[0]['stdout'].strip(), 'done')
+        finally:
+            for q in stdin_queues:
+                q.put(None)
+            for gen in running:
+                eq_(list(gen), [])
+                eq_(gen.return_code, 0)
+
+
+@skip_if_on_windows
+def test_asyncio_runner_selection():
+    with patch.dict('os.environ', {'DATALAD_RUNNER_BACKEND': 'asyncio'}):
+        assert _get_runner_class() is AsyncioRunner
+        threads_before = threading.active_count()
+        results = [
+            Runner().run(py2cmd(f'print({i})'), protocol=StdOutErrCapture)
+            for i in range(20)]
+        eq_([r['stdout'].strip() for r in results],
+            [str(i) for i in range(20)])
+        # a single event loop thread serves all processes, all other
+        # threads are gone
+        assert threading.active_count() <= threads_before + 1
+    with patch.dict('os.environ', {'DATALAD_RUNNER_BACKEND': 'threads'}):
+        assert _get_runner_class() is ThreadedRunner
+    with patch.dict('os.environ', {'DATALAD_RUNNER_BACKEND': 'bogus'}):
+        with pytest.raises(ValueError):
+            _get_runner_class()
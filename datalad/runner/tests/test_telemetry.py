@@ -0,0 +1,105 @@
+# emacs: -*- mode: python-mode; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil; coding: utf-8 -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Test subprocess telemetry of the runner
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from datalad.distribution.dataset import Dataset
+from datalad.tests.utils_pytest import (
+    assert_in,
+    eq_,
+    with_tempfile,
+)
+from datalad.utils import on_windows
+
+from .. import (
+    CommandError,
+    Runner,
+    StdOutErrCapture,
+)
+from ..telemetry import (
+    JSONLinesTelemetry,
+    SubprocessTelemetry,
+    get_argv_head,
+    is_active,
+)
+from .utils import py2cmd
+
+
+def test_get_argv_head():
+    for cmd, head in (
+            (['git', '-c', 'a=b', '-C', 'p', 'annex', 'find', '--json', 'f'],
+             ['git', 'annex', 'find']),
+            (['/usr/bin/git', 'commit', '-m', 'msg'], ['git', 'commit']),
+            (['git', 'ls-files', '-z'], ['git', 'ls-files']),
+            ('echo some thing', ['echo', 'some']),
+            ([], []),
+    ):
+        eq_(get_argv_head(cmd), head)
+
+
+@pytest.mark.parametrize(
+    "backend",
+    ["threads"] + ([] if on_windows else ["asyncio"]))
+def test_subprocess_telemetry(backend):
+    assert not is_active()
+    with patch.dict('os.environ', {'DATALAD_RUNNER_BACKEND': backend}), \
+            SubprocessTelemetry() as telemetry:
+        assert is_active()
+        for i in range(3):
+            with pytest.raises(CommandError):
+                Runner().run(
+                    py2cmd('import sys; print(sys.stdin.read()); sys.exit(1)'),
+                    protocol=StdOutErrCapture,
+                    stdin=b'12345')
+        Runner().run(py2cmd('print(1)'))
+    assert not is_active()
+    # nothing is recorded after the collector was stopped
+    Runner().run(py2cmd('print(1)'))
+
+    eq_(len(telemetry.records), 4)
+    rec = telemetry.records[0]
+    eq_(rec['exit_code'], 1)
+    eq_(rec['stdin_bytes'], 5)
+    eq_(rec['stdout_bytes'], 6)
+    eq_(rec['stderr_bytes'], 0)
+    eq_(rec['interface'], None)
+    assert rec['duration'] > 0
+    # not captured
+    eq_(telemetry.records[-1]['stdout_bytes'], None)
+
+    summary = telemetry.summary()
+    eq_(len(summary), 1)
+    eq_(summary[0]['count'], 4)
+    eq_(summary[0]['failed'], 3)
+    eq_(summary[0]['stdout_bytes'], 18)
+
+
+@with_tempfile(mkdir=True)
+@with_tempfile
+def test_subprocess_telemetry_jsonl(path=None, profile=None):
+    collector = JSONLinesTelemetry(profile).start()
+    try:
+        Dataset(path).create(result_renderer='disabled')
+    finally:
+        collector.stop()
+    lines = [json.loads(line)
+             for line in Path(profile).read_text().splitlines()]
+    records, summary = lines[:-1], lines[-1]['summary']
+    assert records
+    # subprocesses are attributed to the command
+    assert_in('create', {r['interface'] for r in records})
+    assert_in('git annex init', {r['command'] for r in records})
+    eq_(sum(s['count'] for s in summary), len(records))
@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import re
+import threading
 import warnings
 from itertools import chain
 from multiprocessing import cpu_count
@@ -43,6 +44,7 @@ from datalad.cmd import (  # KillOutput,
     StdOutCapture,
     StdOutErrCapture,
     WitlessProtocol,
+    _now,
 )
 from datalad.consts import WEB_SPECIAL_REMOTE_UUID
 # imports from same module:
@@ -70,6 +72,7 @@ from datalad.utils import (
     PurePosixPath,
     auto_repr,
     ensure_list,
+    generate_file_chunks,
     on_windows,
     split_cmdline,
     unlink,
@@ -289,7 +292,9 @@ class AnnexRepo(GitRepo, RepoInterface):
             )
 
         self._batched = BatchedAnnexes(
-            batch_size=batch_size, git_options=self._ANNEX_GIT_COMMON_OPTIONS)
+            batch_size=batch_size, git_options=self._ANNEX_GIT_COMMON_OPTIONS,
+            max_procs=config.obtain('datalad.runtime.max-batched-per-repo'),
+            max_idle=config.obtain('datalad.runtime.max-inactive-age'))
 
         # set default backend for future annex commands:
         # TODO: Should the backend option of __init__() also migrate
@@ -3223,36 +3228,7 @@ class AnnexRepo(GitRepo, RepoInterface):
         objectstore = self.pathobj.joinpath(
             self.path, GitRepo.get_git_dir(self), 'annex', 'objects')
         for f, r in info.items():
-            if 'key' not in r or 'has_content' in r:
-                # not annexed or already processed
-                continue
-            # test hashdirmixed first, as it is used in non-bare repos
-            # which be a more frequent target
-            # TODO optimize order based on some check that reveals
-            # what scheme is used in a given annex
-            r['has_content'] = False
-            # some keys like URL-s700145--https://arxiv.org/pdf/0904.3664v1.pdf
-            # require sanitization to be able to mark content availability
-            # correctly. Can't limit to URL backend only; custom key backends
-            # may need it, too
-            key = _sanitize_key(r['key'])
-            for testpath in (
-                    # ATM git-annex reports hashdir in native path
-                    # conventions and the actual file path `f` in
-                    # POSIX, weird...
-                    # we need to test for the actual key file, not
-                    # just the containing dir, as on windows the latter
-                    # may not always get cleaned up on `drop`
-                    objectstore.joinpath(
-                        ut.Path(r['hashdirmixed']), key, key),
-                    objectstore.joinpath(
-                        ut.Path(r['hashdirlower']), key, key)):
-                if testpath.exists():
-                    r.pop('hashdirlower', None)
-                    r.pop('hashdirmixed', None)
-                    r['objloc'] = str(testpath)
-                    r['has_content'] = True
-                    break
+            _mark_record_availability(objectstore, r)
 
     def get_file_annexinfo(self, path, ref=None, eval_availability=False,
                            key_prefix=''):
@@ -3403,43 +3379,138 @@ class AnnexRepo(GitRepo, RepoInterface):
                     continue
                 else:
                     rec = {}
-            rec.update({'{}{}'.format(key_prefix, k): j[k]
-                       for k in j if k != 'file' and k != 'error-messages'})
-            # change annex' `error-messages` into singular to match result
-            # records:
-            if j.get('error-messages', None):
-                rec['error_message'] = '\n'.join(m.strip() for m in j['error-messages'])
-            if 'bytesize' in rec:
-                # it makes sense to make this an int that one can calculate with
-                # with
-                try:
-                    rec['bytesize'] = int(rec['bytesize'])
-                except ValueError:
-                    # this would only ever happen, if the recorded key itself
-                    # has no size info. Even for a URL key, this would mean
-                    # that the server would have to not report size info at all
-                    # but it does actually happen, e.g.
-                    # URL--http&c%%ciml.info%dl%v0_9%ciml-v0_9-all.pdf
-                    # from github.com/datalad-datasets/machinelearning-books
-                    lgr.debug('Failed to convert "%s" to integer bytesize',
-                              rec['bytesize'])
-                    # remove the field completely to avoid ambiguous semantics
-                    # of None/NaN etc.
-                    del rec['bytesize']
-            if rec.get('type') == 'symlink' and rec.get('key') is not None:
-                # we have a tracked symlink with an associated annex key
-                # this is only a symlink for technical reasons, but actually
-                # a file from the user perspective.
-                # homogenization of this kind makes the report more robust
-                # across different representations of a repo
-                # (think adjusted branches ...)
-                rec['type'] = 'file'
+            _update_annexinfo_record(rec, j, key_prefix)
             info[path] = rec
         # TODO make annex availability checks optional and move in here
         if eval_availability:
             self._mark_content_availability(info)
         return info
 
+    def get_content_annexinfo_(
+            self, paths=None, ref=None, eval_availability=False,
+            key_prefix='', untracked='all'):
+        """Like get_content_annexinfo(init='git'), but yields records
+
+        Reports from `git ls-files/ls-tree` and `git annex find/findref` are
+        streamed and merge-joined, exploiting that both report in the same
+        (index) order. Nothing is accumulated, hence memory demands do not
+        depend on the number of reported items. If `paths` are given,
+        git-annex reports in the order of the given paths instead, and
+        its records are collected per chunk of paths to be matched.
+
+        Parameters
+        ----------
+        paths : list or None
+          See get_content_annexinfo().
+        ref : gitref or None
+          See get_content_annexinfo().
+        eval_availability : bool
+          See get_content_annexinfo().
+        key_prefix : str
+          See get_content_annexinfo().
+        untracked : {'no', 'normal', 'all'}
+          See GitRepo.get_content_info().
+
+        Yields
+        ------
+        tuple
+          `(path, props)` with `path` and `props` matching a key and value
+          of the dict returned by get_content_annexinfo(). Untracked
+          content is reported first, tracked content in index order.
+        """
+        if paths is not None and not paths:
+            return
+        if paths:
+            # each chunk is queried with a single git and git-annex call
+            chunks = generate_file_chunks(
+                _get_nonoverlapping_paths(
+                    [ut.PurePath(p).as_posix() for p in paths]),
+                ['git', 'annex', 'find', '--anything'])
+        else:
+            chunks = [None]
+        objectstore = None
+        if eval_availability:
+            objectstore = self.pathobj.joinpath(
+                self.path, GitRepo.get_git_dir(self), 'annex', 'objects')
+        for chunk in chunks:
+            for path, rec in self._get_content_annexinfo_chunk(
+                    chunk, ref, key_prefix, untracked):
+                if objectstore is not None:
+                    _mark_record_availability(objectstore, rec)
+                yield path, rec
+
+    def _get_content_annexinfo_chunk(self, paths, ref, key_prefix,
+                                     untracked):
+        """Internal helper of get_content_annexinfo_() for a path chunk"""
+        if self._check_version_kludges("find-supports-anything"):
+            cmd = ['--anything']
+        else:
+            cmd = ['--include=*']
+        if ref:
+            cmd = ['findref'] + cmd + [ref]
+        else:
+            cmd = ['find'] + cmd
+            if not paths:
+                cmd += ['--include', '*']
+        annex_records = self._call_annex_records_items_(cmd, files=paths)
+        if paths:
+            # git-annex reports in the order of the given paths, not in
+            # index order, match the records of this chunk by path
+            annex_info = {j['file']: j for j in annex_records}
+            for path, rec in super(AnnexRepo, self).get_content_info_(
+                    paths=paths, ref=ref, untracked=untracked):
+                if rec['gitshasum'] is not None:
+                    j = annex_info.pop(
+                        path.relative_to(self.pathobj).as_posix(), None)
+                    if j is not None:
+                        _update_annexinfo_record(rec, j, key_prefix)
+                yield path, rec
+            for j in annex_info.values():
+                yield from self._get_unmatched_annexinfo(j, key_prefix)
+            return
+        # records are matched on the bytewise order of their POSIX paths,
+        # like Git sorts them
+        cur_annex = next(annex_records, None)
+        for path, rec in super(AnnexRepo, self).get_content_info_(
+                paths=paths, ref=ref, untracked=untracked):
+            if rec['gitshasum'] is None:
+                # untracked, not known to annex
+                yield path, rec
+                continue
+            fname = path.relative_to(self.pathobj).as_posix().encode()
+            while cur_annex is not None:
+                annex_fname = cur_annex['file'].encode()
+                if annex_fname > fname:
+                    break
+                if annex_fname == fname:
+                    _update_annexinfo_record(rec, cur_annex, key_prefix)
+                else:
+                    yield from self._get_unmatched_annexinfo(
+                        cur_annex, key_prefix)
+                cur_annex = next(annex_records, None)
+            yield path, rec
+        if cur_annex is not None:
+            yield from self._get_unmatched_annexinfo(cur_annex, key_prefix)
+        for j in annex_records:
+            yield from self._get_unmatched_annexinfo(j, key_prefix)
+
+    def _get_unmatched_annexinfo(self, j, key_prefix):
+        """Internal helper of get_content_annexinfo_()
+
+        Handles annex records git didn't report on, matching the behavior
+        of get_content_annexinfo(init='git').
+        """
+        if j.get('success', None) is False:
+            # Annex reports error on that file. Create an error entry,
+            # as we can't currently yield a prepared error result from
+            # within here.
+            rec = {'status': 'error', 'state': 'unknown'}
+            _update_annexinfo_record(rec, j, key_prefix)
+            yield self.pathobj.joinpath(PurePosixPath(j['file'])), rec
+        else:
+            lgr.debug('Ignoring annex record not matched with a git '
+                      'record: %s', j)
+
     def annexstatus(self, paths=None, untracked='all'):
         """
         .. deprecated:: 0.16
@@ -3939,10 +4010,25 @@ class BatchedAnnex(BatchedCommand):
 class BatchedAnnexes(SafeDelCloseMixin, dict):
     """Class to contain the registry of active batch'ed instances of annex for
     a repository
+
+    The registry can be used from concurrent threads. Requests to the same
+    batched annex process are serialized, and a list of requests is
+    pipelined through the process (see `BatchedCommand.__call__()`).
+
+    The number of running processes is bounded by `max_procs`. When a new
+    process would exceed this bound, the least recently used idle process
+    is closed. Moreover, any process that was idle for more than
+    `max_idle` seconds is closed whenever a batched annex is requested.
+    Closed processes stay registered, and are restarted transparently on
+    their next use.
     """
-    def __init__(self, batch_size=0, git_options=None):
+    def __init__(self, batch_size=0, git_options=None, max_procs=None,
+                 max_idle=None):
         self.batch_size = batch_size
         self.git_options = git_options or []
+        self.max_procs = max_procs
+        self.max_idle = max_idle
+        self._lock = threading.RLock()
         super(BatchedAnnexes, self).__init__()
 
     def get(self, codename, annex_cmd=None, **kwargs) -> BatchedAnnex:
@@ -3965,12 +4051,48 @@ class BatchedAnnexes(SafeDelCloseMixin, dict):
             codename += ':{0}:{1}'.format(key, options[key])
         # END RF/BF
 
-        if codename not in self:
-            # Create a new git-annex process we will keep around
-            self[codename] = BatchedAnnex(annex_cmd,
-                                          git_options=git_options,
-                                          **kwargs)
-        return self[codename]
+        with self._lock:
+            self._close_idle(keep=codename)
+            if self.max_procs and (
+                    codename not in self or self[codename].runner is None):
+                self._close_least_recently_used(self.max_procs - 1)
+            if codename not in self:
+                # Create a new git-annex process we will keep around
+                self[codename] = BatchedAnnex(annex_cmd,
+                                              git_options=git_options,
+                                              **kwargs)
+            return self[codename]
+
+    def _get_idle(self):
+        # idle processes, least recently used first
+        return sorted(
+            ((c, p) for c, p in self.items()
+             if p.runner is not None and not p._active),
+            key=lambda i: i[1]._active_last)
+
+    def _close_idle(self, keep=None):
+        """Close processes that were idle for more than `max_idle` seconds"""
+        if not self.max_idle:
+            return
+        now = _now()
+        for codename, p in self._get_idle():
+            if codename == keep:
+                continue
+            if (now - p._active_last).total_seconds() <= self.max_idle:
+                # all others were used more recently
+                break
+            lgr.debug('Closing idle %s', p)
+            p.close()
+
+    def _close_least_recently_used(self, max_running):
+        """Close idle processes until at most `max_running` are running"""
+        n_running = sum(p.runner is not None for p in self.values())
+        for codename, p in self._get_idle():
+            if n_running <= max_running:
+                break
+            lgr.debug('Closing least recently used %s', p)
+            p.close()
+            n_running -= 1
 
     def clear(self):
         """Override just to make sure we don't rely on __del__ to close all
@@ -3983,10 +4105,99 @@ class BatchedAnnexes(SafeDelCloseMixin, dict):
 
         It does not remove them from the dictionary though
         """
-        for p in self.values():
+        for p in list(self.values()):
             p.close()
 
 
+def _update_annexinfo_record(rec, j, key_prefix):
+    """Amend a content info record with properties from an annex record"""
+    rec.update({'{}{}'.format(key_prefix, k): j[k]
+               for k in j if k != 'file' and k != 'error-messages'})
+    # change annex' `error-messages` into singular to match result
+    # records:
+    if j.get('error-messages', None):
+        rec['error_message'] = '\n'.join(m.strip() for m in j['error-messages'])
+    if 'bytesize' in rec:
+        # it makes sense to make this an int that one can calculate with
+        # with
+        try:
+            rec['bytesize'] = int(rec['bytesize'])
+        except ValueError:
+            # this would only ever happen, if the recorded key itself
+            # has no size info. Even for a URL key, this would mean
+            # that the server would have to not report size info at all
+            # but it does actually happen, e.g.
+            # URL--http&c%%ciml.info%dl%v0_9%ciml-v0_9-all.pdf
+            # from github.com/datalad-datasets/machinelearning-books
+            lgr.debug('Failed to convert "%s" to integer bytesize',
+                      rec['bytesize'])
+            # remove the field completely to avoid ambiguous semantics
+            # of None/NaN etc.
+            del rec['bytesize']
+    if rec.get('type') == 'symlink' and rec.get('key') is not None:
+        # we have a tracked symlink with an associated annex key
+        # this is only a symlink for technical reasons, but actually
+        # a file from the user perspective.
+        # homogenization of this kind makes the report more robust
+        # across different representations of a repo
+        # (think adjusted branches ...)
+        rec['type'] = 'file'
+
+
+def _mark_record_availability(objectstore, r):
+    """Set `has_content` (and `objloc`) of an annexinfo record"""
+    if 'key' not in r or 'has_content' in r:
+        # not annexed or already processed
+        return
+    # test hashdirmixed first, as it is used in non-bare repos
+    # which be a more frequent target
+    # TODO optimize order based on some check that reveals
+    # what scheme is used in a given annex
+    r['has_content'] = False
+    # some keys like URL-s700145--https://arxiv.org/pdf/0904.3664v1.pdf
+    # require sanitization to be able to mark content availability
+    # correctly. Can't limit to URL backend only; custom key backends
+    # may need it, too
+    key = _sanitize_key(r['key'])
+    for testpath in (
+            # ATM git-annex reports hashdir in native path
+            # conventions and the actual file path `f` in
+            # POSIX, weird...
+            # we need to test for the actual key file, not
+            # just the containing dir, as on windows the latter
+            # may not always get cleaned up on `drop`
+            objectstore.joinpath(
+                Path(r['hashdirmixed']), key, key),
+            objectstore.joinpath(
+                Path(r['hashdirlower']), key, key)):
+        if testpath.exists():
+            r.pop('hashdirlower', None)
+            r.pop('hashdirmixed', None)
+            r['objloc'] = str(testpath)
+            r['has_content'] = True
+            break
+
+
+def _get_nonoverlapping_paths(posix_paths):
+    """Drop any path that is a duplicate of, or underneath another path
+
+    The order of the remaining paths is kept.
+    """
+    selected = set(posix_paths)
+    seen = set()
+    result = []
+    for p in posix_paths:
+        if p in seen:
+            continue
+        seen.add(p)
+        parts = p.split('/')
+        if any('/'.join(parts[:i]) in selected
+               for i in range(1, len(parts))):
+            continue
+        result.append(p)
+    return result
+
+
 def readlines_until_ok_or_failed(stdout, maxlines=100):
     """Read stdout until line ends with ok or failed"""
     out = ''
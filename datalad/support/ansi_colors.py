@@ -61,7 +61,7 @@ def color_enabled():
 
 def format_msg(fmt, use_color=False):
     """Replace $RESET and $BOLD with corresponding ANSI entries"""
-    if color_enabled() and use_color:
+    if use_color and color_enabled():
         return fmt.replace("$RESET", RESET_SEQ).replace("$BOLD", BOLD_SEQ)
     else:
         return fmt.replace("$RESET", "").replace("$BOLD", "")
@@ -10,23 +10,37 @@
 
 """
 
+import bz2
+import gzip
 import hashlib
+import json
 import logging
+import lzma
 import os
+import posixpath
 import random
+import shutil
 import string
+import tarfile
 import tempfile
+import time
+import zipfile
 
 from datalad import cfg
 from datalad.config import anything2bool
 from datalad.consts import ARCHIVES_TEMP_DIR
 from datalad.support.external_versions import external_versions
-from datalad.support.locking import lock_if_check_fails
+from datalad.support.locking import (
+    InterProcessLock,
+    lock_if_check_fails,
+    try_lock_informatively,
+)
 from datalad.support.path import (
     abspath,
     exists,
     isabs,
     isdir,
+    lexists,
 )
 from datalad.support.path import join as opj
 from datalad.support.path import (
@@ -63,6 +77,15 @@ else:
 
 lgr = logging.getLogger('datalad.support.archives')
 
+# magic bytes of the compression formats, for which members of a compressed
+# tarball can be read without extracting the tarball
+_COMPRESSION_MAGICS = (
+    (b'\x1f\x8b', 'gz'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zst'),
+)
+
 
 def decompress_file(archive, dir_, leading_directories='strip'):
     """Decompress `archive` into a directory `dir_`
@@ -118,6 +141,170 @@ def _get_random_id(size=6, chars=string.ascii_uppercase + string.digits):
     return ''.join(random.choice(chars) for _ in range(size))
 
 
+def _get_compression(archive):
+    """Return the compression of `archive`, as determined by its magic bytes
+
+    None is returned for files that are not compressed by any of the
+    formats in `_COMPRESSION_MAGICS`.
+    """
+    with open(archive, 'rb') as f:
+        head = f.read(6)
+    for magic, compression in _COMPRESSION_MAGICS:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _open_decompressed(archive, compression):
+    """Open `archive` for reading its decompressed content as a stream
+
+    Returns None if the compression is not supported, e.g. because the
+    `zstandard` module is not available.
+    """
+    if compression is None:
+        return open(archive, 'rb')
+    if compression == 'gz':
+        return gzip.open(archive, 'rb')
+    if compression == 'bz2':
+        return bz2.open(archive, 'rb')
+    if compression == 'xz':
+        return lzma.open(archive, 'rb')
+    if compression == 'zst':
+        try:
+            import zstandard
+        except ImportError:
+            lgr.debug("zstandard module is not available, cannot read "
+                      "members of %s", archive)
+            return None
+        return zstandard.ZstdDecompressor().stream_reader(
+            open(archive, 'rb'), closefd=True)
+    return None
+
+
+def _copy_bytes(src, dst, size, chunk_size=1024 ** 2):
+    """Copy `size` bytes from file object `src` to file object `dst`"""
+    while size > 0:
+        chunk = src.read(min(chunk_size, size))
+        if not chunk:
+            raise IOError("Unexpected end of data, %d bytes missing" % size)
+        dst.write(chunk)
+        size -= len(chunk)
+
+
+def _normalize_member_name(name):
+    return posixpath.normpath(name.replace(os.sep, '/')).lstrip('/')
+
+
+def _get_tree_size(path):
+    """Return the total size of all files under `path`"""
+    size = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.lstat(opj(root, name)).st_size
+            except OSError:
+                pass
+    return size
+
+
+class _CacheUsage(object):
+    """Sizes and times of last use of the archives extracted into a cache
+
+    They are recorded in a JSON file within the cache directory, which is
+    shared by all processes that use the cache. Whenever an extracted archive
+    is used, the least recently used other archives are removed from the
+    cache, until the total size of all extracted archives is within
+    `max_size`.
+    """
+    INDEX_FILENAME = '.usage'
+    # archives used within this many seconds are not removed, another process
+    # might be about to read from them
+    grace_period = 60
+
+    def __init__(self, path, max_size=0):
+        self.path = path
+        self.index_path = opj(path, self.INDEX_FILENAME)
+        self.max_size = max_size
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                usage = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            lgr.debug("Ignoring unreadable archives cache usage %s: %s",
+                      self.index_path, e)
+            return {}
+        # archives might have been removed by other means, e.g. `clean`
+        return {name: entry for name, entry in usage.items()
+                if exists(opj(self.path, name))}
+
+    def _save(self, usage):
+        tmp_path = '%s.%s' % (self.index_path, _get_random_id())
+        with open(tmp_path, 'w') as f:
+            json.dump(usage, f)
+        os.replace(tmp_path, self.index_path)
+
+    def record_use(self, earchive):
+        """Record the use of an extracted archive, and enforce `max_size`"""
+        name = os.path.basename(earchive.path)
+        lock = InterProcessLock(self.index_path + '.lck')
+        with try_lock_informatively(
+                lock,
+                purpose="update the usage of the archives cache",
+                proceed_unlocked=True) as locked:
+            if not locked:
+                return
+            usage = self._load()
+            entry = usage.get(name)
+            if entry is None:
+                entry = usage[name] = dict(size=_get_tree_size(earchive.path))
+            entry['last_used'] = time.time()
+            if self.max_size:
+                self._evict(usage, keep=name)
+            self._save(usage)
+
+    def _evict(self, usage, keep):
+        total = sum(entry['size'] for entry in usage.values())
+        if total <= self.max_size:
+            return
+        now = time.time()
+        for name, entry in sorted(usage.items(),
+                                  key=lambda i: i[1]['last_used']):
+            if total <= self.max_size:
+                break
+            if name == keep or now - entry['last_used'] < self.grace_period:
+                continue
+            path = opj(self.path, name)
+            # do not interfere with an ongoing extraction, it holds this
+            # lock (see ExtractedArchive.assure_extracted)
+            lock_path = path + '.extract-lck'
+            lock = InterProcessLock(lock_path)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                lgr.debug("Removing least recently used archive of %d bytes "
+                          "from the cache: %s", entry['size'], path)
+                # remove the stamp first, so the archive is no longer
+                # considered to be extracted
+                stamp_path = path + ExtractedArchive.STAMP_SUFFIX
+                if exists(stamp_path):
+                    unlink(stamp_path)
+                if exists(path):
+                    rmtree(path)
+            finally:
+                lock.release()
+                if exists(lock_path):
+                    unlink(lock_path)
+            del usage[name]
+            total -= entry['size']
+        if total > self.max_size:
+            lgr.debug("Archives cache %s holds %d bytes, which exceeds the "
+                      "limit of %d bytes, but all archives are in use",
+                      self.path, total, self.max_size)
+
+
 class ArchivesCache(object):
     """Cache to maintain extracted archives
 
@@ -128,11 +315,16 @@ class ArchivesCache(object):
       If not provided -- random tempdir is used
     persistent : bool, optional
       Passed over into generated ExtractedArchives
+    max_size : int, optional
+      Maximal total size (in bytes) of the extracted archives. If exceeded,
+      the least recently used archives are removed from the cache. If not
+      provided, the `datalad.archives.cache-size` configuration is used.
+      0 disables the limit.
     """
     # TODO: make caching persistent across sessions/runs, with cleanup
     # IDEA: extract under .git/annex/tmp so later on annex unused could clean it
     #       all up
-    def __init__(self, toppath=None, persistent=False):
+    def __init__(self, toppath=None, persistent=False, max_size=None):
         self._toppath = toppath
         if toppath:
             path = opj(toppath, ARCHIVES_TEMP_DIR)
@@ -171,6 +363,9 @@ class ArchivesCache(object):
         #if exists(path):
         #    self._clean_cache()
         self._archives = {}
+        if max_size is None:
+            max_size = cfg.obtain('datalad.archives.cache-size')
+        self._usage = _CacheUsage(path, max_size)
 
         # TODO: begging for a race condition
         if not exists(path):
@@ -227,7 +422,8 @@ class ArchivesCache(object):
             self._archives[archive] = \
                 ExtractedArchive(archive,
                                  opj(self.path, _get_cached_filename(archive)),
-                                 persistent=self.persistent)
+                                 persistent=self.persistent,
+                                 usage=self._usage)
 
         return self._archives[archive]
 
@@ -254,8 +450,10 @@ class ExtractedArchive(object):
 
     # suffix to use for a stamp so we could guarantee that extracted archive is
     STAMP_SUFFIX = '.stamp'
+    # suffix of the file with the index of the members of a tarball
+    MEMBERS_SUFFIX = '.members'
 
-    def __init__(self, archive, path=None, persistent=False):
+    def __init__(self, archive, path=None, persistent=False, usage=None):
         self._archive = archive
         # TODO: bad location for extracted archive -- use tempfile
         if not path:
@@ -266,6 +464,12 @@ class ExtractedArchive(object):
                                "persist" % path)
         self._persistent = persistent
         self._path = path
+        # index of the archive members, loaded on first use
+        self._members = None
+        # bytes decompressed so far to read members of a compressed tarball
+        self._decompressed = 0
+        # _CacheUsage of the ArchivesCache this archive is extracted into
+        self._usage = usage
 
     def __repr__(self):
         return "%s(%r, path=%r)" % (self.__class__.__name__, self._archive, self.path)
@@ -279,7 +483,8 @@ class ExtractedArchive(object):
 
         for path, name in [
             (self._path, 'cache'),
-            (self.stamp_path, 'stamp file')
+            (self.stamp_path, 'stamp file'),
+            (self.members_index_path, 'member index'),
         ]:
             if exists(path):
                 if (not self._persistent) or force:
@@ -298,6 +503,10 @@ class ExtractedArchive(object):
     def stamp_path(self):
         return self._path + self.STAMP_SUFFIX
 
+    @property
+    def members_index_path(self):
+        return self._path + self.MEMBERS_SUFFIX
+
     @property
     def is_extracted(self):
         return exists(self.path) and exists(self.stamp_path) \
@@ -316,6 +525,8 @@ class ExtractedArchive(object):
             if lock:
                 assert not check
                 self._extract_archive(path)
+        if self._usage is not None:
+            self._usage.record_use(self)
         return path
 
     def _extract_archive(self, path):
@@ -427,6 +638,166 @@ class ExtractedArchive(object):
         assert exists(path), "%s must exist" % path
         return path
 
+    def _get_signature(self):
+        st = os.stat(self._archive)
+        return "%d %d" % (int(st.st_mtime), st.st_size)
+
+    def _load_members(self):
+        """Return the index of the members of a tarball
+
+        The index maps the normalized name of every regular file in the
+        tarball onto its offset and size within the (decompressed) tarball.
+        It is created by a single pass over the tarball, and stored alongside
+        the extraction cache, so that it is reused by later processes for as
+        long as the archive does not change.
+
+        Returns
+        -------
+        dict or None
+          None, if the archive is not a tarball, or its compression is not
+          supported.
+        """
+        signature = self._get_signature()
+        if exists(self.members_index_path):
+            try:
+                with open(self.members_index_path) as f:
+                    index = json.load(f)
+                if index.get('signature') == signature:
+                    return index
+                lgr.debug("Archive %s changed, rebuilding its member index",
+                          self._archive)
+            except (OSError, ValueError) as e:
+                lgr.debug("Ignoring unreadable member index %s: %s",
+                          self.members_index_path, e)
+
+        compression = _get_compression(self._archive)
+        stream = _open_decompressed(self._archive, compression)
+        if stream is None:
+            return None
+        members = {}
+        lgr.debug("Indexing members of %s", self._archive)
+        try:
+            with stream, tarfile.open(
+                    fileobj=stream,
+                    # only an uncompressed tarball can be seeked
+                    mode='r:' if compression is None else 'r|') as tar:
+                for member in tar:
+                    # links and sparse files cannot be read as a single
+                    # block of bytes
+                    if not member.isreg() or member.issparse():
+                        continue
+                    members[_normalize_member_name(member.name)] = \
+                        (member.offset_data, member.size)
+        except (tarfile.TarError, OSError, EOFError) as e:
+            lgr.debug("Cannot index %s as a tarball: %s", self._archive, e)
+            return None
+
+        index = dict(
+            signature=signature,
+            compression=compression,
+            members=members,
+        )
+        parent = os.path.dirname(self.members_index_path)
+        if not exists(parent):
+            os.makedirs(parent)
+        # concurrent processes might build the same index, make sure none
+        # of them reads an incomplete one
+        tmp_path = '%s.%s' % (self.members_index_path, _get_random_id())
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.members_index_path)
+        return index
+
+    def extract_member(self, afile, dst):
+        """Extract a single member `afile` of the archive into `dst`
+
+        In contrast to `get_extracted_file()`, the archive is not extracted,
+        only the bytes of the member are read. This is supported for ZIP
+        archives, whose central directory already provides random access to
+        the members, and for uncompressed or gzip, bzip2, xz, or zstd
+        (if the `zstandard` module is available) compressed tarballs.
+        For tarballs, an index of the members is kept (see `_load_members()`).
+        The members of an uncompressed tarball are read directly. For a
+        compressed tarball, the stream is decompressed up to the end of the
+        member, without storing any other member. As this is repeated for
+        every member, reading many members would cost far more than a single
+        extraction. Hence members are only read as long as the total of
+        decompressed bytes stays within the size of the decompressed tarball,
+        i.e. the cost of extracting it once. Beyond that, False is returned.
+
+        Parameters
+        ----------
+        afile : str
+          Path of the member within the archive.
+        dst : str
+          Path to write the content of the member to.
+
+        Returns
+        -------
+        bool
+          Whether the member was extracted. If False, the archive format
+          or the member are not supported, and `get_extracted_file()` must
+          be used.
+        """
+        name = _normalize_member_name(afile)
+        with open(self._archive, 'rb') as f:
+            is_zip = f.read(2) == b'PK'
+        if is_zip and zipfile.is_zipfile(self._archive):
+            try:
+                with zipfile.ZipFile(self._archive) as zf:
+                    try:
+                        info = zf.getinfo(name)
+                    except KeyError:
+                        return False
+                    if info.is_dir():
+                        return False
+                    lgr.debug("Extracting %s from ZIP archive %s",
+                              name, self._archive)
+                    with zf.open(info) as src, open(dst, 'wb') as f:
+                        shutil.copyfileobj(src, f)
+            except (NotImplementedError, RuntimeError,
+                    zipfile.BadZipFile) as e:
+                # e.g. an unsupported compression method (deflate64), an
+                # encrypted member, or a corrupted archive
+                lgr.debug("Cannot read %s from ZIP archive %s: %s",
+                          name, self._archive, e)
+                if lexists(dst):
+                    unlink(dst)
+                return False
+            return True
+
+        if self._members is None:
+            self._members = self._load_members() or {}
+        if name not in self._members.get('members', {}):
+            return False
+        offset, size = self._members['members'][name]
+        if self._members['compression'] is not None:
+            total = max(o + s for o, s in self._members['members'].values())
+            if self._decompressed + offset + size > total:
+                lgr.debug("Not reading %s from %s, exceeds the cost of "
+                          "extracting the tarball", name, self._archive)
+                return False
+            self._decompressed += offset + size
+        stream = _open_decompressed(self._archive,
+                                    self._members['compression'])
+        if stream is None:
+            return False
+        lgr.debug("Extracting %s (%d bytes at offset %d) from tarball %s",
+                  name, size, offset, self._archive)
+        with stream, open(dst, 'wb') as f:
+            if self._members['compression'] is None:
+                stream.seek(offset)
+            else:
+                # decompress, but discard everything up to the member
+                while offset > 0:
+                    skipped = len(stream.read(min(offset, 1024 ** 2)))
+                    if not skipped:
+                        raise IOError(
+                            "Unexpected end of data in %s" % self._archive)
+                    offset -= skipped
+            _copy_bytes(stream, f, size)
+        return True
+
     def __del__(self):
         try:
             if self._persistent:
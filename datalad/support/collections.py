@@ -8,7 +8,10 @@
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 """Auxiliary data structures"""
 
-from typing import Mapping
+from typing import (
+    Mapping,
+    MutableMapping,
+)
 
 
 class ReadOnlyDict(Mapping):
@@ -52,6 +55,105 @@ class ReadOnlyDict(Mapping):
         return self._hash
 
 
+class PathRecord(MutableMapping):
+    """Compact record of the properties of a single path
+
+    Content info records (see `GitRepo.get_content_info()`) are kept in
+    large numbers by internal pipelines, e.g. as the from- and to-states
+    that `GitRepo.diffstatus()` compares, and that `status` and `diff`
+    cache across all queried datasets. The properties these records
+    always have are stored in slots, which takes a fraction of the memory
+    of a dict. Any other property is stored in a dict that is only
+    created on demand.
+
+    Records are not dicts. They must not be passed on to callers of
+    public API, but be turned into a dict first (`dict(record)`).
+    """
+    _fields = ('type', 'gitshasum', 'bytesize')
+    __slots__ = _fields + ('_extra',)
+
+    def __init__(self, *args, **kwargs):
+        self.type = self.gitshasum = self.bytesize = _NOTSET
+        self._extra = None
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        if key in _PATHRECORD_FIELDS:
+            val = getattr(self, key)
+            if val is not _NOTSET:
+                return val
+        elif self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _PATHRECORD_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _PATHRECORD_FIELDS:
+            if getattr(self, key) is _NOTSET:
+                raise KeyError(key)
+            setattr(self, key, _NOTSET)
+        elif self._extra is not None:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in _PATHRECORD_FIELDS:
+            return getattr(self, key) is not _NOTSET
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for f in self._fields:
+            if getattr(self, f) is not _NOTSET:
+                yield f
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(getattr(self, f) is not _NOTSET for f in self._fields) \
+            + (len(self._extra) if self._extra is not None else 0)
+
+    def get(self, key, default=None):
+        # avoid the exception handling of the generic implementation
+        if key in _PATHRECORD_FIELDS:
+            val = getattr(self, key)
+            return default if val is _NOTSET else val
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def copy(self):
+        return self.__class__(self)
+
+    def __getstate__(self):
+        return dict(self)
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, dict(self))
+
+
+class _NotSet:
+    __slots__ = ()
+
+    def __repr__(self):
+        return '<not set>'
+
+
+_NOTSET = _NotSet()
+_PATHRECORD_FIELDS = frozenset(PathRecord._fields)
+
+
 def _val2hashable(val):
     """Small helper to convert incoming mutables to something hashable
 
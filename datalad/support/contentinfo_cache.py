@@ -0,0 +1,144 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Persistent cache for parsed `git ls-files`/`git ls-tree` records
+
+This is used by `GitRepo.get_content_info()`, if enabled via the
+`datalad.repo.contentinfo-cache` configuration. Records of tracked content
+are keyed by the trailing checksum of the Git index (worktree queries), or
+by the SHA of the queried tree (queries for a particular reference). Both
+uniquely identify the content of a listing, hence a cached listing never
+needs to be validated against the work tree.
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from datalad.support.cache import DictCache
+
+lgr = logging.getLogger('datalad.support.contentinfo_cache')
+
+# to be incremented whenever the layout of the stored records changes
+CACHE_FORMAT_VERSION = 1
+# maximum number of tree listings kept on disk for a repository
+MAX_TREE_LISTINGS = 10
+# maximum length of the hash Git appends to the index (SHA256 repositories)
+_INDEX_HASH_LEN = 32
+# length of the trailing index hash that is always present (SHA1)
+_INDEX_SHA1_LEN = 20
+
+# process-wide layer on top of the on-disk storage, maps
+# (cache directory, listing name) to (key, records)
+_memcache = DictCache(size_limit=8)
+
+
+def get_index_key(dot_git):
+    """Determine a cache key for the current content of the Git index
+
+    Git appends a checksum of the entire index content to the index file.
+    It is cheap to read and changes whenever any index entry changes.
+
+    Parameters
+    ----------
+    dot_git : Path
+      Path to the `.git` directory of a repository.
+
+    Returns
+    -------
+    str or None
+      None is returned when there is no index, or the index was written
+      without a checksum (`index.skipHash`). No cache can be used then.
+    """
+    index = Path(dot_git) / 'index'
+    try:
+        with index.open('rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _INDEX_HASH_LEN:
+                return None
+            f.seek(-_INDEX_HASH_LEN, os.SEEK_END)
+            tail = f.read(_INDEX_HASH_LEN)
+    except FileNotFoundError:
+        return None
+    if not any(tail[-_INDEX_SHA1_LEN:]):
+        # no checksum was written
+        return None
+    return '{}-{}'.format(size, tail.hex())
+
+
+class ContentInfoCache(object):
+    """Store for parsed records of Git content listings of a repository
+
+    Each record is a tuple `(mode, gitshasum, bytesize, path)`, with
+    `bytesize` being `None` for index listings and `path` being the POSIX
+    path relative to the repository root, as reported by Git.
+
+    Listings are identified by a name ('index', or 'tree-<sha>') and stored
+    together with the key they were produced for. A listing is only
+    returned if the requested key matches the stored one.
+    """
+    def __init__(self, dot_git):
+        self.path = Path(dot_git) / 'datalad' / 'cache' / 'contentinfo'
+
+    def get(self, name, key):
+        """Return cached records for a listing, or None if there are none"""
+        memkey = (str(self.path), name)
+        cached = _memcache.get(memkey)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            with (self.path / name).open('rb') as f:
+                version, stored_key, records = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # a broken cache must never break a query
+            lgr.debug('Ignoring unreadable content info cache %s: %s',
+                      self.path / name, e)
+            return None
+        if version != CACHE_FORMAT_VERSION or stored_key != key:
+            return None
+        _memcache[memkey] = (key, records)
+        return records
+
+    def put(self, name, key, records):
+        """Store the records of a listing, replacing any previous version"""
+        records = tuple(records)
+        _memcache[(str(self.path), name)] = (key, records)
+        target = self.path / name
+        tmp = target.with_name('.{}.{}.tmp'.format(name, os.getpid()))
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with tmp.open('wb') as f:
+                pickle.dump((CACHE_FORMAT_VERSION, key, records), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic replacement, concurrent readers see the old or the
+            # new version, but never a partial file
+            os.replace(str(tmp), str(target))
+        except OSError as e:
+            lgr.debug('Could not write content info cache %s: %s', target, e)
+            if tmp.exists():
+                tmp.unlink()
+            return
+        if name.startswith('tree-'):
+            self._prune_trees()
+
+    def _prune_trees(self):
+        trees = []
+        for p in self.path.glob('tree-*'):
+            try:
+                trees.append((p.stat().st_mtime, p))
+            except OSError:
+                # could have been removed by a concurrent process
+                continue
+        for _, p in sorted(trees, reverse=True)[MAX_TREE_LISTINGS:]:
+            try:
+                p.unlink()
+            except OSError:
+                pass
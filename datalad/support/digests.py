@@ -10,6 +10,8 @@
 """
 
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from ..utils import auto_repr
 
@@ -25,12 +27,14 @@ class Digester(object):
     # Loosely based on snippet by PM 2Ring 2014.10.23
     # http://unix.stackexchange.com/a/163769/55543
 
-    # Ideally we should find an efficient way to parallelize this but
-    # atm this one is sufficiently speedy
-
     DEFAULT_DIGESTS = ['md5', 'sha1', 'sha256', 'sha512']
 
-    def __init__(self, digests=None, blocksize=1 << 16):
+    # Files of at least this size are digested in threads by default
+    THREADED_MIN_SIZE = 1 << 24
+    # Chunk size (in bytes) by which to consume a file in threads
+    THREADED_BLOCKSIZE = 1 << 22
+
+    def __init__(self, digests=None, blocksize=1 << 16, threaded=None):
         """
         Parameters
         ----------
@@ -40,10 +44,17 @@ class Digester(object):
           sha256, sha512).
         blocksize : int
           Chunk size (in bytes) by which to consume a file.
+        threaded : bool or None
+          Whether to update every digest in its own thread, while the next
+          chunk of the file is read. As hashlib releases the GIL while
+          digesting large chunks, it then takes about as long as the
+          slowest digest, instead of the sum of all. If None, threads are
+          used for files of at least `THREADED_MIN_SIZE` bytes.
         """
         self._digests = digests or self.DEFAULT_DIGESTS
         self._digest_funcs = [getattr(hashlib, digest) for digest in self._digests]
         self.blocksize = blocksize
+        self.threaded = threaded
 
     @property
     def digests(self):
@@ -61,11 +72,39 @@ class Digester(object):
         """
         lgr.debug("Estimating digests for %s", fpath)
         digests = [x() for x in self._digest_funcs]
+        threaded = self.threaded
         with open(fpath, 'rb') as f:
-            while True:
-                block = f.read(self.blocksize)
-                if not block:
-                    break
-                [d.update(block) for d in digests]
+            if threaded is None:
+                threaded = \
+                    os.fstat(f.fileno()).st_size >= self.THREADED_MIN_SIZE
+            if threaded:
+                self._update_threaded(f, digests)
+            else:
+                while True:
+                    block = f.read(self.blocksize)
+                    if not block:
+                        break
+                    [d.update(block) for d in digests]
 
         return {n: d.hexdigest() for n, d in zip(self.digests, digests)}
+
+    def _update_threaded(self, f, digests):
+        blocksize = max(self.blocksize, self.THREADED_BLOCKSIZE)
+        # the digests are updated from one buffer, while the next chunk is
+        # read into the other one
+        buffers = [bytearray(blocksize), bytearray(blocksize)]
+        current = 0
+        pending = []
+        with ThreadPoolExecutor(
+                len(digests), thread_name_prefix='datalad-digest') as pool:
+            while True:
+                view = memoryview(buffers[current])
+                size = f.readinto(view)
+                # a digest must be updated in order, one chunk at a time
+                for future in pending:
+                    future.result()
+                if not size:
+                    break
+                chunk = view[:size]
+                pending = [pool.submit(d.update, chunk) for d in digests]
+                current = 1 - current
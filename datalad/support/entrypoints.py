@@ -16,6 +16,46 @@ from datalad.support.exceptions import CapturedException
 lgr = logging.getLogger('datalad.support.entrypoints')
 
 
+def _get_entry_points(group):
+    if sys.version_info < (3, 10):
+        # 3.10 is when it was no longer provisional
+        from importlib_metadata import entry_points
+    else:
+        from importlib.metadata import entry_points
+    return entry_points(group=group)
+
+
+def get_entrypoints_signature(group):
+    """Describe the installed entrypoints of a given group
+
+    The signature changes whenever an entrypoint is added or removed, or the
+    distribution that provides it is updated, without loading any
+    entrypoint. It can be used to validate caches of information that was
+    obtained by loading entrypoints.
+
+    Parameters
+    ----------
+    group: str
+      Name of the entry point group, such as 'datalad.extensions'.
+
+    Returns
+    -------
+    list
+      A sorted list with a `[name, value, distribution name, distribution
+      version]` list for each entrypoint.
+    """
+    signature = []
+    for ep in _get_entry_points(group):
+        dist = getattr(ep, 'dist', None)
+        signature.append([
+            ep.name,
+            ep.value,
+            dist.name if dist else None,
+            dist.version if dist else None,
+        ])
+    return sorted(signature, key=lambda x: [str(i) for i in x])
+
+
 def iter_entrypoints(group, load=False):
     """Iterate over all entrypoints of a given group
 
@@ -42,12 +82,7 @@ def iter_entrypoints(group, load=False):
     """
     lgr.debug("Processing entrypoints")
 
-    if sys.version_info < (3, 10):
-        # 3.10 is when it was no longer provisional
-        from importlib_metadata import entry_points
-    else:
-        from importlib.metadata import entry_points
-    for ep in entry_points(group=group):
+    for ep in _get_entry_points(group):
         if not load:
             yield ep.name, ep.module, ep.load
             continue
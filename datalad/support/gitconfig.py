@@ -0,0 +1,565 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+"""Read Git configuration files without calling `git config`
+
+This is used by `ConfigManager`, if enabled via the
+`datalad.runtime.native-gitconfig` configuration. It reports the same
+information as `git config -z --list --show-origin` piped through
+`parse_gitconfig_dump()` would, including content from `include.path` and
+`includeIf.<condition>.path` directives.
+
+Parsed files are cached process-wide, keyed by path, inode, modification
+time and size. Most of the configuration (system, global) is shared by all
+repositories, and is therefore only parsed once.
+
+Any setup that cannot be handled reliably leads to an
+`UnsupportedGitConfig` exception. Callers are expected to fall back on
+`git config` in this case.
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+
+from datalad.runner import (
+    CommandError,
+    GitRunner,
+    StdOutErrCapture,
+)
+from datalad.support.cache import DictCache
+
+lgr = logging.getLogger('datalad.support.gitconfig')
+
+# Git refuses to follow include chains deeper than this
+MAX_INCLUDE_DEPTH = 10
+
+# maps (path, inode, mtime, size) or ('blob', sha) to parsed records
+_records_cache = DictCache(size_limit=10000)
+# location of the system config file, determined once per process
+_system_config = []
+
+_section_regex = re.compile(r'[A-Za-z0-9.-]+')
+_name_regex = re.compile(r'[A-Za-z][A-Za-z0-9-]*')
+_value_escapes = {'n': '\n', 't': '\t', 'b': '\b', '\\': '\\', '"': '"'}
+
+
+class UnsupportedGitConfig(Exception):
+    """Configuration that can only be read via `git config`"""
+    pass
+
+
+def parse_gitconfig(text):
+    """Parse the content of a Git config file
+
+    Parameters
+    ----------
+    text : str
+
+    Returns
+    -------
+    list
+      Of `(key, value)` tuples, in order of appearance. Keys are normalized
+      like Git reports them (lower-case section and name, case-preserving
+      subsection). `value` is None for keys without a value assignment.
+
+    Raises
+    ------
+    UnsupportedGitConfig
+      On any syntax error. Git would reject such a file, and its error
+      message should be seen.
+    """
+    records = []
+    section = None
+    text = text.replace('\r\n', '\n')
+    if text.startswith('\ufeff'):
+        text = text[1:]
+    pos = 0
+    end = len(text)
+    while pos < end:
+        c = text[pos]
+        if c in ' \t\n\r':
+            pos += 1
+        elif c in '#;':
+            # comment line
+            eol = text.find('\n', pos)
+            pos = end if eol < 0 else eol + 1
+        elif c == '[':
+            section, pos = _parse_section(text, pos + 1)
+        else:
+            m = _name_regex.match(text, pos)
+            if not m:
+                raise UnsupportedGitConfig(
+                    'invalid config line at {!r}'.format(text[pos:pos + 20]))
+            if section is None:
+                raise UnsupportedGitConfig('key outside of a section')
+            pos = m.end()
+            while pos < end and text[pos] in ' \t':
+                pos += 1
+            if pos >= end or text[pos] == '\n':
+                value = None
+            elif text[pos] == '=':
+                value, pos = _parse_value(text, pos + 1)
+            else:
+                raise UnsupportedGitConfig(
+                    'invalid key {!r}'.format(m.group(0)))
+            records.append(
+                ('{}.{}'.format(section, m.group(0).lower()), value))
+    return records
+
+
+def _parse_section(text, pos):
+    m = _section_regex.match(text, pos)
+    if not m:
+        raise UnsupportedGitConfig('invalid section header')
+    name = m.group(0)
+    pos = m.end()
+    if text.startswith(']', pos):
+        # deprecated [section.subsection] syntax is all lower-case
+        return name.lower(), pos + 1
+    if '.' in name or not text.startswith((' ', '\t'), pos):
+        raise UnsupportedGitConfig('invalid section header')
+    while pos < len(text) and text[pos] in ' \t':
+        pos += 1
+    if not text.startswith('"', pos):
+        raise UnsupportedGitConfig('invalid section header')
+    pos += 1
+    subsection = []
+    while True:
+        c = text[pos] if pos < len(text) else '\n'
+        if c == '\n':
+            raise UnsupportedGitConfig('unterminated subsection')
+        if c == '"':
+            break
+        if c == '\\':
+            pos += 1
+            c = text[pos] if pos < len(text) else '\n'
+            if c == '\n':
+                raise UnsupportedGitConfig('unterminated subsection')
+        subsection.append(c)
+        pos += 1
+    if not text.startswith(']', pos + 1):
+        raise UnsupportedGitConfig('invalid section header')
+    return '{}.{}'.format(name.lower(), ''.join(subsection)), pos + 2
+
+
+def _parse_value(text, pos):
+    """Parse a value like Git's config.c:parse_value()"""
+    value = []
+    # whitespace is only kept when followed by other content
+    pending_space = 0
+    quote = False
+    comment = False
+    end = len(text)
+    while True:
+        c = text[pos] if pos < end else '\n'
+        pos += 1
+        if c == '\n':
+            if quote:
+                raise UnsupportedGitConfig('unterminated quoted value')
+            return ''.join(value), pos
+        if comment:
+            continue
+        if c.isspace() and not quote:
+            if value:
+                pending_space += 1
+            continue
+        if not quote and c in ';#':
+            comment = True
+            continue
+        if pending_space:
+            value.append(' ' * pending_space)
+            pending_space = 0
+        if c == '\\':
+            c = text[pos] if pos < end else '\n'
+            pos += 1
+            if c == '\n':
+                # line continuation
+                continue
+            if c not in _value_escapes:
+                raise UnsupportedGitConfig('invalid escape in value')
+            value.append(_value_escapes[c])
+        elif c == '"':
+            quote = not quote
+        else:
+            value.append(c)
+
+
+def read_gitconfig_file(path):
+    """Return parsed records of a config file, or None if it does not exist
+
+    Results are cached process-wide, and are reused as long as the
+    inode, modification time and size of the file remain unchanged.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    key = (str(path), st.st_ino, st.st_mtime_ns, st.st_size)
+    records = _records_cache.get(key)
+    if records is None:
+        try:
+            text = path.read_text(encoding='utf-8')
+        except UnicodeDecodeError as e:
+            raise UnsupportedGitConfig(
+                'cannot decode {}: {}'.format(path, e)) from e
+        records = tuple(parse_gitconfig(text))
+        _records_cache[key] = records
+    return records
+
+
+def read_gitconfig_blob(objectname, text):
+    """Return parsed records of a config blob with the given SHA"""
+    key = ('blob', objectname)
+    records = _records_cache.get(key)
+    if records is None:
+        records = tuple(parse_gitconfig(text))
+        _records_cache[key] = records
+    return records
+
+
+def get_system_gitconfig():
+    """Return the location of Git's system config file, or None"""
+    if os.environ.get('GIT_CONFIG_NOSYSTEM', '').lower() in (
+            '1', 'true', 'yes', 'on'):
+        return None
+    if os.environ.get('GIT_CONFIG_SYSTEM'):
+        return Path(os.environ['GIT_CONFIG_SYSTEM'])
+    if not _system_config:
+        _system_config.append(_query_system_gitconfig())
+    return _system_config[0]
+
+
+def _query_system_gitconfig():
+    # the location is compiled into Git. Only Git 2.42+ reports it
+    # directly, older versions report it as the origin of its content.
+    runner = GitRunner()
+    try:
+        out = runner.run(['git', 'var', 'GIT_CONFIG_SYSTEM'],
+                         protocol=StdOutErrCapture)['stdout'].strip()
+        return Path(out) if out else None
+    except CommandError:
+        pass
+    try:
+        out = runner.run(
+            ['git', 'config', '--system', '--show-origin', '--list', '-z'],
+            protocol=StdOutErrCapture)['stdout']
+    except CommandError as e:
+        # Git fails if the file does not exist, and names it
+        m = re.search(r"'([^']+)'", e.stderr or '')
+        if m and not Path(m.group(1)).exists():
+            return Path(m.group(1))
+        raise UnsupportedGitConfig(
+            'cannot determine system config location') from e
+    if not out:
+        # exists, but is empty
+        return None
+    origin = out.split('\0', 1)[0]
+    if not origin.startswith('file:'):
+        raise UnsupportedGitConfig(
+            'unexpected system config origin {!r}'.format(origin))
+    return Path(origin[5:])
+
+
+def get_global_gitconfigs():
+    """Return the locations of Git's global (user) config files"""
+    if os.environ.get('GIT_CONFIG_GLOBAL'):
+        return [Path(os.environ['GIT_CONFIG_GLOBAL'])]
+    home = os.environ.get('HOME')
+    xdg = os.environ.get('XDG_CONFIG_HOME')
+    files = []
+    if xdg:
+        files.append(Path(xdg) / 'git' / 'config')
+    elif home:
+        files.append(Path(home) / '.config' / 'git' / 'config')
+    if home:
+        files.append(Path(home) / '.gitconfig')
+    return files
+
+
+def get_repo_gitconfigs(git_dir):
+    """Return the locations of a repository's local and worktree config
+
+    Parameters
+    ----------
+    git_dir : Path
+      The `.git` directory of a repository, or the repository itself
+      if it is bare.
+
+    Returns
+    -------
+    Path, Path
+      Local config file, and worktree-specific config file (to be
+      considered only if `extensions.worktreeConfig` is enabled).
+    """
+    git_dir = Path(git_dir)
+    common_dir = git_dir
+    commondir_file = git_dir / 'commondir'
+    if commondir_file.exists():
+        # linked worktree, the local config is shared
+        common_dir = git_dir / commondir_file.read_text().strip()
+    return common_dir / 'config', git_dir / 'config.worktree'
+
+
+def get_command_line_gitconfig():
+    """Return records of configuration passed via the environment
+
+    This is configuration given via `git -c` (`GIT_CONFIG_PARAMETERS`),
+    or via `GIT_CONFIG_COUNT`, `GIT_CONFIG_KEY_<n>`, and
+    `GIT_CONFIG_VALUE_<n>`.
+    """
+    records = []
+    count = os.environ.get('GIT_CONFIG_COUNT')
+    if count:
+        try:
+            for i in range(int(count)):
+                records.append((
+                    os.environ['GIT_CONFIG_KEY_{}'.format(i)],
+                    os.environ['GIT_CONFIG_VALUE_{}'.format(i)]))
+        except (KeyError, ValueError) as e:
+            raise UnsupportedGitConfig(
+                'invalid GIT_CONFIG_COUNT specification') from e
+    params = os.environ.get('GIT_CONFIG_PARAMETERS', '').strip()
+    while params:
+        key, params = _sq_dequote(params)
+        if params.startswith('='):
+            # 'key'='value' (Git 2.31+)
+            value, params = _sq_dequote(params[1:])
+        elif '=' in key:
+            # 'key=value'
+            key, value = key.split('=', 1)
+        else:
+            value = None
+        records.append((key, value))
+        params = params.lstrip()
+    return [(_normalize_key(k), v) for k, v in records]
+
+
+def _sq_dequote(text):
+    """Split off the leading single-quoted string, like Git's sq_dequote"""
+    if not text.startswith("'"):
+        raise UnsupportedGitConfig('invalid GIT_CONFIG_PARAMETERS')
+    out = []
+    pos = 1
+    while True:
+        end = text.find("'", pos)
+        if end < 0:
+            raise UnsupportedGitConfig('invalid GIT_CONFIG_PARAMETERS')
+        out.append(text[pos:end])
+        # an escaped quote or exclamation mark continues the string
+        if text[end + 1:end + 2] == '\\' and text[end + 2:end + 3] in ("'", '!') \
+                and text[end + 3:end + 4] == "'":
+            out.append(text[end + 2])
+            pos = end + 4
+            continue
+        return ''.join(out), text[end + 1:]
+
+
+def _normalize_key(key):
+    """Lower-case section and name, but not the subsection of a key"""
+    section, _, rest = key.partition('.')
+    subsection, _, name = rest.rpartition('.')
+    if not section or not name:
+        raise UnsupportedGitConfig('invalid key {!r}'.format(key))
+    return '.'.join(
+        p for p in (section.lower(), subsection, name.lower()) if p)
+
+
+def check_environment():
+    """Raise UnsupportedGitConfig, if the environment overrides config
+
+    Git would consider configuration from the environment that is not
+    implemented here, or would read a different repository.
+    """
+    for var in ('GIT_CONFIG', 'GIT_DIR', 'GIT_COMMON_DIR'):
+        if os.environ.get(var):
+            raise UnsupportedGitConfig(
+                'configuration is affected by ${}'.format(var))
+
+
+class GitConfigReader(object):
+    """Assemble configuration from files, resolving includes
+
+    Parameters
+    ----------
+    git_dir : Path or None
+      The `.git` directory of the repository the configuration is read
+      for. Used to evaluate `includeIf` conditions. If None, no
+      conditional includes are considered.
+    includes : bool, optional
+      Whether to follow include directives. Git only does this when
+      reading the full configuration, but not for a particular file
+      (`git config --file|--blob|--local`), unless `--includes` is given.
+    multi_value : bool, optional
+      See `parse_gitconfig_dump()`.
+    """
+    def __init__(self, git_dir=None, includes=True, multi_value=True):
+        self.git_dir = git_dir
+        self.includes = includes
+        self.multi_value = multi_value
+        self.cfg = {}
+        self.files = set()
+
+    def read_file(self, path, _depth=0):
+        """Add all configuration from a file, if it exists"""
+        path = Path(path)
+        records = read_gitconfig_file(path)
+        if records is None:
+            return
+        self.files.add(path)
+        self._add_records(records, path, _depth)
+
+    def read_blob(self, name, objectname, text):
+        """Add all configuration from a blob
+
+        Parameters
+        ----------
+        name : str
+          Object name, as given to `git config --blob`.
+        objectname : str
+          SHA of the blob.
+        text : str
+          Blob content.
+        """
+        self.files.add('blob:{}'.format(name))
+        self._add_records(read_gitconfig_blob(objectname, text), None, 0)
+
+    def read_command_line(self):
+        """Add all configuration passed via the environment"""
+        self._add_records(get_command_line_gitconfig(), None, 0)
+
+    def _add_records(self, records, path, depth):
+        for k, v in records:
+            self._add_value(k, v)
+            if not self.includes or not k.endswith('.path') or not (
+                    k == 'include.path' or k.startswith('includeif.')):
+                continue
+            if v is None:
+                raise UnsupportedGitConfig('include without a path')
+            if k != 'include.path' and not self._matches(
+                    k[len('includeif.'):-len('.path')], path):
+                continue
+            if path is None:
+                raise UnsupportedGitConfig('include without a file')
+            if depth >= MAX_INCLUDE_DEPTH:
+                raise UnsupportedGitConfig('include depth exceeded')
+            self.read_file(
+                path.parent / _expand_home(v),
+                _depth=depth + 1)
+
+    def _add_value(self, k, v):
+        present_v = self.cfg.get(k, None)
+        if present_v is None or not self.multi_value:
+            self.cfg[k] = v
+        elif isinstance(present_v, tuple):
+            self.cfg[k] = present_v + (v,)
+        else:
+            self.cfg[k] = (present_v, v)
+
+    def _matches(self, condition, path):
+        if condition.startswith(('gitdir:', 'gitdir/i:')):
+            if self.git_dir is None:
+                return False
+            icase = condition.startswith('gitdir/i:')
+            pattern = condition.split(':', 1)[1]
+            if pattern.startswith('./'):
+                if path is None:
+                    raise UnsupportedGitConfig('relative gitdir condition')
+                pattern = str(path.parent) + pattern[1:]
+            pattern = _expand_home(pattern)
+            if not os.path.isabs(pattern):
+                pattern = '**/' + pattern
+            if pattern.endswith('/'):
+                pattern += '**'
+            regex = _wildmatch_to_regex(pattern, icase)
+            return any(
+                regex.match(p) for p in (
+                    os.path.realpath(str(self.git_dir)),
+                    os.path.abspath(str(self.git_dir))))
+        elif condition.startswith('onbranch:'):
+            if self.git_dir is None:
+                return False
+            pattern = condition[len('onbranch:'):]
+            if pattern.endswith('/'):
+                pattern += '**'
+            try:
+                head = (Path(self.git_dir) / 'HEAD').read_text().strip()
+            except OSError:
+                return False
+            if not head.startswith('ref: refs/heads/'):
+                return False
+            return bool(_wildmatch_to_regex(pattern, False).match(
+                head[len('ref: refs/heads/'):]))
+        elif condition.startswith('hasconfig:'):
+            raise UnsupportedGitConfig(
+                'unsupported include condition {!r}'.format(condition))
+        # Git ignores unknown conditions
+        return False
+
+
+def _expand_home(path):
+    if path.startswith('~/'):
+        home = os.environ.get('HOME')
+        if not home:
+            raise UnsupportedGitConfig('cannot expand ~ without $HOME')
+        return home + path[1:]
+    elif path.startswith('~'):
+        raise UnsupportedGitConfig('unsupported path {!r}'.format(path))
+    return path
+
+
+def _wildmatch_to_regex(pattern, icase):
+    """Translate a Git wildmatch pattern (WM_PATHNAME mode) to a regex"""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**', i) and (i == 0 or pattern[i - 1] == '/'):
+                if pattern.startswith('/', i + 2):
+                    # zero or more leading directories
+                    out.append('(?:.*/)?')
+                    i += 3
+                    continue
+                if i + 2 == n:
+                    out.append('.*')
+                    break
+            while i < n and pattern[i] == '*':
+                i += 1
+            out.append('[^/]*')
+            continue
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            j = pattern.find(']', j)
+            if j < 0:
+                out.append(re.escape(c))
+            else:
+                spec = pattern[i + 1:j]
+                if '[:' in spec or '\\' in spec:
+                    raise UnsupportedGitConfig(
+                        'unsupported pattern {!r}'.format(pattern))
+                if spec[0] in '!^':
+                    spec = '^' + spec[1:]
+                out.append('[{}]'.format(spec.replace('[', '\\[')))
+                i = j
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile(''.join(out) + r'\Z', re.IGNORECASE if icase else 0)
@@ -58,6 +58,7 @@ from datalad.dataset.gitrepo import (
     path_based_str_repr,
 )
 from datalad.log import log_progress
+from datalad.support.collections import PathRecord
 from datalad.support.due import (
     Doi,
     due,
@@ -86,6 +87,10 @@ from .exceptions import (
     NoSuchPathError,
 )
 # imports from same module:
+from .contentinfo_cache import (
+    ContentInfoCache,
+    get_index_key,
+)
 from .external_versions import external_versions
 from .network import (
     RI,
@@ -783,6 +788,9 @@ class GitRepo(CoreGitRepo):
 
     GIT_MIN_VERSION = "2.19.1"
     git_version = None
+    # whether the builtin filesystem monitor daemon is supported by Git
+    # (platform dependent), determined once on first use
+    _fsmonitor_supported = None
 
     @classmethod
     def _check_git_version(cls):
@@ -893,6 +901,8 @@ class GitRepo(CoreGitRepo):
             git_opts.update(kwargs)
 
         self._cfg = None
+        # whether Git's worktree caches were configured for this repo
+        self._worktree_cache_enabled = False
 
         if do_create:  # we figured it out earlier
             from_cmdline = git_opts.pop('_from_cmdline_', [])
@@ -2737,7 +2747,8 @@ class GitRepo(CoreGitRepo):
                         attrline += ' {}={}'.format(a, val)
                 f.write('{}\n'.format(attrline))
 
-    def get_content_info(self, paths=None, ref=None, untracked='all'):
+    def get_content_info(self, paths=None, ref=None, untracked='all',
+                         _record_cls=dict):
         """Get identifier and type information from repository content.
 
         This is simplified front-end for `git ls-files/tree`.
@@ -2792,19 +2803,105 @@ class GitRepo(CoreGitRepo):
         # TODO limit by file type to replace code in subdatasets command
         info = dict()
 
-        if paths:  # is not None separate after
-            # path matching will happen against what Git reports
-            # and Git always reports POSIX paths
-            # any incoming path has to be relative already, so we can simply
-            # convert unconditionally
-            # note: will be list-ified below
-            posix_paths = [ut.PurePath(p).as_posix() for p in paths]
-        elif paths is not None:
+        if paths is not None and not paths:
             return info
+        posix_paths = self._get_content_info_paths(paths, ref)
+
+        cache = self._get_content_info_cache(ref, posix_paths)
+
+        cmd, untracked_opts, props_re = self._get_content_info_cmd(
+            ref, untracked)
+
+        if cache is None:
+            records = self._get_content_info_records(
+                cmd + untracked_opts, ref, posix_paths, props_re)
         else:
-            posix_paths = None
+            cache, name, key = cache
+            tracked = cache.get(name, key)
+            if tracked is None:
+                lgr.debug('No cached content info for %s', name)
+                tracked = list(self._get_content_info_records(
+                    cmd, ref, None, props_re))
+                # only store, if the index did not change while we were
+                # reading it
+                if ref or key == get_index_key(self.dot_git):
+                    cache.put(name, key, tracked)
+            records = _filter_content_info_records(tracked, posix_paths)
+            if untracked_opts:
+                # untracked content is not part of the index, must always
+                # be determined. ls-files reports it ahead of the tracked
+                # content, keep this order
+                records = chain(
+                    self._get_content_info_records(
+                        ['ls-files', '-z'] + untracked_opts,
+                        ref, posix_paths, props_re),
+                    records)
+
+        self._get_content_info_from_records(ref, info, records, _record_cls)
+
+        lgr.debug('Done %s.get_content_info(...)', self)
+        return info
+
+    def get_content_info_(self, paths=None, ref=None, untracked='all'):
+        """Like get_content_info(), but yields records one by one
+
+        Records are yielded in the order reported by Git, as soon as they
+        are available. Nothing is accumulated, hence memory demands do not
+        depend on the number of reported items. Content listings are never
+        taken from, or written to the cache that `get_content_info()` can
+        use (`datalad.repo.contentinfo-cache`).
+
+        Parameters
+        ----------
+        paths : list(pathlib.PurePath) or None
+          See get_content_info().
+        ref : gitref or None
+          See get_content_info().
+        untracked : {'no', 'normal', 'all'}
+          See get_content_info(). Untracked content is reported ahead of
+          any tracked content.
 
-        if posix_paths and (not ref or external_versions["cmd:git"] >= "2.29.0"):
+        Yields
+        ------
+        tuple
+          `(path, props)` with `path` and `props` matching a key and value
+          of the dict returned by get_content_info(). Tracked content is
+          reported in the sort order of the Git index (bytewise order of
+          POSIX paths).
+        """
+        if paths is not None and not paths:
+            return
+        posix_paths = self._get_content_info_paths(paths, ref)
+        cmd, untracked_opts, props_re = self._get_content_info_cmd(
+            ref, untracked)
+        if untracked_opts:
+            yield from self._iter_content_info_items(
+                ref,
+                self._iter_content_info_records(
+                    ['ls-files', '-z'] + untracked_opts,
+                    ref, posix_paths, props_re))
+        yield from self._iter_content_info_items(
+            ref,
+            self._iter_content_info_records(
+                cmd, ref, posix_paths, props_re))
+
+    def _get_content_info_paths(self, paths, ref):
+        """Internal helper of get_content_info() to prepare query paths
+
+        Returns
+        -------
+        list or None
+          POSIX paths to pass to Git, or None to query all content.
+        """
+        if not paths:
+            return None
+        # path matching will happen against what Git reports
+        # and Git always reports POSIX paths
+        # any incoming path has to be relative already, so we can simply
+        # convert unconditionally
+        posix_paths = [ut.PurePath(p).as_posix() for p in paths]
+
+        if not ref or external_versions["cmd:git"] >= "2.29.0":
             # If a path points within a submodule, we need to map it to the
             # containing submodule before feeding it to ls-files or ls-tree.
             #
@@ -2815,7 +2912,17 @@ class GitRepo(CoreGitRepo):
                           for s in self.get_submodules_()]
             # `paths` get normalized into PurePosixPath above, submodules are POSIX as well
             posix_paths = get_parent_paths(posix_paths, submodules)
+        return posix_paths
+
+    def _get_content_info_cmd(self, ref, untracked):
+        """Internal helper of get_content_info() to determine the query
 
+        Returns
+        -------
+        tuple
+          Git command (list), additional options to report untracked
+          content (list), and a regular expression to parse output lines.
+        """
         # this will not work in direct mode, but everything else should be
         # just fine
         if not ref:
@@ -2829,11 +2936,11 @@ class GitRepo(CoreGitRepo):
             cmd = ['ls-files', '--stage', '-z']
             # untracked report mode, using labels from `git diff` option style
             if untracked == 'all':
-                cmd += ['--exclude-standard', '-o']
+                untracked_opts = ['--exclude-standard', '-o']
             elif untracked == 'normal':
-                cmd += ['--exclude-standard', '-o', '--directory', '--no-empty-directory']
+                untracked_opts = ['--exclude-standard', '-o', '--directory', '--no-empty-directory']
             elif untracked == 'no':
-                pass
+                untracked_opts = []
             else:
                 raise ValueError(
                     'unknown value for `untracked`: {}'.format(untracked))
@@ -2841,9 +2948,53 @@ class GitRepo(CoreGitRepo):
                 r'(?P<type>[0-9]+) (?P<sha>.*) (.*)\t(?P<fname>.*)$')
         else:
             cmd = ['ls-tree', ref, '-z', '-r', '--full-tree', '-l']
+            untracked_opts = []
             props_re = re.compile(
                 r'(?P<type>[0-9]+) ([a-z]*) (?P<sha>[^ ]*) [\s]*(?P<size>[0-9-]+)\t(?P<fname>.*)$')
+        return cmd, untracked_opts, props_re
 
+    def _get_content_info_cache(self, ref, posix_paths):
+        """Internal helper of get_content_info() to set up result caching
+
+        Returns
+        -------
+        None or tuple
+          None, if no cache shall be used for the query. Otherwise a tuple
+          of a ContentInfoCache instance, and name and key of the listing to
+          use.
+        """
+        if not self.config.obtain('datalad.repo.contentinfo-cache'):
+            return None
+        if posix_paths and any(
+                p.startswith(':') or any(c in p for c in '*?[')
+                for p in posix_paths):
+            # only literal paths can be matched against a cached listing,
+            # leave any pathspec magic to Git
+            return None
+        if ref:
+            if external_versions["cmd:git"] < "2.29.0":
+                # older versions of ls-tree report on paths in submodules
+                # differently, which we cannot emulate
+                return None
+            try:
+                key = self.call_git(
+                    ['rev-parse', '--verify', '--quiet',
+                     '{}^{{tree}}'.format(ref)],
+                    expect_fail=True,
+                    read_only=True).strip()
+            except CommandError:
+                # let the actual query deal with the invalid reference
+                return None
+            name = 'tree-{}'.format(key)
+        else:
+            key = get_index_key(self.dot_git)
+            if key is None:
+                return None
+            name = 'index'
+        return ContentInfoCache(self.dot_git), name, key
+
+    def _get_content_info_records(self, cmd, ref, posix_paths, props_re):
+        """Internal helper of get_content_info() to run and parse a query"""
         lgr.debug('Query repo: %s', cmd)
         try:
             stdout = self.call_git(
@@ -2856,28 +3007,23 @@ class GitRepo(CoreGitRepo):
                 raise InvalidGitReferenceError(ref)
             raise
         lgr.debug('Done query repo: %s', cmd)
+        return self._parse_content_info_lines(stdout.split('\0'), props_re)
 
-        self._get_content_info_line_helper(
-            ref,
-            info,
-            stdout.split('\0'),
-            props_re)
-
-        lgr.debug('Done %s.get_content_info(...)', self)
-        return info
+    @staticmethod
+    def _parse_content_info_lines(lines, props_re):
+        """Internal helper of get_content_info() to parse Git output
 
-    def _get_content_info_line_helper(self, ref, info, lines, props_re):
-        """Internal helper of get_content_info() to parse Git output"""
-        mode_type_map = {
-            '100644': 'file',
-            '100755': 'file',
-            '120000': 'symlink',
-            '160000': 'dataset',
-        }
+        Yields
+        ------
+        tuple
+          (mode, gitshasum, bytesize, path) for each reported item.
+          Everything but the POSIX path is None for untracked content.
+          The bytesize is only reported by ls-tree, and is '-' for
+          anything but files.
+        """
         for line in lines:
             if not line:
                 continue
-            inf = {}
             props = props_re.match(line)
             if not props:
                 # Kludge: Filter out paths starting with .git/ to work around
@@ -2889,30 +3035,73 @@ class GitRepo(CoreGitRepo):
                     lgr.debug("Filtering out .git/ file: %s", line)
                     continue
                 # not known to Git, but Git always reports POSIX
-                path = ut.PurePosixPath(line)
-                inf['gitshasum'] = None
+                yield (None, None, None, line)
             else:
-                # again Git reports always in POSIX
-                path = ut.PurePosixPath(props.group('fname'))
+                yield (props.group('type'),
+                       props.group('sha'),
+                       props.groupdict().get('size'),
+                       props.group('fname'))
 
-            # revisit the file props after this path has not been rejected
-            if props:
-                inf['gitshasum'] = props.group('sha')
-                inf['type'] = mode_type_map.get(
-                    props.group('type'), props.group('type'))
+    def _iter_content_info_records(self, cmd, ref, posix_paths, props_re):
+        """Like _get_content_info_records(), but streams Git's output"""
+        lgr.debug('Query repo: %s', cmd)
+        try:
+            yield from self._parse_content_info_lines(
+                self.call_git_items_(
+                    cmd,
+                    files=posix_paths,
+                    expect_fail=True,
+                    read_only=True,
+                    sep='\0'),
+                props_re)
+        except CommandError as exc:
+            if "fatal: Not a valid object name" in exc.stderr:
+                raise InvalidGitReferenceError(ref)
+            raise
+        lgr.debug('Done query repo: %s', cmd)
 
-                if ref and inf['type'] == 'file':
-                    inf['bytesize'] = int(props.group('size'))
+    def _get_content_info_line_helper(self, ref, info, lines, props_re):
+        """Internal helper of get_content_info() to parse Git output"""
+        self._get_content_info_from_records(
+            ref, info, self._parse_content_info_lines(lines, props_re))
+
+    def _get_content_info_from_records(self, ref, info, records,
+                                       record_cls=dict):
+        """Internal helper of get_content_info() to assemble the result"""
+        info.update(self._iter_content_info_items(ref, records, record_cls))
 
+    def _iter_content_info_items(self, ref, records, record_cls=dict):
+        """Internal helper of get_content_info() to build result items
+
+        Yields
+        ------
+        tuple
+          (path, props)
+        """
+        mode_type_map = {
+            '100644': 'file',
+            '100755': 'file',
+            '120000': 'symlink',
+            '160000': 'dataset',
+        }
+        for mode, sha, size, fname in records:
+            inf = record_cls()
             # join item path with repo path to get a universally useful
             # path representation with auto-conversion and tons of other
-            # stuff
-            path = self.pathobj.joinpath(path)
-            if 'type' not in inf:
+            # stuff. Again, Git always reports in POSIX
+            path = self.pathobj.joinpath(ut.PurePosixPath(fname))
+            if mode is None:
+                inf['gitshasum'] = None
                 # be nice and assign types for untracked content
                 inf['type'] = 'symlink' if path.is_symlink() \
                     else 'directory' if path.is_dir() else 'file'
-            info[path] = inf
+            else:
+                inf['gitshasum'] = sha
+                inf['type'] = mode_type_map.get(mode, mode)
+
+                if ref and inf['type'] == 'file':
+                    inf['bytesize'] = int(size)
+            yield path, inf
 
     def status(self, paths=None, untracked='all', eval_submodule_state='full'):
         """Simplified `git status` equivalent.
@@ -3038,11 +3227,19 @@ class GitRepo(CoreGitRepo):
             # everything we know about the worktree, including os.stat
             # for each file
             key = _get_cache_key('ci', paths, None, untracked)
+            modkey = _get_cache_key('mod', paths, None)
+            if key not in _cache and modkey not in _cache \
+                    and self._use_worktree_cache():
+                # a single `git status` call can report on both, untracked
+                # and modified content, and benefits from Git's caches
+                _cache[key], _cache[modkey] = self._get_worktree_state(
+                    paths, untracked)
             if key in _cache:
                 to_state = _cache[key]
             else:
                 to_state = self.get_content_info(
-                    paths=paths, ref=None, untracked=untracked)
+                    paths=paths, ref=None, untracked=untracked,
+                    _record_cls=PathRecord)
                 _cache[key] = to_state
             # we want Git to tell us what it considers modified and avoid
             # reimplementing logic ourselves
@@ -3070,7 +3267,8 @@ class GitRepo(CoreGitRepo):
             if key in _cache:
                 to_state = _cache[key]
             else:
-                to_state = self.get_content_info(paths=paths, ref=to)
+                to_state = self.get_content_info(
+                    paths=paths, ref=to, _record_cls=PathRecord)
                 _cache[key] = to_state
             # we do not need worktree modification detection in this case
             modified = None
@@ -3080,7 +3278,8 @@ class GitRepo(CoreGitRepo):
             from_state = _cache[key]
         else:
             if fr:
-                from_state = self.get_content_info(paths=paths, ref=fr)
+                from_state = self.get_content_info(
+                    paths=paths, ref=fr, _record_cls=PathRecord)
             else:
                 # no ref means from nothing
                 from_state = {}
@@ -3180,6 +3379,106 @@ class GitRepo(CoreGitRepo):
         else:
             return status
 
+    def _use_worktree_cache(self):
+        """Whether to query the worktree state via `git status`
+
+        If enabled via `datalad.repo.worktree-cache`, this also makes sure
+        that Git's worktree caches are configured for this repository.
+        """
+        if not self.config.obtain('datalad.repo.worktree-cache'):
+            return False
+        if not self._worktree_cache_enabled:
+            self._enable_worktree_cache()
+        return True
+
+    def _enable_worktree_cache(self):
+        """Configure Git's untracked cache and filesystem monitor
+
+        The untracked cache lets Git skip reading directories that did not
+        change since the last query. The builtin filesystem monitor daemon
+        (only available on some platforms) additionally lets Git skip
+        stat'ing unchanged tracked files. Any existing configuration of
+        either setting is left untouched.
+        """
+        if self.config.get('core.untrackedcache') is None:
+            lgr.debug('Enabling untracked cache for %s', self)
+            self.config.set('core.untrackedCache', 'true', scope='local',
+                            reload=False)
+        if self.config.get('core.fsmonitor') is None:
+            if GitRepo._fsmonitor_supported is None:
+                GitRepo._fsmonitor_supported = 'feature: fsmonitor--daemon' \
+                    in self.call_git(['version', '--build-options'],
+                                     read_only=True)
+            if GitRepo._fsmonitor_supported:
+                lgr.debug('Enabling filesystem monitor for %s', self)
+                self.config.set('core.fsmonitor', 'true', scope='local',
+                                reload=False)
+        self.config.reload()
+        self._worktree_cache_enabled = True
+
+    def _get_worktree_state(self, paths, untracked):
+        """Determine content info and modifications of the worktree
+
+        This is an alternative to a get_content_info() query and an
+        `ls-files -m -d` call for worktree modifications. Untracked
+        content and modifications are obtained from a single `git status`
+        call, which (unlike `ls-files`) makes use of Git's untracked cache
+        and filesystem monitor.
+
+        Returns
+        -------
+        (dict, set)
+          Content info like reported by get_content_info(), and the
+          absolute paths of files that are modified or deleted in the
+          worktree.
+        """
+        if paths is not None and not paths:
+            return {}, set()
+        # get the tracked content first, this also takes care of
+        # pending operations
+        tracked = self.get_content_info(
+            paths=paths, ref=None, untracked='no', _record_cls=PathRecord)
+        modified = set()
+        untracked_records = []
+        items = self.call_git_items_(
+            ['status', '--porcelain=v2', '-z',
+             # only a changed commit is a modification of a submodule
+             # at this level, like it would be reported by `ls-files -m`
+             '--ignore-submodules=dirty',
+             '--untracked-files={}'.format(untracked)],
+            files=[str(p) for p in paths] if paths is not None else None,
+            sep='\0')
+        # number of fields before the path in porcelain v2 records
+        nfields = {'1': 8, '2': 9, 'u': 10}
+        skip_next = False
+        for item in items:
+            if skip_next:
+                # original path of a rename record
+                skip_next = False
+                continue
+            if not item:
+                continue
+            kind = item[0]
+            if kind == '?':
+                untracked_records.append((None, None, None, item[2:]))
+                continue
+            if kind not in nfields:
+                continue
+            fields = item.split(' ', nfields[kind])
+            if kind == '2':
+                skip_next = True
+            # unmerged entries are always considered modified
+            if kind == 'u' or fields[1][1] != '.':
+                modified.add(self.pathobj.joinpath(
+                    ut.PurePosixPath(fields[-1])))
+        # assemble in the order `ls-files` would report: untracked
+        # content first
+        info = {}
+        self._get_content_info_from_records(
+            None, info, untracked_records, PathRecord)
+        info.update(tracked)
+        return info, modified
+
     def _diffstatus_get_state_props(self, f, from_state, to_state,
                                     against_commit,
                                     modified_in_worktree,
@@ -3765,6 +4064,30 @@ class GitRepo(CoreGitRepo):
                     logger=lgr)
 
 
+def _filter_content_info_records(records, posix_paths):
+    """Limit content info records to those matching any of the given paths
+
+    A record matches, if its path is identical to or underneath any of the
+    given (literal, POSIX) paths.
+    """
+    if not posix_paths or '.' in posix_paths:
+        return records
+    posix_paths = set(posix_paths)
+
+    def _matches(path):
+        if path in posix_paths:
+            return True
+        idx = path.rfind('/')
+        while idx > 0:
+            path = path[:idx]
+            if path in posix_paths:
+                return True
+            idx = path.rfind('/')
+        return False
+
+    return (r for r in records if _matches(r[3]))
+
+
 def _get_save_status_state(status):
     """
     Returns
@@ -14,13 +14,17 @@ __docformat__ = 'restructuredtext'
 
 import concurrent.futures
 import inspect
+import multiprocessing
 import sys
 import time
 import uuid
 
 from collections import defaultdict
 from queue import Queue, Empty
-from threading import Thread
+from threading import (
+    Lock,
+    Thread,
+)
 
 from . import ansi_colors as colors
 from ..log import log_progress
@@ -68,6 +72,16 @@ def no_subds_in_futures(futures, path, skip=tuple()):
     return all(not path_is_subpath(p, path) or p in skip for p in futures)
 
 
+def _consume_in_process(consumer, args):
+    """Run a consumer in a worker process of the 'processes' backend
+
+    Results of a generator must be collected in the worker process, since
+    only picklable values can be passed back.
+    """
+    res = consumer(args)
+    return list(res) if inspect.isgenerator(res) else [res]
+
+
 class ProducerConsumer:
     """Producer/Consumer implementation to (possibly) parallelize execution.
 
@@ -85,7 +99,7 @@ class ProducerConsumer:
     Notes
     -----
     - with jobs > 1, results are yielded as soon as available, so order
-      might not match the one provided by "producer".
+      might not match the one provided by "producer", unless `ordered=True`.
     - jobs > 1, is "effective" only for Python >= 3.8.  For older versions it
       would log a warning (upon initial encounter) if jobs > 1 is specified.
     - `producer` must produce unique entries. AssertionError might be raised if
@@ -96,6 +110,10 @@ class ProducerConsumer:
     - if producer or consumer raise an exception, we will try to "fail gracefully",
       unless subsequent Ctrl-C is pressed, we will let already running jobs to
       finish first.
+    - with `backend='processes'`, consumers run in separate processes. Hence
+      `consumer`, the items of the producer, and the results must be
+      picklable, and `consumer` cannot add to the queue of the producer.
+      Results of a consumer are yielded only once it finished.
 
     Examples
     --------
@@ -127,6 +145,8 @@ class ProducerConsumer:
                  producer_future_key=None,
                  reraise_immediately=False,
                  agg=None,
+                 ordered=False,
+                 backend='threads',
                  ):
         """
 
@@ -160,6 +180,15 @@ class ProducerConsumer:
           Should be a callable with two arguments: (item, prior total) and return a new total
           which will get assigned to .total of this object.  If not specified, .total is
           just a number of items produced by the producer.
+        ordered: bool, optional
+          If True, results are yielded in the order of the items of the producer,
+          also with jobs > 1. Results of items that complete ahead of earlier ones
+          are held back, and no more than 2 * jobs items are consumed ahead of the
+          item whose results are yielded next.
+        backend: {'threads', 'processes'}, optional
+          Whether consumers run in a pool of threads, or of processes. Processes
+          are only worth it for CPU-bound consumers, which would otherwise be
+          limited by the GIL.
         """
         self.producer = producer
         self.consumer = consumer
@@ -168,6 +197,8 @@ class ProducerConsumer:
         self.producer_future_key = producer_future_key
         self.reraise_immediately = reraise_immediately
         self.agg = agg
+        self.ordered = ordered
+        self.backend = backend
 
         self.total = None if self.agg else 0
         self._jobs = None  # actual "parallel" jobs used
@@ -180,7 +211,12 @@ class ProducerConsumer:
         self._producer_thread = None
         self._executor = None
         self._futures = {}
+        self._consumer_queue = None
+        # sequence numbers of the items consumed by processes, by future key
+        self._process_seqs = None
         self._interrupted = False
+        if backend not in ('threads', 'processes'):
+            raise ValueError("Unknown backend %r" % (backend,))
 
     @property
     def interrupted(self):
@@ -303,7 +339,19 @@ class ProducerConsumer:
 
         # To allow feeding producer queue with more entries, possibly from consumer!
         self._producer_queue = producer_queue = Queue()
-        consumer_queue = Queue()
+        # results of consumers, as (sequence number of the item, result) tuples
+        self._consumer_queue = consumer_queue = Queue()
+        ordered = self.ordered
+        processes = self.backend == 'processes'
+        self._process_seqs = {} if processes else None
+        # sequence number of the next item to be submitted, and (if ordered)
+        # of the item whose results are to be yielded next
+        next_seq = 0
+        next_yield_seq = 0
+        # results of items by their sequence numbers, which are not yet
+        # to be yielded, if ordered
+        reorder_buffer = {}
+        max_ahead = 2 * jobs
 
         def producer_worker():
             """That is the one which interrogates producer and updates .total"""
@@ -319,32 +367,66 @@ class ProducerConsumer:
             finally:
                 self._producer_finished = True
 
-        def consumer_worker(callable, *args, **kwargs):
+        def consumer_worker(seq, callable, *args, **kwargs):
             """Since jobs could return a generator and we cannot really "inspect" for that
             """
-            res = callable(*args, **kwargs)
-            if inspect.isgenerator(res):
-                lgr.debug("Got consumer worker which returned a generator %s", res)
-                didgood = False
-                for r in res:
-                    didgood = True
-                    lgr.debug("Adding %s to queue", r)
-                    consumer_queue.put(r)
-                if not didgood:
-                    lgr.error("Nothing was obtained from %s :-(", res)
-            else:
-                lgr.debug("Got straight result %s, not a generator", res)
-                consumer_queue.put(res)
+            try:
+                res = callable(*args, **kwargs)
+                if inspect.isgenerator(res):
+                    lgr.debug("Got consumer worker which returned a generator %s", res)
+                    didgood = False
+                    for r in res:
+                        didgood = True
+                        lgr.debug("Adding %s to queue", r)
+                        consumer_queue.put((seq, r))
+                    if not didgood:
+                        lgr.error("Nothing was obtained from %s :-(", res)
+                else:
+                    lgr.debug("Got straight result %s, not a generator", res)
+                    consumer_queue.put((seq, res))
+            finally:
+                # let results of subsequent items be yielded, also if
+                # this one failed
+                consumer_queue.put((seq, _ITEM_DONE))
+
+        def pop_ordered():
+            """Pop results from the reorder buffer which could be yielded now"""
+            nonlocal next_yield_seq
+            results = []
+            while next_yield_seq in reorder_buffer:
+                seq_results = reorder_buffer[next_yield_seq]
+                if seq_results and seq_results[-1] is _ITEM_DONE:
+                    results.extend(seq_results[:-1])
+                    del reorder_buffer[next_yield_seq]
+                    next_yield_seq += 1
+                else:
+                    # results of the item which is still consumed could
+                    # be yielded already
+                    results.extend(seq_results)
+                    seq_results.clear()
+                    break
+            return results
 
         self._producer_thread = Thread(target=producer_worker)
         self._producer_thread.start()
         self._futures = futures = {}
 
-        lgr.debug("Initiating ThreadPoolExecutor with %d jobs", jobs)
+        if processes:
+            lgr.debug("Initiating ProcessPoolExecutor with %d jobs", jobs)
+            # forking is not safe in a process with threads (the producer one)
+            executor = concurrent.futures.ProcessPoolExecutor(
+                jobs,
+                mp_context=multiprocessing.get_context(
+                    'forkserver'
+                    if 'forkserver' in multiprocessing.get_all_start_methods()
+                    else 'spawn'))
+        else:
+            lgr.debug("Initiating ThreadPoolExecutor with %d jobs", jobs)
+            executor = concurrent.futures.ThreadPoolExecutor(jobs)
         # we will increase sleep_time when doing nothing useful
         sleeper = Sleeper()
         interrupted_by_exception = None
-        with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        with executor:
             self._executor = executor
             # yield from the producer_queue (.total and .finished could be accessed meanwhile)
             while True:
@@ -365,12 +447,21 @@ class ProducerConsumer:
                         # Otherwise we might see "RuntimeError: generator ignored GeneratorExit"
                         # when e.g. we did continue upon interrupted_by_exception, and then
                         # no other subsequent exception was raised and we left the loop
+                        if reorder_buffer:
+                            # results of items, which were consumed while an earlier
+                            # one was canceled due to an exception
+                            for seq in sorted(reorder_buffer):
+                                for res in reorder_buffer.pop(seq):
+                                    if res is not _ITEM_DONE:
+                                        yield res
                         raise _FinalShutdown()
 
                     # important!  We are using threads, so worker threads will be sharing CPU time
                     # with this master thread. For it to become efficient, we should consume as much
                     # as possible from producer asap and push it to executor.  So drain the queue
-                    while not (producer_queue.empty() or interrupted_by_exception):
+                    while not (producer_queue.empty() or interrupted_by_exception
+                               # bound the reorder buffer
+                               or (ordered and next_seq - next_yield_seq >= max_ahead)):
                         done_useful = True
                         try:
                             job_args = producer_queue.get() # timeout=0.001)
@@ -385,18 +476,28 @@ class ProducerConsumer:
                             # args for the job
                             assert job_key not in futures
                             lgr.debug("Submitting worker future for %s", job_args)
-                            futures[job_key] = executor.submit(consumer_worker, self.consumer, job_args)
+                            if processes:
+                                self._process_seqs[job_key] = next_seq
+                                futures[job_key] = executor.submit(
+                                    _consume_in_process, self.consumer, job_args)
+                            else:
+                                futures[job_key] = executor.submit(
+                                    consumer_worker, next_seq, self.consumer, job_args)
+                            next_seq += 1
                         except Empty:
                             pass
 
                     # check active futures
                     if not consumer_queue.empty():
                         done_useful = True
-                        # ATM we do not bother of some "in order" reporting
-                        # Just report as soon as any new record arrives
-                        res = consumer_queue.get()
+                        seq, res = consumer_queue.get()
                         lgr.debug("Got %s from consumer_queue", res)
-                        yield res
+                        if ordered:
+                            reorder_buffer.setdefault(seq, []).append(res)
+                            yield from pop_ordered()
+                        elif res is not _ITEM_DONE:
+                            # Just report as soon as any new record arrives
+                            yield res
 
                     done_useful |= self._pop_done_futures(lgr)
 
@@ -458,6 +559,13 @@ class ProducerConsumer:
                 done_useful = True
                 future_ = self._futures.pop(args)
                 exception = future_.exception()
+                if self._process_seqs is not None:
+                    # results of a consumer process are only known once it is done
+                    seq = self._process_seqs.pop(args)
+                    if not exception:
+                        for res in future_.result():
+                            self._consumer_queue.put((seq, res))
+                    self._consumer_queue.put((seq, _ITEM_DONE))
                 if exception:
                     lgr.debug("Future for %r raised %s.  Re-raising to trigger graceful shutdown etc", args, exception)
                     raise exception
@@ -574,6 +682,82 @@ class ProducerConsumerProgressLog(ProducerConsumer):
                      noninteractive_level=5)
 
 
+class QueryPool:
+    """Run keyed queries ahead of time in a ProducerConsumer thread pool
+
+    Queries are executed as soon as they are scheduled, and a running query
+    can schedule follow-up queries (e.g. on subdatasets), so that a whole
+    dataset hierarchy can be processed in parallel. Results are retrieved by
+    key, in whatever order a caller needs them. This keeps the order of
+    reports deterministic, regardless of the order in which queries complete.
+
+    Each query result can be retrieved only once.
+    """
+
+    def __init__(self, query, specs, *, jobs=None):
+        """
+        Parameters
+        ----------
+        query: callable
+          Called with the QueryPool instance (to be able to schedule follow-up
+          queries), followed by the arguments of a query specification.
+        specs: iterable
+          Initial query specifications, each a tuple of a (hashable) key and
+          a tuple of positional arguments for `query`.
+        jobs: int, optional
+          Passed on to ProducerConsumer.
+        """
+        self._query = query
+        self._lock = Lock()
+        self._scheduled = set()
+        self._results = {}
+        self._pc = ProducerConsumer(
+            [(key, args, {}) for key, args in specs if self._claim(key)],
+            self._consume,
+            jobs=jobs,
+            producer_future_key=lambda spec: spec[0],
+        )
+        self._results_iter = iter(self._pc)
+
+    def _claim(self, key):
+        with self._lock:
+            if key in self._scheduled:
+                return False
+            self._scheduled.add(key)
+            return True
+
+    def _consume(self, spec):
+        key, args, kwargs = spec
+        return key, self._query(self, *args, **kwargs)
+
+    def schedule(self, key, *args, **kwargs):
+        """Schedule a query, unless one with the same key was scheduled before
+        """
+        if self._claim(key):
+            self._pc.add_to_producer_queue((key, args, kwargs))
+
+    def get(self, key, *args, **kwargs):
+        """Return the result of a query, waiting for its completion if needed
+
+        If no query with this key was scheduled yet, it is executed right
+        away with the given arguments.
+        """
+        if self._claim(key):
+            return self._query(self, *args, **kwargs)
+        while key not in self._results:
+            try:
+                k, res = next(self._results_iter)
+            except StopIteration:
+                raise RuntimeError(
+                    "No (more) result for query {!r}".format(key)) from None
+            self._results[k] = res
+        return self._results.pop(key)
+
+
+# marks the end of the results of an item in the queue of consumer results
+_ITEM_DONE = object()
+
+
 class _FinalShutdown(Exception):
     """Used internally for the final forceful shutdown if any exception did happen"""
     pass
@@ -22,37 +22,6 @@ from datalad.support.gitrepo import GitRepo
 lgr = logging.getLogger('datalad.repodates')
 
 
-def _cat_blob(repo, obj, bad_ok=False):
-    """Call `git cat-file blob OBJ`.
-
-    Parameters
-    ----------
-    repo : GitRepo
-    obj : str
-        Blob object.
-    bad_ok : boolean, optional
-        Don't fail if `obj` doesn't name a known blob.
-
-    Returns
-    -------
-    Blob's content (str) or None if `obj` is not and `bad_ok` is true.
-    """
-    if bad_ok:
-        kwds = {"expect_fail": True, "expect_stderr": True}
-    else:
-        kwds = {}
-
-    try:
-        out_cat = repo.call_git(["cat-file", "blob", obj], read_only=True,
-                                **kwds)
-    except CommandError as exc:
-        if bad_ok and "bad file" in exc.stderr:
-            out_cat = None
-        else:
-            raise
-    return out_cat
-
-
 def branch_blobs(repo, branch):
     """Get all blobs for `branch`.
 
@@ -63,8 +32,8 @@ def branch_blobs(repo, branch):
 
     Returns
     -------
-    A generator object that returns (hexsha, content, file name) for each blob
-    in `branch`.  Note: By design a blob isn't tied to a particular file name;
+    A generator object that returns (hexsha, content, file name) for each text
+    blob in `branch`.  Note: By design a blob isn't tied to a particular file name;
     the returned file name matches what is returned by 'git rev-list'.
     """
     # Note: This might be nicer with rev-list's --filter and
@@ -80,15 +49,22 @@ def branch_blobs(repo, branch):
     log_progress(lgr.info, "repodates_branch_blobs",
                  "Checking %d objects", num_objects,
                  label="Checking objects", total=num_objects, unit=" objects")
-    # This is inefficient.  It makes a git call for each object, some of which
-    # aren't even blobs.  We could instead use 'git cat-file --batch'.
-    for obj, fname in blob_trees:
+    # trees are reported too, sort them out before reading any content.
+    # Both steps are served by long-running `git cat-file` processes.
+    fnames = dict(blob_trees)
+    blobs = (
+        rec['object']
+        for rec in repo.check_objects_(obj for obj, _ in blob_trees)
+        if rec['objecttype'] == 'blob'
+    )
+    for rec in repo.cat_objects_(blobs):
+        obj = rec['object']
         log_progress(lgr.info, "repodates_branch_blobs",
                      "Checking %s", obj,
                      increment=True, update=1)
-        content = _cat_blob(repo, obj, bad_ok=True)
-        if content:
-            yield obj, content, fname
+        # binary blobs are reported as bytes, they cannot hold dates
+        if rec['content'] and isinstance(rec['content'], str):
+            yield obj, rec['content'], fnames[obj]
     log_progress(lgr.info, "repodates_branch_blobs",
                  "Finished checking %d objects", num_objects)
 
@@ -103,8 +79,8 @@ def branch_blobs_in_tree(repo, branch):
 
     Returns
     -------
-    A generator object that returns (hexsha, content, file name) for each blob.
-    Note: If there are multiple files in the tree that point to the blob, only
+    A generator object that returns (hexsha, content, file name) for each text
+    blob.  Note: If there are multiple files in the tree that point to the blob, only
     the first file name that is reported by 'git ls-tree' is used (i.e., one
     entry per blob is yielded).
     """
@@ -118,16 +94,21 @@ def branch_blobs_in_tree(repo, branch):
                      "Checking %d objects in git-annex tree", num_lines,
                      label="Checking objects", total=num_lines,
                      unit=" objects")
+        fnames = {}
         for line in lines:
             if not line:
                 continue
             _, obj_type, obj, fname = line.split()
+            if obj_type == "blob" and obj not in seen_blobs:
+                fnames[obj] = fname
+            seen_blobs.add(obj)
+        for rec in repo.cat_objects_(fnames):
+            obj = rec['object']
             log_progress(lgr.info, "repodates_blobs_in_tree",
                          "Checking %s", obj,
                          increment=True, update=1)
-            if obj_type == "blob" and obj not in seen_blobs:
-                yield obj, _cat_blob(repo, obj), fname
-            seen_blobs.add(obj)
+            if isinstance(rec['content'], str):
+                yield obj, rec['content'], fnames[obj]
         log_progress(lgr.info, "repodates_blobs_in_tree",
                      "Finished checking %d blobs", num_lines)
 
@@ -826,14 +826,20 @@ class MultiplexSSHManager(BaseSSHManager):
 
 
 # retain backward compat with 0.13.4 and earlier
-# should be ok since cfg already defined by the time this one is imported
-from .. import cfg
-if cfg.obtain('datalad.ssh.multiplex-connections'):
-    SSHManager = MultiplexSSHManager
-    SSHConnection = MultiplexSSHConnection
-else:
-    SSHManager = NoMultiplexSSHManager
-    SSHConnection = NoMultiplexSSHConnection
+def __getattr__(name):
+    # the implementations to use are chosen on first use, to not load the
+    # configuration when this module is merely imported
+    if name not in ('SSHManager', 'SSHConnection'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from .. import cfg
+    if cfg.obtain('datalad.ssh.multiplex-connections'):
+        impl = dict(SSHManager=MultiplexSSHManager,
+                    SSHConnection=MultiplexSSHConnection)
+    else:
+        impl = dict(SSHManager=NoMultiplexSSHManager,
+                    SSHConnection=NoMultiplexSSHConnection)
+    globals().update(impl)
+    return impl[name]
 
 
 def _quote_filename_for_scp(name):
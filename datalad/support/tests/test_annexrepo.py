@@ -16,6 +16,7 @@ import logging
 import os
 import re
 import sys
+import time
 import unittest.mock
 from functools import partial
 from glob import glob
@@ -56,6 +57,7 @@ from datalad.support import path as op
 from datalad.support.annexrepo import (
     AnnexJsonProtocol,
     AnnexRepo,
+    BatchedAnnexes,
     GeneratorAnnexJsonNoStderrProtocol,
     GeneratorAnnexJsonProtocol,
 )
@@ -87,6 +89,7 @@ from datalad.tests.utils_pytest import (
     assert_equal,
     assert_false,
     assert_in,
+    assert_is,
     assert_is_instance,
     assert_not_equal,
     assert_not_in,
@@ -1116,6 +1119,37 @@ def test_AnnexRepo_addurl_to_file_batched(sitepath=None, siteurl=None, dst=None)
     # TODO: verify that file is added with that backend and that we got a new batched process
 
 
+@with_tempfile(mkdir=True)
+def test_BatchedAnnexes_bounded(path=None):
+    ar = AnnexRepo(path, create=True)
+    batched = BatchedAnnexes(
+        git_options=ar._ANNEX_GIT_COMMON_OPTIONS, max_procs=2)
+    key = 'MD5E-s3--acbd18db4cc2f85cedef654fccc4a4d8'
+    examinekey = batched.get('examinekey', path=ar.path)
+    eq_(examinekey(key), key)
+    contentlocation = batched.get('contentlocation', path=ar.path)
+    eq_(contentlocation(key), '')
+    eq_(len(batched), 2)
+    # a third process replaces the least recently used one
+    eq_(examinekey(key), key)
+    lookupkey = batched.get('lookupkey', path=ar.path)
+    eq_(lookupkey(key), '')
+    # closed processes stay registered
+    eq_(len(batched), 3)
+    assert_is(contentlocation.runner, None)
+    # a closed process is restarted on demand
+    assert_is(batched.get('contentlocation', path=ar.path), contentlocation)
+    eq_(contentlocation([key, key]), ['', ''])
+    assert_is(examinekey.runner, None)
+
+    # idle processes are closed on the next request of any process
+    batched.max_idle = 0.0001
+    time.sleep(0.01)
+    assert_is(batched.get('lookupkey', path=ar.path), lookupkey)
+    assert_is(contentlocation.runner, None)
+    batched.clear()
+
+
 @with_tree(tree={"foo": "foo content"})
 @serve_path_via_http()
 @with_tree(tree={"bar": "bar content"})
@@ -0,0 +1,66 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+
+import pickle
+from copy import deepcopy
+
+from datalad.support.collections import PathRecord
+from datalad.tests.utils_pytest import (
+    assert_equal,
+    assert_false,
+    assert_in,
+    assert_not_in,
+    assert_raises,
+    eq_,
+)
+
+
+def test_PathRecord():
+    r = PathRecord(type='file', gitshasum='abc')
+    assert_false(PathRecord())
+    eq_(r, dict(type='file', gitshasum='abc'))
+    eq_(dict(type='file', gitshasum='abc'), r)
+    eq_(len(r), 2)
+    assert_in('type', r)
+    assert_not_in('state', r)
+    eq_(r.get('state'), None)
+    eq_(r.get('state', 'none'), 'none')
+    assert_raises(KeyError, r.__getitem__, 'state')
+    assert_raises(KeyError, r.__delitem__, 'state')
+
+    # arbitrary properties are supported too
+    r['state'] = 'clean'
+    r['status'] = 'error'
+    eq_(r, dict(type='file', gitshasum='abc', state='clean', status='error'))
+    eq_(r['status'], 'error')
+    eq_(r.get('status'), 'error')
+    del r['status']
+    assert_not_in('status', r)
+    assert_raises(KeyError, r.__delitem__, 'status')
+    # None is a value like any other
+    r['bytesize'] = None
+    assert_in('bytesize', r)
+    del r['gitshasum']
+    # the fixed properties come first
+    eq_(list(r), ['type', 'bytesize', 'state'])
+
+    # copies are independent
+    c = r.copy()
+    c['type'] = 'symlink'
+    eq_(r['type'], 'file')
+
+    r.update(path='some', key='MD5E-s1--abc')
+    for dup in (pickle.loads(pickle.dumps(r)), deepcopy(r)):
+        assert_equal(type(dup), PathRecord)
+        eq_(dup, r)
+    # conversion to a plain dict, e.g. for result records
+    d = dict(r, action='status')
+    eq_(type(d), dict)
+    eq_(d['key'], 'MD5E-s1--abc')
+    eq_({**r}, dict(r))
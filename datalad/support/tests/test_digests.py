@@ -48,3 +48,19 @@ def test_digester(path=None):
             'sha256': '80028815b3557e30d7cbef1d8dbc30af0ec0858eff34b960d2839fd88ad08871',
             'sha512': '684d23393eee455f44c13ab00d062980937a5d040259d69c6b291c983bf635e1d405ff1dc2763e433d69b8f299b3f4da500663b813ce176a43e29ffcc31b0159'
         })
+
+
+@with_tree(tree={'sample.txt': '123',
+                 'empty': '',
+                 'long.txt': '123abz\n'*1000000})
+def test_digester_threaded(path=None):
+    files = [opj(path, f) for f in ('sample.txt', 'empty', 'long.txt')]
+    expected = [Digester(threaded=False)(f) for f in files]
+    # small chunks, such that the buffers are reused many times
+    digester = Digester(threaded=True)
+    digester.THREADED_BLOCKSIZE = 1000
+    assert_equal([digester(f) for f in files], expected)
+    # automatic mode
+    digester = Digester()
+    digester.THREADED_MIN_SIZE = 1000
+    assert_equal(digester(files[2]), expected[2])
@@ -8,11 +8,14 @@
 """Test file info getters"""
 
 
+import os
 import os.path as op
 from pathlib import Path
+from unittest.mock import patch
 
 import datalad.utils as ut
 from datalad.distribution.dataset import Dataset
+from datalad.support.collections import PathRecord
 from datalad.support.exceptions import NoSuchPathError
 from datalad.support.gitrepo import GitRepo
 from datalad.tests.utils_pytest import (
@@ -22,7 +25,9 @@ from datalad.tests.utils_pytest import (
     assert_in,
     assert_not_in,
     assert_raises,
+    assert_true,
     assert_repo_status,
+    eq_,
     get_annexstatus,
     get_convoluted_situation,
     known_failure_githubci_win,
@@ -169,6 +174,30 @@ def test_compare_content_info(path=None):
     )
 
 
+@with_tempfile
+def test_diffstatus_records(path=None):
+    ds = Dataset(path).create(annex=False)
+    (ds.pathobj / 'file').write_text('content')
+    ds.save()
+    (ds.pathobj / 'file').write_text('modified')
+    (ds.pathobj / 'untracked').write_text('new')
+    cache = {}
+    status = ds.repo.diffstatus('HEAD', None, _cache=cache)
+    eq_(status[ds.pathobj / 'file']['state'], 'modified')
+    eq_(status[ds.pathobj / 'untracked']['state'], 'untracked')
+    # the states kept in the cache are compact records ...
+    states = [v for v in cache.values() if isinstance(v, dict)]
+    assert_true(states)
+    for state in states:
+        for rec in state.values():
+            assert_equal(type(rec), PathRecord)
+    # ... but nothing but plain dicts is reported
+    for rec in status.values():
+        assert_equal(type(rec), dict)
+    for rec in ds.repo.get_content_info(ref='HEAD').values():
+        assert_equal(type(rec), dict)
+
+
 @with_tempfile
 def test_subds_path(path=None):
     # a dataset with a subdataset with a file, all neatly tracked
@@ -386,3 +415,115 @@ def test_get_file_annexinfo(path=None):
         ds.pathobj / 'dir1' / 'dropped', eval_availability=True)
     assert_equal(props['has_content'], False)
     assert_not_in('objloc', props)
+
+
+@with_tempfile
+def test_get_content_info_cache(path=None):
+    ds = get_convoluted_situation(path, GitRepo)
+    repo = ds.repo
+
+    queries = [
+        dict(),
+        dict(untracked='normal'),
+        dict(untracked='no'),
+        dict(paths=['subdir']),
+        dict(paths=['file_clean', op.join('subdir', 'file_added')]),
+        dict(paths=[op.join('subds_modified', 'subds_lvl1_modified')]),
+        dict(ref='HEAD'),
+        dict(ref='HEAD', paths=['subdir']),
+    ]
+    uncached = [repo.get_content_info(**q) for q in queries]
+
+    repo.config.set('datalad.repo.contentinfo-cache', 'true',
+                    scope='local')
+    # two rounds: populate the cache, and read from it
+    for i in range(2):
+        for q, res in zip(queries, uncached):
+            cached = repo.get_content_info(**q)
+            assert_dict_equal(cached, res)
+            # identical order of reports
+            assert_equal(list(cached), list(res))
+    cachedir = repo.dot_git / 'datalad' / 'cache' / 'contentinfo'
+    assert_true((cachedir / 'index').exists())
+    assert_true(any(cachedir.glob('tree-*')))
+
+    # any change to the index invalidates the cache
+    newfile = repo.pathobj / 'file_untracked'
+    repo.add(str(newfile), git=True)
+    res = repo.get_content_info(paths=['file_untracked'])
+    assert_true(res[newfile]['gitshasum'])
+    # while untracked content is reported regardless of the cache
+    (repo.pathobj / 'brandnew').write_text('new')
+    assert_in(repo.pathobj / 'brandnew', repo.get_content_info())
+
+
+@with_tempfile
+def test_status_worktree_cache(path=None):
+    ds = get_convoluted_situation(path)
+    repo = ds.repo
+
+    queries = [
+        dict(untracked=u, eval_submodule_state=e)
+        for u in ('no', 'normal', 'all')
+        for e in ('full', 'commit', 'no')
+    ] + [
+        dict(paths=['subdir']),
+        dict(paths=['file_modified', 'subds_modified']),
+    ]
+    plain = [repo.status(**q) for q in queries]
+
+    # enable for the entire hierarchy
+    with patch.dict(os.environ, {'DATALAD_REPO_WORKTREE__CACHE': '1'}):
+        repo.config.reload(force=True)
+        for q, res in zip(queries, plain):
+            fast = repo.status(**q)
+            assert_dict_equal(fast, res)
+            assert_equal(list(fast), list(res))
+    # Git's untracked cache got enabled, in subdatasets too
+    for r in (repo,
+              Dataset(repo.pathobj / 'subds_modified').repo):
+        assert_equal(
+            r.call_git(['config', '--local', 'core.untrackedCache']).strip(),
+            'true')
+
+
+@with_tree(tree={
+    'file': 'content',
+    'dir': {'annexed': 'annexed', 'sub': {'deep': 'deep'}},
+    'ü-ä': 'unicode',
+    'dir.txt': 'sorts before dir/ bytewise',
+})
+def test_get_content_info_generators(path=None):
+    ds = Dataset(path).create(force=True)
+    ds.save()
+    (ds.pathobj / 'untracked').write_text('untracked')
+    ds.drop(ds.pathobj / 'file', reckless='kill')
+    repo = ds.repo
+
+    for kwargs in (
+            {},
+            dict(ref='HEAD'),
+            dict(untracked='no'),
+            dict(paths=['dir', 'file']),
+            # overlapping and duplicate paths
+            dict(paths=['dir', op.join('dir', 'sub'), 'file', 'file']),
+            dict(paths=['dir'], ref='HEAD'),
+            # not in index order
+            dict(paths=['file', 'dir']),
+            dict(paths=['file', 'dir'], ref='HEAD'),
+            dict(paths=[]),
+    ):
+        assert_equal(
+            dict(repo.get_content_info_(**kwargs)),
+            repo.get_content_info(**kwargs))
+        for eval_availability in (False, True):
+            annexinfo = dict(repo.get_content_annexinfo_(
+                eval_availability=eval_availability, **kwargs))
+            assert_equal(
+                annexinfo,
+                repo.get_content_annexinfo(
+                    eval_availability=eval_availability, **kwargs))
+    annexinfo = dict(repo.get_content_annexinfo_(eval_availability=True))
+    assert_false(annexinfo[ds.pathobj / 'file']['has_content'])
+    assert_true(annexinfo[ds.pathobj / 'dir' / 'annexed']['has_content'])
+    assert_not_in('key', annexinfo[ds.pathobj / 'untracked'])
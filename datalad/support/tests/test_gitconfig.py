@@ -0,0 +1,129 @@
+# emacs: -*- mode: python; py-indent-offset: 4; tab-width: 4; indent-tabs-mode: nil -*-
+# ex: set sts=4 ts=4 sw=4 et:
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+#
+#   See COPYING file distributed along with the datalad package for the
+#   copyright and license terms.
+#
+# ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
+
+from pathlib import Path
+from unittest.mock import patch
+
+from datalad.cmd import (
+    StdOutErrCapture,
+    WitlessRunner,
+)
+from datalad.config import parse_gitconfig_dump
+from datalad.tests.utils_pytest import (
+    assert_equal,
+    assert_not_in,
+    assert_raises,
+    with_tree,
+)
+
+from ..gitconfig import (
+    GitConfigReader,
+    UnsupportedGitConfig,
+    _query_system_gitconfig,
+    _wildmatch_to_regex,
+    parse_gitconfig,
+)
+
+_tricky_config = """\
+[Section "Sub\\"Sect ion"]
+\tKey = " spaced  value "  ; comment
+\tmulti = 1
+\tmulti = 2
+\tflag
+\tempty =
+\tcont = line1 \\
+line2
+\tesc = a\\tb\\\\c\\"d
+# comment
+[Old.Style]
+\tx = y # trailing
+[core] bare = false
+[include]
+\tpath = inc/included
+[includeIf "gitdir:/no/such/"]
+\tpath = inc/conditional
+[includeIf "gitdir:**/"]
+\tpath = inc/conditional
+"""
+
+
+@with_tree(tree={
+    'config': _tricky_config,
+    'inc': {
+        'included': '[inc]\n\tval = included\n',
+        'conditional': '[inc]\n\tval = conditional\n',
+    },
+})
+def test_GitConfigReader(path=None):
+    path = Path(path)
+    out = WitlessRunner(cwd=path).run(
+        ['git', 'config', '-z', '-l', '--show-origin',
+         '--file', str(path / 'config')],
+        protocol=StdOutErrCapture)['stdout']
+    git_cfg, git_files = parse_gitconfig_dump(out, cwd=path)
+
+    # like git-config, no includes for a particular file
+    reader = GitConfigReader(includes=False)
+    reader.read_file(path / 'config')
+    assert_equal(reader.cfg, git_cfg)
+    assert_equal(list(reader.cfg), list(git_cfg))
+    assert_equal(reader.files, git_files)
+    assert_equal(reader.cfg['section.Sub"Sect ion.key'], ' spaced  value ')
+    assert_equal(reader.cfg['section.Sub"Sect ion.multi'], ('1', '2'))
+    assert_equal(reader.cfg['section.Sub"Sect ion.flag'], None)
+    assert_equal(reader.cfg['old.style.x'], 'y')
+    assert_not_in('inc.val', reader.cfg)
+
+    # no repository -> no conditional includes
+    reader = GitConfigReader()
+    reader.read_file(path / 'config')
+    assert_equal(reader.cfg['inc.val'], 'included')
+    assert_equal(len(reader.files), 2)
+
+    # any location matches the conditional include
+    reader = GitConfigReader(git_dir=path)
+    reader.read_file(path / 'config')
+    assert_equal(reader.cfg['inc.val'], ('included', 'conditional'))
+    assert_equal(len(reader.files), 3)
+
+
+def test_parse_gitconfig_errors():
+    for invalid in ('key = outside', '[sec]\nkey = "unterminated',
+                    '[sec "sub"\nkey', '[sec]\n_key = v',
+                    '[sec]\nkey = bad\\escape', '[sec]\nüx = 1\n'):
+        assert_raises(UnsupportedGitConfig, parse_gitconfig, invalid)
+
+
+@with_tree(tree={'system': '[sys]\n\tval = 1\n', 'empty': ''})
+def test_query_system_gitconfig(path=None):
+    path = Path(path)
+    for fname, expected in (('system', path / 'system'),
+                            ('empty', None),
+                            ('missing', path / 'missing')):
+        with patch.dict('os.environ',
+                        {'GIT_CONFIG_SYSTEM': str(path / fname)}):
+            assert_equal(_query_system_gitconfig(), expected)
+
+
+def test_wildmatch():
+    for pattern, path, match in (
+            ('**/r/**', '/tmp/r/.git', True),
+            ('**/r/**', '/tmp/rr/.git', False),
+            ('/tmp/*/.git', '/tmp/r/.git', True),
+            ('/tmp/*/.git', '/tmp/r/s/.git', False),
+            ('/tmp/**/.git', '/tmp/r/s/.git', True),
+            ('/tmp/**/.git', '/tmp/.git', True),
+            ('ma?n', 'main', True),
+            ('[!m]ain', 'main', False),
+    ):
+        assert_equal(
+            bool(_wildmatch_to_regex(pattern, False).match(path)), match,
+            msg='{} vs {}'.format(pattern, path))
+    assert_equal(
+        bool(_wildmatch_to_regex('/TMP/**', True).match('/tmp/r')), True)
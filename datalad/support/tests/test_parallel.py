@@ -25,6 +25,7 @@ from datalad.support.exceptions import IncompleteResultsError
 from datalad.support.parallel import (
     ProducerConsumer,
     ProducerConsumerProgressLog,
+    QueryPool,
     no_parentds_in_futures,
 )
 from datalad.tests.utils_pytest import (
@@ -311,6 +312,75 @@ def test_parallel_flyweights(topd=None):
         assert len(instances) == 1
 
 
+def test_QueryPool():
+    # a "tree" query: every node schedules its children
+    def query(pool, node, depth):
+        # later results are faster to complete
+        sleep(0.001 * (3 - depth))
+        children = [node + (i,) for i in range(3)] if depth < 3 else []
+        for c in children:
+            pool.schedule(c, c, depth + 1)
+        return node, children
+
+    def walk(pool, node, depth):
+        res, children = pool.get(node, node, depth)
+        yield res
+        for c in children:
+            yield from walk(pool, c, depth + 1)
+
+    pool = QueryPool(query, [((0,), ((0,), 0))], jobs=5)
+    res = list(walk(pool, (0,), 0))
+    # every node once, in traversal order
+    assert_equal(len(res), 1 + 3 + 9 + 27)
+    assert_equal(res, sorted(res))
+    # each result can only be retrieved once
+    assert_raises(RuntimeError, pool.get, (0,), (0,), 0)
+    # a not yet scheduled query is executed right away
+    assert_equal(pool.get('other', ('other',), 3), (('other',), []))
+
+
+def test_ProducerConsumer_ordered():
+    def consumer(i):
+        # earlier items take longer to consume
+        sleep(0.001 * (10 - i))
+        yield i
+        yield -i
+
+    for jobs in 1, 5:
+        res = list(ProducerConsumer(range(10), consumer, jobs=jobs, ordered=True))
+        assert_equal(res, [r for i in range(10) for r in (i, -i)])
+
+    def failing_consumer(i):
+        if i == 3:
+            raise ValueError(i)
+        return i
+
+    # results of all other items are still provided before the exception
+    results = []
+    with pytest.raises(ValueError):
+        for r in ProducerConsumer(range(6), failing_consumer, jobs=2, ordered=True):
+            results.append(r)
+    assert_equal(sorted(results)[:3], [0, 1, 2])
+    assert 3 not in results
+
+
+def _square_results(i):
+    # module level, so it can be pickled for a process pool
+    yield i, i ** 2
+    yield i, -i ** 2
+
+
+def test_ProducerConsumer_processes():
+    assert_raises(ValueError, ProducerConsumer, range(3), abs, backend='bogus')
+    res = list(ProducerConsumer(range(5), _square_results, jobs=2,
+                                backend='processes', ordered=True))
+    assert_equal(res, [r for i in range(5) for r in ((i, i ** 2), (i, -i ** 2))])
+    # a function returning a result, not a generator
+    assert_equal(
+        sorted(ProducerConsumer([-1, -2, 3], abs, jobs=2, backend='processes')),
+        [1, 2, 3])
+
+
 if __name__ == '__main__':
     test_ProducerConsumer()
     # test_creatsubdatasets()
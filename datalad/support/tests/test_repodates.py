@@ -7,11 +7,16 @@
 #
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 
+import os.path as op
 from unittest.mock import patch
 
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.gitrepo import GitRepo
-from datalad.support.repodates import check_dates
+from datalad.support.repodates import (
+    branch_blobs,
+    branch_blobs_in_tree,
+    check_dates,
+)
 from datalad.tests.utils_pytest import (
     assert_equal,
     assert_false,
@@ -31,6 +36,20 @@ def test_check_dates_empty_repo(path=None):
     assert_false(check_dates(GitRepo(path, create=True))["objects"])
 
 
+@with_tempfile(mkdir=True)
+def test_branch_blobs_binary(path=None):
+    repo = GitRepo(path, create=True)
+    with open(op.join(path, "binary"), "wb") as f:
+        f.write(b"\xff\xfe\x00binary")
+    with open(op.join(path, "text"), "w") as f:
+        f.write("text")
+    repo.add(["binary", "text"])
+    repo.commit("add")
+    for blob_fn in (branch_blobs, branch_blobs_in_tree):
+        eq_([(content, fname) for _, content, fname in blob_fn(repo, "HEAD")],
+            [("text", "text")])
+
+
 @with_tree(tree={"foo": "foo content",
                  "bar": "bar content"})
 def test_check_dates(path=None):
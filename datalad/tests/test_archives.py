@@ -275,3 +275,149 @@ def test_get_leading_directory(return_value, target_value, kwargs):
     ea = ExtractedArchive('/some/bogus', '/some/bogus')
     with patch.object(ExtractedArchive, 'get_extracted_files', return_value=return_value):
         eq_(ea.get_leading_directory(**kwargs), target_value)
+
+
+@with_tempfile(mkdir=True)
+def check_extract_member(ext, path=None):
+    import tarfile
+    import zipfile
+    content = {
+        'd/f1': b'f1 load',
+        'd/sub/f2': b'f2 load' * 1000,
+        fn_in_archive_obscure: b'obscure load',
+    }
+    archive = op.join(path, 'archive' + ext)
+    if ext == '.zip':
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name, load in content.items():
+                zf.writestr(name, load)
+    else:
+        with tarfile.open(archive, 'w:' + ext[5:]) as tar:
+            for name, load in content.items():
+                src = op.join(path, 'src')
+                with open(src, 'wb') as f:
+                    f.write(load)
+                tar.add(src, arcname='./' + name)
+            os.symlink('f1', op.join(path, 'link'))
+            tar.add(op.join(path, 'link'), arcname='d/link')
+
+    earchive = ExtractedArchive(archive)
+    dst = op.join(path, 'dst')
+    for name, load in content.items():
+        # each instance has its own budget for reading from compressed
+        # tarballs
+        assert_true(ExtractedArchive(archive, earchive.path).extract_member(
+            name, dst))
+        with open(dst, 'rb') as f:
+            eq_(f.read(), load)
+    if ext not in ('.tar', '.zip'):
+        # decompressing the tarball up to a member over and over again
+        # must not cost more than extracting it once
+        assert_true(earchive.extract_member('d/sub/f2', dst))
+        assert_false(earchive.extract_member('d/sub/f2', dst))
+    else:
+        assert_true(earchive.extract_member('d/sub/f2', dst))
+        assert_true(earchive.extract_member('d/sub/f2', dst))
+    # unknown members and links are left to the full extraction
+    assert_false(earchive.extract_member('d/missing', dst))
+    assert_false(earchive.extract_member('d/link', dst))
+    # nothing was extracted into the cache
+    assert_false(earchive.is_extracted)
+    assert_false(op.exists(earchive.path))
+
+    if ext == '.zip':
+        assert_false(op.exists(earchive.members_index_path))
+        return
+    # the index is reused by another instance, without reading the tarball
+    # up front
+    assert_true(op.exists(earchive.members_index_path))
+    earchive2 = ExtractedArchive(archive, earchive.path)
+    with patch('tarfile.open', side_effect=AssertionError):
+        assert_true(earchive2.extract_member('d/f1', dst))
+    ok_file_has_content(dst, 'f1 load')
+    earchive.clean()
+    assert_false(op.exists(earchive.members_index_path))
+
+
+@pytest.mark.parametrize("ext", ['.tar', '.tar.gz', '.tar.bz2', '.tar.xz',
+                                 '.zip'])
+def test_ExtractedArchive_extract_member(ext):
+    check_extract_member(ext)
+
+
+@with_tempfile(mkdir=True)
+def test_ExtractedArchive_extract_member_unsupported_zip(path=None):
+    import zipfile
+    archive = op.join(path, 'archive.zip')
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+        zf.writestr('compressed', b'load')
+        zf.writestr('encrypted', b'load')
+    with open(archive, 'rb') as f:
+        data = bytearray(f.read())
+    # local file headers and central directory entries of the members, in
+    # order, with the offsets of the flags and the compression method
+    headers = [(i, 6) for i in _find_all(data, b'PK\x03\x04')] \
+        + [(i, 8) for i in _find_all(data, b'PK\x01\x02')]
+    for n, (i, flags_offset) in enumerate(headers):
+        if n % 2:
+            # the encryption flag
+            data[i + flags_offset] |= 1
+        else:
+            # deflate64, which is not supported by zipfile
+            data[i + flags_offset + 2] = 9
+    with open(archive, 'wb') as f:
+        f.write(data)
+
+    earchive = ExtractedArchive(archive)
+    dst = op.join(path, 'dst')
+    for name in ('compressed', 'encrypted'):
+        with open(dst, 'w') as f:
+            f.write('leftover')
+        # left to the full extraction
+        assert_false(earchive.extract_member(name, dst))
+        assert_false(op.lexists(dst))
+
+
+def _find_all(data, sub):
+    i = data.find(sub)
+    while i >= 0:
+        yield i
+        i = data.find(sub, i + 1)
+
+
+@with_tempfile(mkdir=True)
+def test_ArchivesCache_max_size(path=None):
+    import tarfile
+    archives = []
+    for i in range(3):
+        src = op.join(path, 'f%d' % i)
+        with open(src, 'wb') as f:
+            f.write(b'x' * 1000)
+        archive = op.join(path, 'a%d.tar' % i)
+        with tarfile.open(archive, 'w') as tar:
+            tar.add(src, arcname='f%d' % i)
+        archives.append(archive)
+
+    toppath = op.join(path, 'repo')
+    cache = ArchivesCache(toppath, persistent=True, max_size=2500)
+    # all archives were just used, do not wait for them to be unused
+    cache._usage.grace_period = 0
+    earchives = [cache[a] for a in archives]
+    earchives[0].get_extracted_file('f0')
+    earchives[1].get_extracted_file('f1')
+    # a use makes an archive the most recently used one
+    earchives[0].get_extracted_file('f0')
+    earchives[2].get_extracted_file('f2')
+    assert_true(earchives[0].is_extracted)
+    assert_false(earchives[1].is_extracted)
+    assert_false(op.exists(earchives[1].path))
+    assert_true(earchives[2].is_extracted)
+
+    # the usage is shared with other instances of the cache
+    cache2 = ArchivesCache(toppath, persistent=True, max_size=1500)
+    cache2._usage.grace_period = 0
+    cache2[archives[1]].get_extracted_file('f1')
+    assert_true(cache2[archives[1]].is_extracted)
+    assert_false(earchives[0].is_extracted)
+    assert_false(earchives[2].is_extracted)
+    cache.clean(force=True)
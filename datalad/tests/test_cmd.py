@@ -11,6 +11,7 @@
 import sys
 import unittest.mock
 from subprocess import TimeoutExpired
+from threading import Thread
 
 import pytest
 
@@ -212,3 +213,54 @@ print(a*b)
     assert bc.return_code == 1
     assert bc.last_request is None
     bc.close(return_stderr=False)
+
+
+def test_pipelined_requests():
+    bc = BatchedCommand(
+        cmd=py2cmd(
+            "import sys\n"
+            "for line in sys.stdin:\n"
+            "    print(line.strip().upper(), flush=True)\n"))
+    requests = [f"line-{i}" for i in range(200)]
+    with unittest.mock.patch.object(
+            bc, "_receive_response",
+            wraps=bc._receive_response) as receive_mock:
+        assert_equal(bc(requests), [r.upper() for r in requests])
+        assert_equal(receive_mock.call_count, 200)
+    bc.close(return_stderr=False)
+
+
+def test_pipelined_requests_restart():
+    # Expect that requests without a response are sent to a restarted
+    # process, if the process exits in the middle of a pipelined call.
+    bc = BatchedCommand(
+        cmd=py2cmd(
+            "import os\n"
+            "import sys\n"
+            "print(os.getpid(), sys.stdin.readline().strip(), flush=True)\n"))
+    lines = [f"line-{i}" for i in range(4)]
+    responses = [r.split() for r in bc(lines)]
+    assert_equal([r[1] for r in responses], lines)
+    assert_equal(len(set(r[0] for r in responses)), 4)
+    bc.close(return_stderr=False)
+
+
+def test_concurrent_requests():
+    bc = BatchedCommand(
+        cmd=py2cmd(
+            "import sys\n"
+            "for line in sys.stdin:\n"
+            "    print(line.strip().upper(), flush=True)\n"))
+    results = {}
+
+    def _request(i):
+        results[i] = bc([f"thread-{i}-{j}" for j in range(50)])
+
+    threads = [Thread(target=_request, args=(i,)) for i in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for i in range(5):
+        assert_equal(results[i], [f"THREAD-{i}-{j}" for j in range(50)])
+    bc.close(return_stderr=False)
@@ -800,3 +800,55 @@ def test_where_to_scope():
     assert_equal(f(scope='dataset'), 'dataset')
     # we do not allow both
     assert_raises(ValueError, f, where='local', scope='local')
+
+
+@with_tempfile()
+@with_tempfile()
+def test_native_gitconfig(path=None, bare=None):
+    ds = Dataset(path).create()
+    ds.config.set('sec.sub.key', 'some', scope='local')
+    ds.config.add('sec.sub.key', 'more', scope='local')
+    ds.config.set('sec.sub.committed', 'yes', scope='branch')
+    ds.save()
+    AnnexRepo.clone(path, bare, clone_options=['--bare'])
+    reference = {}
+    for p in (path, bare):
+        reference[p] = ConfigManager(dataset=GitRepo(p))
+
+    with patch.dict(os.environ, {'DATALAD_RUNTIME_NATIVE__GITCONFIG': '1'}):
+        dl_cfg.reload(force=True)
+        try:
+            for p in (path, bare):
+                # no git-config process is needed
+                with patch.object(ConfigManager, '_run',
+                                  side_effect=RuntimeError):
+                    cfg = ConfigManager(dataset=GitRepo(p))
+                for store in ('git', 'branch'):
+                    assert_equal(cfg._stores[store]['cfg'],
+                                 reference[p]._stores[store]['cfg'])
+                    assert_equal(cfg._stores[store]['files'],
+                                 reference[p]._stores[store]['files'])
+                assert_equal(cfg.get('sec.sub.committed'), 'yes')
+            # modifications are detected
+            cfg = ConfigManager(dataset=ds)
+            assert_equal(cfg.get('sec.sub.key', get_all=True), ('some', 'more'))
+            ds.repo.call_git(['config', '--local', 'sec.sub.new', 'val'])
+            cfg.reload()
+            assert_equal(cfg.get('sec.sub.new'), 'val')
+            # command line config
+            with patch.dict(os.environ, {'GIT_CONFIG_COUNT': '1',
+                                         'GIT_CONFIG_KEY_0': 'Sec.Sub.Env',
+                                         'GIT_CONFIG_VALUE_0': 'env'}):
+                cfg.reload(force=True)
+                assert_equal(cfg.get('sec.Sub.env'), 'env')
+            # unsupported setups fall back on git-config
+            ds.repo.call_git([
+                'config', '--local',
+                'includeIf.hasconfig:remote.*.url:x.path', 'other'])
+            with patch.object(ConfigManager, '_run',
+                              wraps=cfg._run) as run:
+                cfg.reload(force=True)
+                assert_true(run.called)
+            assert_equal(cfg.get('sec.sub.new'), 'val')
+        finally:
+            dl_cfg.reload(force=True)
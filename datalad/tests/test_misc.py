@@ -7,9 +7,15 @@
 #
 # ## ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ### ##
 
+import subprocess
+import sys
+import threading
+import time
+
 from packaging.version import Version
 
 import datalad
+from datalad import _LazyGlobal
 from datalad.support.network import (
     get_url_response_stamp,
     is_url_quoted,
@@ -30,3 +36,54 @@ def test_get_response_stamp():
     eq_(r['size'], 101)
     eq_(r['mtime'], 1367377320)
     eq_(r['url'], "http://www.example.com/1.dat")
+
+
+def test_lazy_global():
+    created = []
+
+    def factory():
+        # give concurrent first uses a chance to race
+        time.sleep(0.1)
+        created.append(dict(a=1))
+        return created[-1]
+
+    proxy = _LazyGlobal(factory)
+    eq_(repr(proxy), '<lazy factory()>')
+    eq_(created, [])
+    threads = [threading.Thread(target=proxy.keys) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # created once, on first use
+    eq_(len(created), 1)
+    eq_(proxy['a'], 1)
+    ok_('a' in proxy)
+    eq_(len(proxy), 1)
+    eq_(repr(proxy), repr(created[0]))
+
+    # the object must not be used while it is created
+    def recursive_factory():
+        return recursive.keys()
+    recursive = _LazyGlobal(recursive_factory)
+    with assert_raises(RuntimeError):
+        recursive.keys()
+
+
+def test_import_is_lazy():
+    # importing datalad must not run any subprocess, or load the config
+    if not hasattr(sys, 'addaudithook'):
+        raise SkipTest("Needs audit hooks (Python 3.8+)")
+    out = subprocess.run(
+        [sys.executable, '-c',
+         'import sys\n'
+         'spawned = []\n'
+         'sys.addaudithook(lambda e, a: spawned.append(e) '
+         'if e in ("subprocess.Popen", "os.posix_spawn", "os.fork", '
+         '"os.system") else None)\n'
+         'import datalad\n'
+         'print(len(spawned), repr(datalad.cfg), '
+         '"datalad.support.sshconnector" in sys.modules)'],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    eq_(out.split(), ['0', '<lazy', '_create_cfg()>', 'False'])
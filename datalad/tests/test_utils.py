@@ -11,6 +11,7 @@
 
 """
 
+import errno
 import inspect
 import logging
 import os
@@ -49,6 +50,7 @@ from datalad.utils import (
     auto_repr,
     better_wraps,
     chpwd,
+    copy_file_content,
     create_tree,
     disable_logger,
     dlabspath,
@@ -693,6 +695,51 @@ def test_make_tempfile():
             pass
 
 
+@with_tempfile(mkdir=True)
+def test_copy_file_content(path=None):
+    path = Path(path)
+    src = path / 'src'
+    src.write_bytes(b'content' * 1000)
+    how = copy_file_content(src, path / 'dst')
+    assert_in(how, ('reflink', 'copy_file_range', 'copy'))
+    eq_((path / 'dst').read_bytes(), src.read_bytes())
+    # modifying the copy leaves the source untouched, and an existing
+    # destination is overwritten
+    (path / 'dst').write_text('modified')
+    eq_(copy_file_content(src, path / 'dst'), how)
+    eq_((path / 'dst').read_bytes(), src.read_bytes())
+    # never the same file
+    with assert_raises(shutil.SameFileError):
+        copy_file_content(src, src)
+    eq_(src.read_bytes(), b'content' * 1000)
+
+    # fall back to a plain copy, if faster means are not supported
+    def unsupported(fsrc, fdst):
+        os.write(fdst, b'partial')
+        raise OSError(errno.EXDEV, 'unsupported')
+    with patch('datalad.utils._FAST_COPIES',
+               [('reflink', unsupported), ('copy_file_range', unsupported)]):
+        eq_(copy_file_content(src, path / 'dst2'), 'copy')
+    eq_((path / 'dst2').read_bytes(), src.read_bytes())
+
+    # any other error is not masked
+    def failing(fsrc, fdst):
+        raise OSError(errno.ENOSPC, 'no space')
+    with patch('datalad.utils._FAST_COPIES', [('reflink', failing)]), \
+            assert_raises(OSError):
+        copy_file_content(src, path / 'dst3')
+
+    if has_symlink_capability():
+        (path / 'link').symlink_to('src')
+        eq_(copy_file_content(path / 'link', path / 'linkcopy',
+                              follow_symlinks=False),
+            'symlink')
+        ok_((path / 'linkcopy').is_symlink())
+        copy_file_content(path / 'link', path / 'linkcontent')
+        nok_((path / 'linkcontent').is_symlink())
+        eq_((path / 'linkcontent').read_bytes(), src.read_bytes())
+
+
 def test_unique():
     eq_(unique(range(3)), [0, 1, 2])
     eq_(unique(range(3), reverse=True), [0, 1, 2])
@@ -9,6 +9,7 @@
 
 import builtins
 import collections
+import errno
 import gc
 import glob
 import gzip
@@ -600,6 +601,111 @@ def rmtemp(f, *args, **kwargs):
         lgr.info("Keeping temp file: %s", f)
 
 
+# ioctl request to share the extents of a file with another one on the same
+# filesystem (copy-on-write), e.g. on btrfs or XFS, as defined by Linux
+_FICLONE = 0x40049409
+# errors indicating that a copy strategy is not supported for a pair of files
+_COPY_UNSUPPORTED_ERRNOS = frozenset(
+    getattr(errno, e) for e in (
+        'EINVAL', 'ENOSYS', 'ENOTSUP', 'ENOTTY', 'EOPNOTSUPP', 'EXDEV')
+    if hasattr(errno, e))
+
+
+def _reflink(fsrc, fdst):
+    import fcntl
+    fcntl.ioctl(fdst, getattr(fcntl, 'FICLONE', _FICLONE), fsrc)
+
+
+def _copy_file_range(fsrc, fdst):
+    size = os.fstat(fsrc).st_size
+    # same limits as shutil's use of sendfile()
+    blocksize = min(max(size, 2 ** 23), 2 ** 30)
+    copied = 0
+    while True:
+        n = os.copy_file_range(fsrc, fdst, blocksize)
+        if not n:
+            break
+        copied += n
+    if size and not copied:
+        # some filesystems (e.g. procfs) silently report nothing to copy
+        raise OSError(errno.ENOTSUP, 'copy_file_range() copied nothing')
+
+
+# copy strategies that are cheaper than reading and writing all bytes,
+# by preference
+_FAST_COPIES = []
+if on_linux:
+    _FAST_COPIES.append(('reflink', _reflink))
+if hasattr(os, 'copy_file_range'):
+    _FAST_COPIES.append(('copy_file_range', _copy_file_range))
+
+
+def copy_file_content(src, dst, follow_symlinks=True):
+    """Copy the content of a file, using the cheapest means available
+
+    Strategies are tried in the following order, until one succeeds:
+
+    - 'reflink': the copy shares the storage of the source until either
+      of them is modified (copy-on-write, e.g. btrfs or XFS). This takes
+      no time and space, regardless of the file size.
+    - 'copy_file_range': the content is copied by the kernel, which
+      might do so without transferring it via memory (e.g. server-side
+      on NFS, or as a reflink nevertheless).
+    - 'copy': `shutil.copyfile()`, which uses platform-specific fast-copy
+      syscalls (e.g. sendfile) where it can.
+
+    Like `shutil.copyfile()`, no metadata (permissions, times) is copied,
+    and an existing `dst` is overwritten. Hardlinks are never created,
+    as modifications of the destination must not affect the source.
+
+    Parameters
+    ----------
+    src : str or Path
+    dst : str or Path
+    follow_symlinks : bool, optional
+      If False, and `src` is a symlink, a symlink is created at `dst`,
+      instead of copying the content it points to.
+
+    Returns
+    -------
+    str
+      The strategy that was used: 'reflink', 'copy_file_range', 'copy',
+      or 'symlink'.
+    """
+    src = str(src)
+    dst = str(dst)
+    if not follow_symlinks and op.islink(src):
+        os.symlink(os.readlink(src), dst)
+        how = 'symlink'
+    else:
+        how = _copy_file_content(src, dst)
+    lgr.log(5, "Copied %s to %s via %s", src, dst, how)
+    return how
+
+
+def _copy_file_content(src, dst):
+    if op.exists(dst) and op.samefile(src, dst):
+        # opening dst for writing would wipe the content
+        raise shutil.SameFileError(
+            '{!r} and {!r} are the same file'.format(src, dst))
+    if _FAST_COPIES:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            for how, copy in _FAST_COPIES:
+                try:
+                    copy(fsrc.fileno(), fdst.fileno())
+                    return how
+                except OSError as e:
+                    if e.errno not in _COPY_UNSUPPORTED_ERRNOS:
+                        raise
+                    lgr.log(5, "Cannot copy %s via %s: %s", src, how, e)
+                # discard anything that might have been copied already
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+    shutil.copyfile(src, dst)
+    return 'copy'
+
+
 def file_basename(name, return_ext=False):
     """
     Strips up to 2 extensions of length up to 4 characters and starting with alpha